@@ -0,0 +1,91 @@
+"""
+Bir evin durumunu (HouseAggregate) tam replay ile ve snapshot + sonrası eventlerle yükleme sürelerini
+karşılaştırır. Geçici bir veritabanına --events sinyal yazar, snapshot alır, --tail yeni sinyal ekler
+ve load_aggregate sürelerini ölçer. Çalışan bir MongoDB gerekir.
+
+Örnek:
+    python benchmarks/bench_aggregate_replay.py --mongo-uri mongodb://localhost:27017 --events 1000000
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ['MONGO_DB_NAME'] = 'bench_aggregate_replay'
+os.environ['AGGREGATE_VERSIONING'] = 'True'
+
+
+def signals(count, house_id):
+    from wifi_app.domain.events import WifiSignalCaptured
+
+    rooms = ["Salon", "Mutfak", "Yatak Odası"]
+    for i in range(count):
+        yield WifiSignalCaptured(
+            house_id=house_id, room=rooms[i % 3], rssi=-40 - i % 50, device_id="bench-device",
+            band="5GHz", channel=36, ssid="Wifi_Bench", link_speed_mbps=300, latency_ms=5 + i % 80,
+            packet_loss_rate=0, bssid="00:AA:BB:00:10:FF",
+        )
+
+
+def write(store, count, house_id, batch_size=5000):
+    batch = []
+    for event in signals(count, house_id):
+        batch.append(event)
+        if len(batch) >= batch_size:
+            store.append_many(batch)
+            batch = []
+    if batch:
+        store.append_many(batch)
+
+
+def timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mongo-uri', default='mongodb://localhost:27017/')
+    parser.add_argument('--events', type=int, default=200000)
+    parser.add_argument('--tail', type=int, default=500, help="Snapshot'tan sonra eklenecek sinyal sayısı")
+    args = parser.parse_args()
+    os.environ['MONGO_URI'] = args.mongo_uri
+
+    import django
+
+    django.setup()
+    from wifi_app.infrastructure.event_store import MongoEventStore
+    from wifi_app.infrastructure.mongo_client import MongoDBClient
+
+    # Projeksiyonlar ölçülen replay'in parçası değil; yazma süresini kısaltmak için kapatılır
+    MongoEventStore._subscribers = []
+    house_id = "bench_house"
+    store = MongoEventStore()
+    MongoDBClient.get_client().drop_database(store.db.name)
+    store = MongoEventStore()
+
+    _, seconds = timed(write, store, args.events, house_id)
+    print(f"{args.events} sinyal yazıldı: {seconds:.1f} s")
+
+    full, full_seconds = timed(store.load_aggregate, house_id, snapshot_every=0)
+    # İkinci adım için settle süresi beklenmez
+    store.snapshots.collection.update_one(
+        {"_id": house_id}, {"$set": {"pending_at": datetime.utcnow() - timedelta(days=1)}}
+    )
+    store.load_aggregate(house_id, snapshot_every=0)
+    write(store, args.tail, house_id)
+
+    tail, tail_seconds = timed(store.load_aggregate, house_id, snapshot_every=args.tail + 1)
+    assert tail.event_count == full.event_count + args.tail, (tail.event_count, full.event_count)
+    print(f"tam replay:        {full.event_count:>10} event oynatıldı {full_seconds * 1000:>10.1f} ms")
+    print(f"snapshot + sonrası: {args.tail:>9} event oynatıldı {tail_seconds * 1000:>10.1f} ms")
+
+    MongoDBClient.get_client().drop_database(store.db.name)
+
+
+if __name__ == '__main__':
+    main()
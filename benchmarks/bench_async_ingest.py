@@ -0,0 +1,106 @@
+"""
+Sync (WSGI) ve async (ASGI) ingest endpoint'lerini aynı yük altında karşılaştırır.
+
+Örnek:
+    # WSGI:  python manage.py runserver 0.0.0.0:8000   (veya gunicorn config.wsgi)
+    # ASGI:  uvicorn config.asgi:application --port 8001
+    python benchmarks/bench_async_ingest.py \\
+        --target sync=http://localhost:8000/api/ingest/signal/ \\
+        --target async=http://localhost:8001/api/async/ingest/signal/ \\
+        --requests 5000 --concurrency 200
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from urllib.parse import urlsplit
+
+
+def make_payload(i):
+    return {
+        "house_id": f"bench_{i % 100:03d}",
+        "room": random.choice(["Salon", "Mutfak", "Yatak Odası"]),
+        "rssi": random.randint(-90, -35),
+        "device_id": "bench-device",
+        "band": random.choice(["2.4GHz", "5GHz"]),
+        "channel": random.choice([1, 6, 11, 36, 44]),
+        "ssid": "Wifi_Bench",
+        "link_speed_mbps": random.randint(50, 866),
+        "latency_ms": random.randint(5, 120),
+        "packet_loss_rate": 0,
+        "bssid": "00:AA:BB:00:10:FF",
+    }
+
+
+async def worker(url, queue, latencies, errors):
+    """Keep-alive bağlantı üzerinden kuyruktaki istekleri sırayla gönderir."""
+    parts = urlsplit(url)
+    reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+    try:
+        while True:
+            try:
+                i = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            body = json.dumps(make_payload(i)).encode()
+            request = (
+                f"POST {parts.path} HTTP/1.1\r\n"
+                f"Host: {parts.netloc}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: keep-alive\r\n\r\n"
+            ).encode() + body
+            started = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode().partition(":")
+                if name.lower() == "content-length":
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+            if not status_line.split()[1].startswith(b"2"):
+                errors.append(status_line)
+    finally:
+        writer.close()
+
+
+async def run_target(url, total, concurrency):
+    queue = asyncio.Queue()
+    for i in range(total):
+        queue.put_nowait(i)
+    latencies, errors = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(url, queue, latencies, errors) for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "rps": len(latencies) / duration,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "errors": len(errors),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", action="append", required=True, metavar="NAME=URL")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'target':<10} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}")
+    for target in args.target:
+        name, _, url = target.partition("=")
+        result = asyncio.run(run_target(url, args.requests, args.concurrency))
+        print(f"{name:<10} {result['rps']:>10.1f} {result['p50_ms']:>10.2f} {result['p99_ms']:>10.2f} {result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+DegradationDetector'ün tek çekirdekte saniyede işlediği sinyal sayısını ölçer. Sentetik akışta her
+ev × oda × BSSID anahtarı gürültülü bir seviyede sinyal üretir; --incidents anahtarda akışın ortasında
+RSSI düşüşü, gecikme sıçraması veya paket kaybı patlaması başlatılır. Yakalanan olaylar ve olay olmayan
+anahtarlardaki yanlış alarmlar da yazdırılır.
+
+Örnek:
+    python benchmarks/bench_degradation.py --signals 1000000 --keys 5000 --target-rate 50000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from wifi_app.domain.degradation import DegradationDetector  # noqa: E402
+
+INCIDENTS = ('rssi', 'latency_ms', 'packet_loss_rate')
+
+
+def make_stream(signals, keys, incidents, seed):
+    rng = random.Random(seed)
+    base = [
+        (f"house_{k // 12:05d}", f"room_{k % 4}", f"00:AA:BB:00:{k % 12:02d}:FF",
+         rng.uniform(-75, -45), rng.uniform(10, 40), rng.uniform(1, 3))
+        for k in range(keys)
+    ]
+    incident_keys = {k: INCIDENTS[i % len(INCIDENTS)] for i, k in enumerate(rng.sample(range(keys), incidents))}
+    start = signals // 2
+    docs = []
+    for i in range(signals):
+        k = rng.randrange(keys)
+        house_id, room, bssid, rssi, latency, jitter = base[k]
+        rssi += rng.gauss(0, 2)
+        latency += rng.expovariate(1 / jitter)
+        loss = 1 if rng.random() < 0.01 else 0
+        kind = incident_keys.get(k)
+        if kind is not None and i >= start:
+            if kind == 'rssi':
+                rssi -= 25
+            elif kind == 'latency_ms':
+                latency += 150
+            else:
+                loss = rng.randint(15, 40)
+        docs.append({
+            "aggregate_id": house_id,
+            "payload": {
+                "room": room, "bssid": bssid, "rssi": int(rssi), "latency_ms": int(latency),
+                "packet_loss_rate": loss,
+            },
+        })
+    return docs, base, incident_keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--signals', type=int, default=500000)
+    parser.add_argument('--keys', type=int, default=2000)
+    parser.add_argument('--incidents', type=int, default=30)
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--target-rate', type=float, help="Karşılaştırılacak en yüksek ingest hızı (sinyal/s)")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    docs, base, incident_keys = make_stream(args.signals, args.keys, args.incidents, args.seed)
+    detector = DegradationDetector()
+
+    started = time.perf_counter()
+    events = []
+    for i in range(0, len(docs), args.batch_size):
+        batch_events, _ = detector.process(docs[i:i + args.batch_size])
+        events.extend(batch_events)
+    seconds = time.perf_counter() - started
+
+    rate = len(docs) / seconds
+    print(f"{len(docs)} sinyal, {len(detector.states)} anahtar: {seconds:.2f} s, {rate:,.0f} sinyal/s")
+    if args.target_rate:
+        print(f"hedef {args.target_rate:,.0f} sinyal/s: {'karşılanıyor' if rate >= args.target_rate else 'KARŞILANMIYOR'}")
+
+    keys = {(h, r, b): k for k, (h, r, b, *_) in enumerate(base)}
+    detected = {(keys[(e.house_id, e.room, e.bssid)], e.metric) for e in events}
+    caught = sum(1 for k, kind in incident_keys.items() if (k, kind) in detected)
+    false_alarms = sum(1 for k, _ in detected if k not in incident_keys)
+    print(f"olay: {caught}/{len(incident_keys)} yakalandı, yanlış alarm: {false_alarms} anahtar, "
+          f"toplam event: {len(events)}")
+
+
+if __name__ == '__main__':
+    main()
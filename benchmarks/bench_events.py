@@ -0,0 +1,110 @@
+"""
+Domain event'lerinin oluşturma + to_dict maliyetini ölçer ve dataclasses.asdict tabanlı eski
+serileştirme ile karşılaştırır. Eski yol aynı alanlarla yeniden tanımlanır; çıktı dokümanlarının
+şekli de karşılaştırılır.
+
+Örnek:
+    python benchmarks/bench_events.py --number 200000
+"""
+import argparse
+import os
+import sys
+import timeit
+import uuid
+from dataclasses import MISSING, asdict, dataclass, field, fields, make_dataclass
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from wifi_app.domain.events import (  # noqa: E402
+    HouseRegistered,
+    WifiSignalCaptured,
+    RoomPerformanceCalculated,
+    PerformanceRecommendationGenerated,
+)
+
+SAMPLES = {
+    HouseRegistered: dict(
+        house_id="bench_001", house_type="Apartment", owner_name="Bench",
+        area_sqm=120, rooms=["Salon", "Mutfak", "Yatak Odası"],
+    ),
+    WifiSignalCaptured: dict(
+        house_id="bench_001", room="Salon", rssi=-52, device_id="bench-device", band="5GHz",
+        channel=36, ssid="Wifi_Bench", link_speed_mbps=433, latency_ms=12, packet_loss_rate=0,
+        bssid="00:AA:BB:00:10:FF",
+    ),
+    RoomPerformanceCalculated: dict(
+        house_id="bench_001", room_name="Salon", gaming_score=80, streaming_score=90,
+        video_call_score=85, overall_rating=85, avg_signal_dbm=-52, avg_speed_mbps=433,
+        avg_latency_ms=12, packet_loss_avg=0.1,
+    ),
+    PerformanceRecommendationGenerated: dict(
+        house_id="bench_001",
+        room_recommendations={"Salon": ["Sinyal iyi."], "Mutfak": ["Mesh önerilir."]},
+        global_recommendation_text="Genel durum iyi.", global_severity="INFO",
+    ),
+}
+
+
+@dataclass
+class LegacyEvent:
+    event_id: str = field(init=False)
+    timestamp: datetime = field(init=False)
+
+    def __post_init__(self):
+        self.event_id = str(uuid.uuid4())
+        self.timestamp = datetime.utcnow()
+
+    def to_dict(self):
+        data = asdict(self)
+        payload = {k: v for k, v in data.items() if k not in ['event_id', 'timestamp']}
+        return {
+            "event_id": self.event_id,
+            "event_type": self.__class__.__name__,
+            "aggregate_id": payload.get('house_id'),
+            "timestamp": self.timestamp.isoformat(),
+            "payload": payload
+        }
+
+
+def legacy_class(cls):
+    """Aynı alanlara sahip dataclasses.asdict tabanlı eski event sınıfı."""
+    specs = []
+    for f in fields(cls):
+        if f.name in ('event_id', 'timestamp'):
+            continue
+        if f.default_factory is not MISSING:
+            specs.append((f.name, f.type, field(default_factory=f.default_factory)))
+        elif f.default is not MISSING:
+            specs.append((f.name, f.type, field(default=f.default)))
+        else:
+            specs.append((f.name, f.type))
+    return make_dataclass(cls.__name__, specs, bases=(LegacyEvent,))
+
+
+def measure(func, number, repeat=5):
+    """En iyi tekrarın event başına süresi (µs)."""
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def shape(doc):
+    return {k: v for k, v in doc.items() if k not in ('event_id', 'timestamp')}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'event':<36} {'eski µs':>10} {'yeni µs':>10} {'hızlanma':>10}")
+    for cls, kwargs in SAMPLES.items():
+        legacy = legacy_class(cls)
+        assert shape(legacy(**kwargs).to_dict()) == shape(cls(**kwargs).to_dict()), cls.__name__
+
+        old = measure(lambda: legacy(**kwargs).to_dict(), args.number)
+        new = measure(lambda: cls(**kwargs).to_dict(), args.number)
+        print(f"{cls.__name__:<36} {old:>10.2f} {new:>10.2f} {old / new:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
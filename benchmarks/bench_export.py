@@ -0,0 +1,96 @@
+"""
+/api/export/signals/ stream'ini /api/signals/ üzerinde cursor ile sayfa sayfa gezinmeyle karşılaştırır.
+Her yöntem için toplam satır, byte, süre, MB/s ve satır/s yazdırır. Sunucunun çalışıyor olması gerekir.
+
+Örnek:
+    python benchmarks/bench_export.py --base-url http://localhost:8000 --house-id house_001 \\
+        --formats ndjson csv arrow parquet
+"""
+import argparse
+import json
+import time
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+CHUNK_SIZE = 1 << 16
+
+
+def filters(args):
+    params = {}
+    for name in ('house_id', 'since', 'until'):
+        value = getattr(args, name)
+        if value:
+            params[name] = value
+    return params
+
+
+def paginated(args):
+    """/api/signals/?limit=500 ile next_cursor bitene kadar sayfa çeker."""
+    total_bytes = 0
+    rows = 0
+    cursor = None
+    while True:
+        params = {**filters(args), 'limit': 500}
+        if cursor:
+            params['cursor'] = cursor
+        with urlopen(f"{args.base_url}/api/signals/?{urlencode(params)}") as response:
+            body = response.read()
+        total_bytes += len(body)
+        page = json.loads(body)
+        rows += len(page['results'])
+        cursor = page['next_cursor']
+        if not cursor or (args.max_rows and rows >= args.max_rows):
+            return rows, total_bytes
+
+
+def export(args, export_format):
+    """Export yanıtını parça parça okur; satır sayısı sadece ndjson/csv için sayılır."""
+    params = {**filters(args), 'format': export_format}
+    if args.max_rows:
+        params['limit'] = args.max_rows
+    total_bytes = 0
+    newlines = 0
+    with urlopen(f"{args.base_url}/api/export/signals/?{urlencode(params)}") as response:
+        while True:
+            chunk = response.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            total_bytes += len(chunk)
+            newlines += chunk.count(b'\n')
+    if export_format == 'ndjson':
+        return newlines, total_bytes
+    if export_format == 'csv':
+        return newlines - 1, total_bytes
+    return None, total_bytes
+
+
+def report(name, rows, total_bytes, seconds):
+    mb = total_bytes / (1 << 20)
+    rows_text = f"{rows:>10}" if rows is not None else f"{'-':>10}"
+    rate = f"{rows / seconds:>12.0f}" if rows is not None else f"{'-':>12}"
+    print(f"{name:<16} {rows_text} {mb:>10.1f} {seconds:>9.2f} {mb / seconds:>9.1f} {rate}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://localhost:8000')
+    parser.add_argument('--house-id')
+    parser.add_argument('--since')
+    parser.add_argument('--until')
+    parser.add_argument('--max-rows', type=int, help="Her yöntemde en fazla bu kadar satır oku")
+    parser.add_argument('--formats', nargs='+', default=['ndjson', 'csv', 'arrow'])
+    args = parser.parse_args()
+
+    print(f"{'yöntem':<16} {'satır':>10} {'MB':>10} {'saniye':>9} {'MB/s':>9} {'satır/s':>12}")
+    started = time.perf_counter()
+    rows, total_bytes = paginated(args)
+    report('signals?limit=500', rows, total_bytes, time.perf_counter() - started)
+
+    for export_format in args.formats:
+        started = time.perf_counter()
+        rows, total_bytes = export(args, export_format)
+        report(f'export {export_format}', rows, total_bytes, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    main()
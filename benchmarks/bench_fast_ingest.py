@@ -0,0 +1,103 @@
+"""
+Hızlı ingest yolunu (INGEST_FAST_PATH) DRF yolu ile karşılaştırır: tekil ve toplu ingest view'larının
+istek başına CPU süresini (time.process_time) ölçer. --mongo-uri verilmezse veritabanı yazımı ölçüme dahil
+edilmez (append no-op yapılır). Derlenmiş doğrulayıcının DRF ile paritesi tests/test_fast_validation.py'dedir.
+
+Örnek:
+    python benchmarks/bench_fast_ingest.py --requests 5000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.test import RequestFactory  # noqa: E402
+from wifi_app.api import fast_views, views  # noqa: E402
+from wifi_app.api.fast_views import FastIngestWifiSignalView, FastIngestWifiSignalBatchView, orjson  # noqa: E402
+from wifi_app.api.views import IngestWifiSignalView, IngestWifiSignalBatchView  # noqa: E402
+
+
+class NullEventStore:
+    """
+    --mongo-uri verilmediğinde view'ların kullandığı store: yazma sözleşmesine uyar (append yazıldıysa True,
+    append_many yazılan dokümanları döner) ama veritabanına gitmez.
+    """
+    def append(self, event, expected_version=None):
+        return True
+
+    def append_many(self, events, expected_version=None):
+        return []
+
+
+def valid_signal():
+    return {
+        "house_id": f"house_{random.randint(1, 50):03d}",
+        "room": random.choice(["Salon", "Mutfak", "Yatak Odası"]),
+        "rssi": random.randint(-90, -35),
+        "device_id": "bench-device",
+        "band": random.choice(["2.4GHz", "5GHz"]),
+        "channel": random.choice([1, 6, 11, 36, 44]),
+        "ssid": "Wifi_Bench",
+        "link_speed_mbps": random.randint(50, 866),
+        "latency_ms": random.randint(5, 120),
+        "packet_loss_rate": random.randint(0, 5),
+        "bssid": "00:AA:BB:00:10:FF",
+    }
+
+
+def measure(view, factory, path, body, content_type, requests):
+    started = time.process_time()
+    for _ in range(requests):
+        response = view(factory.post(path, body, content_type=content_type))
+    elapsed = time.process_time() - started
+    assert response.status_code in (200, 201, 207), response.content
+    return elapsed / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=3000)
+    parser.add_argument('--batch-size', type=int, default=500)
+    parser.add_argument('--mongo-uri')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    random.seed(args.seed)
+
+    if args.mongo_uri:
+        settings.MONGO_URI = args.mongo_uri
+    else:
+        # view'lar paylaşılan store'u get_event_store() ile alır; Mongo istemcisi hiç kurulmaz
+        null_store = NullEventStore()
+        views.get_event_store = fast_views.get_event_store = lambda: null_store
+    settings.INGEST_BUFFER_ENABLED = False
+
+    factory = RequestFactory()
+    single = json.dumps(valid_signal())
+    batch = json.dumps([valid_signal() for _ in range(args.batch_size)])
+    batch_requests = max(1, args.requests // args.batch_size * 10)
+
+    print(f"JSON: {'orjson' if orjson is not None else 'json'}")
+    print(f"{'endpoint':<28} {'DRF µs/istek':>14} {'hızlı µs/istek':>16} {'hızlanma':>10}")
+    rows = [
+        ("ingest/signal/", IngestWifiSignalView, FastIngestWifiSignalView, single, args.requests),
+        (f"ingest/signals/batch/ x{args.batch_size}", IngestWifiSignalBatchView, FastIngestWifiSignalBatchView,
+         batch, batch_requests),
+    ]
+    for name, drf_view, fast_view, body, requests in rows:
+        drf = measure(drf_view.as_view(), factory, '/api/ingest/', body, 'application/json', requests)
+        fast = measure(fast_view.as_view(), factory, '/api/ingest/', body, 'application/json', requests)
+        print(f"{name:<28} {drf:>14.1f} {fast:>16.1f} {drf / fast:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
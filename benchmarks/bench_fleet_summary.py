@@ -0,0 +1,94 @@
+"""
+/api/fleet/summary/'nin okuduğu get_fleet_summary süresini ölçer. Geçici bir veritabanına --houses ev için
+HouseRegistered, oda başına RoomPerformanceCalculated ve ev başına PerformanceRecommendationGenerated yazar
+(fleet projeksiyonu sayaçları yazma sırasında günceller), ardından özeti --requests kez okuyup p50/p99
+sürelerini yazdırır. Çalışan bir MongoDB gerekir.
+
+Örnek:
+    python benchmarks/bench_fleet_summary.py --mongo-uri mongodb://localhost:27017 --houses 50000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ['MONGO_DB_NAME'] = 'bench_fleet_summary'
+
+HOUSE_TYPES = ("Daire", "Müstakil", "Villa", "Stüdyo")
+ROOMS = ("Salon", "Mutfak", "Yatak Odası", "Çocuk Odası", "Çalışma Odası")
+SEVERITIES = ("OK", "WARNING", "CRITICAL")
+
+
+def events(houses, rng):
+    from wifi_app.domain.events import (
+        HouseRegistered, RoomPerformanceCalculated, PerformanceRecommendationGenerated
+    )
+
+    for h in range(houses):
+        house_id = f"bench_{h:06d}"
+        yield HouseRegistered(
+            house_id=house_id, house_type=rng.choice(HOUSE_TYPES), owner_name="bench", area_sqm=rng.randint(40, 300)
+        )
+        for room in ROOMS[:rng.randint(2, len(ROOMS))]:
+            yield RoomPerformanceCalculated(
+                house_id=house_id, room_name=room,
+                gaming_score=rng.randint(0, 100), streaming_score=rng.randint(0, 100),
+                video_call_score=rng.randint(0, 100), overall_rating=rng.randint(0, 100),
+                avg_signal_dbm=rng.randint(-90, -35), avg_speed_mbps=rng.randint(10, 800),
+                avg_latency_ms=rng.randint(5, 150), packet_loss_avg=round(rng.random() * 5, 2),
+            )
+        yield PerformanceRecommendationGenerated(
+            house_id=house_id, room_recommendations={}, global_recommendation_text="bench",
+            global_severity=rng.choice(SEVERITIES),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mongo-uri', default='mongodb://localhost:27017/')
+    parser.add_argument('--houses', type=int, default=50000)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--worst', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+    os.environ['MONGO_URI'] = args.mongo_uri
+
+    import django
+
+    django.setup()
+    from wifi_app.infrastructure.event_store import MongoEventStore
+    from wifi_app.infrastructure.mongo_client import MongoDBClient
+
+    MongoDBClient.get_client().drop_database('bench_fleet_summary')
+    store = MongoEventStore()
+
+    started = time.perf_counter()
+    batch = []
+    for event in events(args.houses, random.Random(args.seed)):
+        batch.append(event)
+        if len(batch) >= 5000:
+            store.append_many(batch)
+            batch = []
+    if batch:
+        store.append_many(batch)
+    print(f"{args.houses} ev yazıldı: {time.perf_counter() - started:.1f} s")
+
+    durations = []
+    for _ in range(args.requests):
+        started = time.perf_counter()
+        summary = store.get_fleet_summary(args.worst)
+        durations.append((time.perf_counter() - started) * 1000)
+    durations.sort()
+    assert summary['houses'] == args.houses, summary['houses']
+    print(f"get_fleet_summary: {summary['houses']} ev, {summary['rooms']} oda, önem dereceleri {summary['severity']}")
+    print(f"  p50 {statistics.median(durations):.2f} ms  p99 {durations[int(len(durations) * 0.99) - 1]:.2f} ms")
+
+    MongoDBClient.get_client().drop_database('bench_fleet_summary')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Ev sayfası yüklemesini iki şekilde ölçer: eski istemci fan-out'u (metrics, recommendations ve son sinyaller için
+3 paralel istek; sayfa süresi en yavaş isteğin süresi) ve tek /api/houses/<id>/dashboard/ isteği. Geçici bir
+veritabanına --houses ev için kayıt, sinyal, oda metriği ve öneri yazar; view'ları RequestFactory ile çağırır
+(DRF render dahil) ve sayfa başına istek sayısı ile p50/p99 sayfa sürelerini yazdırır. Yanıt önbelleği
+varsayılan olarak kapalıdır; --cache ile dashboard önbellekli de ölçülür. Çalışan bir MongoDB gerekir.
+
+Örnek:
+    python benchmarks/bench_house_dashboard.py --mongo-uri mongodb://localhost:27017 --houses 200 --pages 500
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ['MONGO_DB_NAME'] = 'bench_house_dashboard'
+os.environ['HOUSE_CACHE_ENABLED'] = 'False'
+
+ROOMS = ("Salon", "Mutfak", "Yatak Odası", "Çalışma Odası")
+
+
+def events(houses, signals, rng):
+    from wifi_app.domain.events import (
+        HouseRegistered, WifiSignalCaptured, RoomPerformanceCalculated, PerformanceRecommendationGenerated
+    )
+
+    for h in range(houses):
+        house_id = f"bench_{h:04d}"
+        yield HouseRegistered(house_id=house_id, house_type="Daire", owner_name="bench", area_sqm=90, rooms=list(ROOMS))
+        for _ in range(signals):
+            yield WifiSignalCaptured(
+                house_id=house_id, room=rng.choice(ROOMS), rssi=rng.randint(-90, -35), device_id="bench-device",
+                band=rng.choice(["2.4GHz", "5GHz"]), channel=36, ssid="Wifi_Bench",
+                link_speed_mbps=rng.randint(50, 866), latency_ms=rng.randint(2, 150),
+                packet_loss_rate=round(rng.random() * 0.05, 4), bssid="00:AA:BB:00:10:FF",
+            )
+        for room in ROOMS:
+            yield RoomPerformanceCalculated(
+                house_id=house_id, room_name=room, gaming_score=rng.randint(0, 100),
+                streaming_score=rng.randint(0, 100), video_call_score=rng.randint(0, 100),
+                overall_rating=rng.randint(0, 100), avg_signal_dbm=rng.randint(-90, -35),
+                avg_speed_mbps=rng.randint(10, 800), avg_latency_ms=rng.randint(5, 150), packet_loss_avg=0.5,
+            )
+        yield PerformanceRecommendationGenerated(
+            house_id=house_id, room_recommendations={}, global_recommendation_text="bench", global_severity="OK"
+        )
+
+
+def report(name, durations, requests):
+    durations.sort()
+    p99 = durations[max(0, int(len(durations) * 0.99) - 1)]
+    print(f"{name:18s} sayfa başına {requests} istek  p50 {statistics.median(durations):7.2f} ms  p99 {p99:7.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mongo-uri', default='mongodb://localhost:27017/')
+    parser.add_argument('--houses', type=int, default=200)
+    parser.add_argument('--signals', type=int, default=500, help="ev başına sinyal")
+    parser.add_argument('--pages', type=int, default=500)
+    parser.add_argument('--cache', action='store_true', help="önbellekli dashboard'u da ölç")
+    parser.add_argument('--seed', type=int, default=5)
+    args = parser.parse_args()
+    os.environ['MONGO_URI'] = args.mongo_uri
+
+    import django
+
+    django.setup()
+    from django.conf import settings
+    from django.test import RequestFactory
+    from wifi_app.api.views import (
+        HouseRoomMetricsView, HouseRecommendationsView, HouseDashboardView, WifiSignalListView
+    )
+    from wifi_app.infrastructure.event_store import get_event_store
+    from wifi_app.infrastructure.mongo_client import MongoDBClient
+
+    MongoDBClient.get_client().drop_database('bench_house_dashboard')
+    store = get_event_store()
+    rng = random.Random(args.seed)
+    batch = []
+    for event in events(args.houses, args.signals, rng):
+        batch.append(event)
+        if len(batch) >= 5000:
+            store.append_many(batch)
+            batch = []
+    if batch:
+        store.append_many(batch)
+    print(f"{args.houses} ev, ev başına {args.signals} sinyal yazıldı")
+
+    factory = RequestFactory()
+    metrics_view = HouseRoomMetricsView.as_view()
+    recommendations_view = HouseRecommendationsView.as_view()
+    signals_view = WifiSignalListView.as_view()
+    dashboard_view = HouseDashboardView.as_view()
+
+    def call(view, path, **kwargs):
+        response = view(factory.get(path), **kwargs)
+        response.render()
+        return response
+
+    def fanout(house_id):
+        calls = (
+            (metrics_view, f"/api/houses/{house_id}/metrics/", {"house_id": house_id}),
+            (recommendations_view, f"/api/houses/{house_id}/recommendations/", {"house_id": house_id}),
+            (signals_view, f"/api/signals/?house_id={house_id}&limit={settings.HOUSE_DASHBOARD_SIGNALS}", {}),
+        )
+        list(pool.map(lambda c: call(c[0], c[1], **c[2]), calls))
+
+    def dashboard(house_id):
+        call(dashboard_view, f"/api/houses/{house_id}/dashboard/", house_id=house_id)
+
+    houses = [f"bench_{rng.randrange(args.houses):04d}" for _ in range(args.pages)]
+    phases = [("fan-out", fanout, 3), ("dashboard", dashboard, 1)]
+    if args.cache:
+        phases.append(("dashboard (cache)", dashboard, 1))
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        for name, load, requests in phases:
+            settings.HOUSE_CACHE_ENABLED = name.endswith("(cache)")
+            durations = []
+            for house_id in houses:
+                started = time.perf_counter()
+                load(house_id)
+                durations.append((time.perf_counter() - started) * 1000)
+            report(name, durations, requests)
+
+    MongoDBClient.get_client().drop_database('bench_house_dashboard')
+
+
+if __name__ == '__main__':
+    main()
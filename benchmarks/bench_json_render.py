@@ -0,0 +1,113 @@
+"""
+Büyük liste yanıtlarının (/api/signals/?limit=500 ve /api/houses/) yazılma maliyetini ölçer: DRF'nin
+JSONRenderer'ı (eski varsayılan), ORJSONRenderer ve ?format=columnar (ColumnarJSONRenderer) için sayfa başına
+render süresi (p50/p99) ve yanıt boyutu; her gövde için ayrıca gzip (RESPONSE_GZIP_LEVEL) ve brotli
+(RESPONSE_BROTLI_QUALITY, brotli paketi kuruluysa) ile sıkıştırılmış boyut ve sıkıştırma süresi yazdırılır.
+Satırlar find_signals'ın döndüğü düz sinyal formatında üretilir; MongoDB gerekmez.
+
+Örnek:
+    python benchmarks/bench_json_render.py --rows 500 --houses 2000 --iterations 500
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+ROOMS = ("Salon", "Mutfak", "Yatak Odası", "Çalışma Odası")
+
+
+def signal_page(rows, rng):
+    from bson import ObjectId
+
+    started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    results = []
+    for i in range(rows):
+        results.append({
+            "mongo_id": str(ObjectId()),
+            "event_id": str(uuid.UUID(int=rng.getrandbits(128))),
+            "timestamp": (started + timedelta(seconds=i * 5)).isoformat(),
+            "house_id": "bench_0001",
+            "room": rng.choice(ROOMS),
+            "rssi": rng.randint(-90, -35),
+            "ssid": "Wifi_Bench",
+            "band": rng.choice(["2.4GHz", "5GHz"]),
+            "device_id": "bench-device",
+            "link_speed_mbps": rng.randint(50, 866),
+            "latency_ms": rng.randint(2, 150),
+            "packet_loss_rate": round(rng.random() * 0.05, 4),
+            "bssid": "00:AA:BB:00:10:FF",
+        })
+    return {"results": results, "next_cursor": results[-1]["mongo_id"]}
+
+
+def house_dropdown(houses, rng):
+    from wifi_app.api.views import HouseListView
+
+    return HouseListView.build_dropdown(
+        {"house_id": f"bench_{h:04d}", "owner_name": f"Sahip {h}", "house_type": rng.choice(["Daire", "Villa"])}
+        for h in range(houses)
+    )
+
+
+def timed(func, iterations):
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = func()
+        durations.append((time.perf_counter() - started) * 1000)
+    durations.sort()
+    return result, statistics.median(durations), durations[max(0, int(len(durations) * 0.99) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500, help="sinyal sayfası satır sayısı")
+    parser.add_argument('--houses', type=int, default=2000, help="ev listesi uzunluğu")
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=11)
+    args = parser.parse_args()
+
+    import django
+
+    django.setup()
+    from rest_framework.renderers import JSONRenderer
+    from wifi_app.api.middleware import available_encodings
+    from wifi_app.api.renderers import ColumnarJSONRenderer, ORJSONRenderer, orjson
+
+    if orjson is None:
+        print("uyarı: orjson kurulu değil, ORJSONRenderer DRF JSONRenderer'a düşüyor")
+    rng = random.Random(args.seed)
+    payloads = [
+        (f"signals x{args.rows}", signal_page(args.rows, rng), True),
+        (f"houses x{args.houses}", house_dropdown(args.houses, rng), False),
+    ]
+    encodings = available_encodings()
+
+    for name, data, supports_columnar in payloads:
+        print(f"\n{name}")
+        renderers = [("drf json", JSONRenderer()), ("orjson", ORJSONRenderer())]
+        if supports_columnar:
+            renderers.append(("columnar", ColumnarJSONRenderer()))
+        baseline = None
+        for label, renderer in renderers:
+            body, p50, p99 = timed(lambda: renderer.render(data), args.iterations)
+            baseline = baseline or (len(body), p50)
+            print(
+                f"  {label:10s} {len(body):9d} B ({len(body) / baseline[0]:5.2f}x)  "
+                f"render p50 {p50:7.3f} ms  p99 {p99:7.3f} ms  ({baseline[1] / p50:5.1f}x hız)"
+            )
+            for encoding, compress in encodings.items():
+                compressed, c50, _ = timed(lambda: compress(body), max(1, args.iterations // 5))
+                print(f"    + {encoding:5s}  {len(compressed):9d} B ({len(compressed) / baseline[0]:5.2f}x)  "
+                      f"sıkıştırma p50 {c50:7.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
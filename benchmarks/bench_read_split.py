@@ -0,0 +1,158 @@
+"""
+Dashboard okuma patlamalarının ingest gecikmesine etkisini ölçer (okuma/yazma ayrımı). Geçici bir veritabanına
+--preload sinyal yazdıktan sonra üç aşama çalıştırır; her aşamada --writers thread tekil sinyal yazar
+(MongoEventStore.append, projeksiyonlar dahil) ve yazma gecikmesinin p50/p99'u yazdırılır:
+
+1. idle: sadece yazma
+2. primary: yazma + --readers process'te dashboard okumaları (MONGO_READ_ROUTES boş, okumalar primary'de)
+3. routed: yazma + aynı okumalar --read-routes ile (ör. secondary'ler)
+
+Okuyucular ayrı process'lerdir (fork); böylece ölçüm GIL çekişmesini değil sunucu yükünü yansıtır.
+En az bir secondary'si olan bir replica set gerekir; tek node'lu replica set'te secondaryPreferred okumalar
+yine primary'ye düşer (README: Read/Write Split).
+
+Örnek:
+    python benchmarks/bench_read_split.py --mongo-uri "mongodb://localhost:27017,localhost:27018/?replicaSet=rs0" \\
+        --read-routes "*=secondaryPreferred:90" --seconds 20
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+os.environ['MONGO_DB_NAME'] = 'bench_read_split'
+
+ROOMS = ("Salon", "Mutfak", "Yatak Odası")
+
+
+def signal(house_id, rng):
+    from wifi_app.domain.events import WifiSignalCaptured
+
+    return WifiSignalCaptured(
+        house_id=house_id, room=rng.choice(ROOMS), rssi=rng.randint(-90, -35), device_id="bench-device",
+        band=rng.choice(["2.4GHz", "5GHz"]), channel=rng.choice([1, 6, 11, 36, 44]), ssid="Wifi_Bench",
+        link_speed_mbps=rng.randint(50, 866), latency_ms=rng.randint(2, 150),
+        packet_loss_rate=round(rng.random() * 0.05, 4), bssid="00:AA:BB:00:10:FF",
+    )
+
+
+def reader(read_routes, houses, stop, counter):
+    # Fork sonrası çocuk process kendi Mongo istemcisini açar (MongoDBClient fork hook'u)
+    from django.conf import settings
+    from wifi_app.infrastructure.event_store import get_event_store
+
+    settings.MONGO_READ_ROUTES = read_routes
+    store = get_event_store()
+    rng = random.Random(os.getpid())
+    reads = 0
+    while not stop.is_set():
+        house_id = f"bench_{rng.randrange(houses):03d}"
+        store.get_recent_signals(limit=500, house_id=house_id)
+        store.find_signals(house_id=house_id, limit=500)
+        store.get_house_room_metrics(house_id)
+        reads += 3
+    with counter.get_lock():
+        counter.value += reads
+
+
+def writer(store, houses, deadline, latencies, seed):
+    rng = random.Random(seed)
+    while time.perf_counter() < deadline:
+        event = signal(f"bench_{rng.randrange(houses):03d}", rng)
+        started = time.perf_counter()
+        store.append(event)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+def run_phase(name, args, read_routes=None):
+    from wifi_app.infrastructure.event_store import get_event_store
+
+    context = multiprocessing.get_context('fork')
+    stop = context.Event()
+    counter = context.Value('q', 0)
+    readers = []
+    if read_routes is not None:
+        readers = [
+            context.Process(target=reader, args=(read_routes, args.houses, stop, counter))
+            for _ in range(args.readers)
+        ]
+        for process in readers:
+            process.start()
+        time.sleep(1)
+
+    store = get_event_store()
+    latencies = []
+    deadline = time.perf_counter() + args.seconds
+    threads = [
+        threading.Thread(target=writer, args=(store, args.houses, deadline, latencies, args.seed + i))
+        for i in range(args.writers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stop.set()
+    for process in readers:
+        process.join()
+
+    latencies.sort()
+    p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)]
+    print(
+        f"{name:8s} yazma {len(latencies) / args.seconds:8.0f}/s  p50 {statistics.median(latencies):7.2f} ms  "
+        f"p99 {p99:7.2f} ms  max {latencies[-1]:7.2f} ms  okuma {counter.value / args.seconds:8.0f}/s"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--mongo-uri', default='mongodb://localhost:27017/')
+    parser.add_argument('--read-routes', default='*=secondaryPreferred:90')
+    parser.add_argument('--houses', type=int, default=50)
+    parser.add_argument('--preload', type=int, default=200000)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--seconds', type=float, default=20)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    os.environ['MONGO_URI'] = args.mongo_uri
+
+    import django
+
+    django.setup()
+    from wifi_app.infrastructure.event_store import get_event_store
+    from wifi_app.infrastructure.mongo_client import MongoDBClient
+    from wifi_app.infrastructure.read_routing import parse_read_routes
+
+    parse_read_routes(args.read_routes)
+    client = MongoDBClient.get_client()
+    client.drop_database('bench_read_split')
+    store = get_event_store()
+
+    rng = random.Random(args.seed)
+    batch = []
+    for i in range(args.preload):
+        batch.append(signal(f"bench_{i % args.houses:03d}", rng))
+        if len(batch) >= 5000:
+            store.append_many(batch)
+            batch = []
+    if batch:
+        store.append_many(batch)
+    print(f"{args.preload} sinyal yazıldı; {args.writers} yazıcı, {args.readers} okuyucu, aşama başına {args.seconds:.0f} s")
+
+    run_phase('idle', args)
+    run_phase('primary', args, read_routes='')
+    run_phase('routed', args, read_routes=args.read_routes)
+    print(f"havuz: {MongoDBClient._pool_metrics.snapshot()}")
+
+    client.drop_database('bench_read_split')
+
+
+if __name__ == '__main__':
+    main()
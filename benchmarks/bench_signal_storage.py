@@ -0,0 +1,133 @@
+"""
+Sinyal saklama formatlarını (document / compact / bucketed) okuma başına BSON boyutu ve
+encode/decode hızı açısından karşılaştırır. encode, formata dönüştürme ve sürücünün yazarken yaptığı
+BSON serileştirmesini; decode, BSON'dan okuma ve düz sinyal dokümanına çevirmeyi kapsar. --mongo-uri verilirse her format için geçici bir
+veritabanına yazma hızı ve collStats (storageSize, indexSize) de ölçülür.
+
+Örnek:
+    python benchmarks/bench_signal_storage.py --readings 100000
+    python benchmarks/bench_signal_storage.py --mongo-uri mongodb://localhost:27017
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+import bson  # noqa: E402
+from bson import ObjectId  # noqa: E402
+from wifi_app.domain.events import WifiSignalCaptured  # noqa: E402
+from wifi_app.infrastructure.signal_buckets import BucketedSignalStore  # noqa: E402
+from wifi_app.infrastructure.signal_codec import encode_compact, decode_signal, unpack_bucket  # noqa: E402
+
+FORMATS = ('document', 'compact', 'bucketed')
+
+
+def make_docs(count, houses):
+    started = datetime.utcnow() - timedelta(seconds=count)
+    docs = []
+    for i in range(count):
+        event = WifiSignalCaptured(
+            house_id=f"bench_{i % houses:03d}",
+            room=random.choice(["Salon", "Mutfak", "Yatak Odası"]),
+            rssi=random.randint(-90, -35),
+            device_id="bench-device",
+            band=random.choice(["2.4GHz", "5GHz"]),
+            channel=random.choice([1, 6, 11, 36, 44]),
+            ssid="Wifi_Bench",
+            link_speed_mbps=random.randint(50, 866),
+            latency_ms=random.randint(5, 120),
+            packet_loss_rate=0,
+            bssid="00:AA:BB:00:10:FF",
+        )
+        event.timestamp = started + timedelta(seconds=i)
+        doc = event.to_dict()
+        doc['_id'] = ObjectId()
+        docs.append(doc)
+    return docs
+
+
+class FakeDB(dict):
+    def __missing__(self, name):
+        return None
+
+
+def encode(fmt, docs, buckets):
+    if fmt == 'document':
+        return docs
+    if fmt == 'compact':
+        return [encode_compact(doc) for doc in docs]
+    return buckets.build_documents(docs)
+
+
+def decode(fmt, stored):
+    if fmt == 'bucketed':
+        return [doc for bucket in stored for doc in unpack_bucket(bucket)]
+    return [decode_signal(doc) for doc in stored]
+
+
+def measure(fmt, docs, buckets):
+    started = time.perf_counter()
+    stored = encode(fmt, docs, buckets)
+    raw = [bson.encode(doc) for doc in stored]
+    encode_seconds = time.perf_counter() - started
+
+    size = sum(len(data) for data in raw)
+
+    started = time.perf_counter()
+    decoded = decode(fmt, [bson.decode(data) for data in raw])
+    decode_seconds = time.perf_counter() - started
+    assert len(decoded) == len(docs)
+    return stored, size, encode_seconds, decode_seconds
+
+
+def mongo_stats(uri, fmt, stored):
+    from pymongo import MongoClient
+
+    client = MongoClient(uri)
+    db_name = f"bench_signal_storage_{fmt}"
+    client.drop_database(db_name)
+    collection = client[db_name]['signals']
+    started = time.perf_counter()
+    for i in range(0, len(stored), 1000):
+        collection.insert_many(stored[i:i + 1000], ordered=False)
+    insert_seconds = time.perf_counter() - started
+    stats = client[db_name].command('collStats', 'signals')
+    client.drop_database(db_name)
+    return insert_seconds, stats.get('storageSize', 0), stats.get('totalIndexSize', 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--readings', type=int, default=50000)
+    parser.add_argument('--houses', type=int, default=20)
+    parser.add_argument('--mongo-uri')
+    args = parser.parse_args()
+
+    docs = make_docs(args.readings, args.houses)
+    buckets = BucketedSignalStore(FakeDB())
+
+    print(f"{'format':<10} {'bytes/okuma':>12} {'encode/s':>12} {'decode/s':>12}", end='')
+    print(f" {'insert/s':>12} {'storage':>12} {'index':>12}" if args.mongo_uri else '')
+    for fmt in FORMATS:
+        stored, size, encode_seconds, decode_seconds = measure(fmt, [dict(d) for d in docs], buckets)
+        line = (
+            f"{fmt:<10} {size / len(docs):>12.1f} "
+            f"{len(docs) / max(encode_seconds, 1e-9):>12.0f} {len(docs) / max(decode_seconds, 1e-9):>12.0f}"
+        )
+        if args.mongo_uri:
+            insert_seconds, storage, index = mongo_stats(args.mongo_uri, fmt, stored)
+            line += f" {len(docs) / insert_seconds:>12.0f} {storage:>12} {index:>12}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Rollup'larda tutulan DDSketch yüzdeliklerinin doğruluğunu ve birleştirme hızını ölçer. Sentetik gecikme
+(log-normal, uzun kuyruklu) ve RSSI değerleri --buckets kadar bucket sketch'ine dağıtılır; tüm bucket'lar
+birleştirilerek (filo geneli görünüm) p50/p90/p99 kesin yüzdeliklerle karşılaştırılır. Bucket başına
+ortalama BSON boyutu ve birleştirme süresi de yazdırılır.
+
+Örnek:
+    python benchmarks/bench_sketches.py --values 2000000 --buckets 50000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import bson
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from wifi_app.domain.sketches import DDSketch  # noqa: E402
+
+QUANTILES = {'p50': 0.5, 'p90': 0.9, 'p99': 0.99}
+
+
+def make_values(metric, count, rng):
+    if metric == 'latency_ms':
+        return [int(rng.lognormvariate(3, 0.9)) + 1 for _ in range(count)]
+    return [int(rng.gauss(-62, 9)) for _ in range(count)]
+
+
+def build_buckets(values, buckets, rng):
+    sketches = [DDSketch() for _ in range(buckets)]
+    for value in values:
+        sketches[rng.randrange(buckets)].add(value)
+    return [sketch.to_doc() for sketch in sketches]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--values', type=int, default=1000000)
+    parser.add_argument('--buckets', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for metric in ('latency_ms', 'rssi'):
+        values = make_values(metric, args.values, rng)
+        docs = build_buckets(values, args.buckets, rng)
+        size = sum(len(bson.encode({"sketch": doc})) for doc in docs) / len(docs)
+
+        started = time.perf_counter()
+        merged = DDSketch()
+        for doc in docs:
+            merged.merge(doc)
+        merge_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        approx = dict(zip(QUANTILES, merged.quantiles(QUANTILES.values())))
+        query_seconds = time.perf_counter() - started
+        exact = dict(zip(QUANTILES, np.quantile(values, list(QUANTILES.values()), method='lower')))
+
+        print(f"{metric}: {args.values} değer, {args.buckets} bucket, bucket başına {size:.0f} bayt, "
+              f"toplam {len(merged.bins)} bin")
+        print(f"  birleştirme {merge_seconds * 1000:.1f} ms ({args.buckets / merge_seconds:,.0f} bucket/s), "
+              f"yüzdelik {query_seconds * 1000:.2f} ms")
+        for name in QUANTILES:
+            error = abs(approx[name] - exact[name]) / max(abs(exact[name]), 1e-9)
+            print(f"  {name}: kesin {exact[name]:.2f}  sketch {approx[name]:.2f}  bağıl hata {error:.2%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,13 @@ import random
 from datetime import datetime, timedelta
 import time
 import concurrent.futures
+import uuid
 
 # --- API AYARLARI ---
 BASE_URL = "http://localhost:8000/api"
 REGISTER_URL = f"{BASE_URL}/register/house/"
 INGEST_SIGNAL_URL = f"{BASE_URL}/ingest/signal/"
+INGEST_SIGNAL_BATCH_URL = f"{BASE_URL}/ingest/signals/batch/"
 INGEST_METRICS_URL = f"{BASE_URL}/ingest/metrics/"
 INGEST_REC_URL = f"{BASE_URL}/ingest/recommendations/"
 
@@ -15,6 +17,11 @@ INGEST_REC_URL = f"{BASE_URL}/ingest/recommendations/"
 TOTAL_HOUSES = 30        # Üretilecek ev sayısı
 SIGNALS_PER_HOUSE = 200  # Her ev için üretilecek sinyal sayısı
 MAX_WORKERS = 10         # Paralel işlem sayısı
+INGEST_MODE = "single"   # "single": her sinyal ayrı istek, "batch": toplu gönderim
+BATCH_SIZE = 500         # Batch modunda tek istekte gönderilecek sinyal sayısı
+ANALYSIS_MODE = "client" # "client": skor/öneriler burada hesaplanıp gönderilir, "server": `manage.py analyze_signals`
+SEND_RETRIES = 3         # Zaman aşımı / 5xx durumunda tekrar deneme (reading_id sayesinde tekrarlar bir kez yazılır)
+RUN_ID = uuid.uuid4().hex[:8]  # reading_id öneki; script her çalıştığında yeni okumalar üretir
 
 # --- VERİ HAVUZU ---
 NAMES = ["Ahmet", "Mehmet", "Ayşe", "Fatma", "Ali", "Veli", "Zeynep", "Elif", "Can", "Cem", "Hakan", "Buse", "Selin", "Deniz", "Ece"]
@@ -106,7 +113,28 @@ def get_recommendation(room_name, rssi, house_type):
         
     return {"action": "OPTIMIZE", "text": "Kanal çakışması olabilir, modem ayarlarını kontrol edin.", "severity": "INFO"}
 
-def process_house(house_template, index):
+def post_with_retry(session, url, payload):
+    """Sinyali gönderir; bağlantı hatası, zaman aşımı veya 5xx yanıtında tekrar dener"""
+    for attempt in range(SEND_RETRIES + 1):
+        try:
+            response = session.post(url, json=payload, timeout=10)
+            if response.status_code < 500:
+                return response
+        except requests.RequestException:
+            pass
+        if attempt < SEND_RETRIES:
+            time.sleep(0.2 * 2 ** attempt)
+    return None
+
+def send_signal_batch(session, batch):
+    """Biriken sinyalleri toplu ingest endpoint'ine gönderir"""
+    if not batch:
+        return
+    if post_with_retry(session, INGEST_SIGNAL_BATCH_URL, list(batch)) is None:
+        print(f"⚠️ {batch[0]['house_id']}: {len(batch)} sinyallik batch {SEND_RETRIES + 1} denemede gönderilemedi")
+    batch.clear()
+
+def process_house(house_template, index, ingest_mode=INGEST_MODE, analysis_mode=ANALYSIS_MODE):
     """Tek bir ev için TÜM süreçleri (Kayıt -> Sinyal -> Analiz -> Öneri) yönetir"""
     
     # 1. EV OLUŞTURMA
@@ -127,9 +155,10 @@ def process_house(house_template, index):
     session = requests.Session()
     
     room_stats = {} # Analiz için verileri toplayacağız
+    pending_batch = [] # Batch modunda gönderilmeyi bekleyen sinyaller
 
     # 2. SİNYAL ÜRETİMİ (Simülasyon)
-    for _ in range(SIGNALS_PER_HOUSE):
+    for reading_no in range(SIGNALS_PER_HOUSE):
         room_name = random.choice(list(house_template["rooms"].keys()))
         base_rssi = house_template["rooms"][room_name]
         
@@ -152,12 +181,17 @@ def process_house(house_template, index):
             "link_speed_mbps": speed,
             "latency_ms": lat,
             "packet_loss_rate": loss,
-            "bssid": random.choice(aps)
+            "bssid": random.choice(aps),
+            # Tekrar denenen gönderimler aynı okuma id'siyle gelir, sunucu bir kez yazar
+            "reading_id": f"{RUN_ID}-{reading_no:06d}"
         }
         
-        try:
-            session.post(INGEST_SIGNAL_URL, json=payload)
-        except: pass
+        if ingest_mode == "batch":
+            pending_batch.append(payload)
+            if len(pending_batch) >= BATCH_SIZE:
+                send_signal_batch(session, pending_batch)
+        else:
+            post_with_retry(session, INGEST_SIGNAL_URL, payload)
 
         # İstatistik toplama (Analiz aşaması için)
         if room_name not in room_stats:
@@ -168,6 +202,13 @@ def process_house(house_template, index):
         room_stats[room_name]["loss"].append(loss)
         room_stats[room_name]["speed"].append(speed)
 
+    send_signal_batch(session, pending_batch)
+
+    if analysis_mode == "server":
+        # Skorlar ve öneriler sunucu tarafındaki analiz motoru tarafından üretilir
+        print(f"✅ {house_id} tamamlandı: Kayıt + Sinyal")
+        return
+
     # 3. ANALİZ & KARNE OLUŞTURMA
     room_recommendations_dict = {} # Genel öneri event'i için topla
     
@@ -246,6 +287,8 @@ def main():
 
     duration = time.time() - start_time
     print(f"\n🏁 BİTTİ! Toplam Süre: {duration:.2f} saniye")
+    if ANALYSIS_MODE == "server":
+        print("ℹ️  Analiz için: python manage.py analyze_signals")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
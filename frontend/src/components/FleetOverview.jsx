@@ -0,0 +1,93 @@
+import { Card, Grid, Group, Title, Badge, Table, Text } from '@mantine/core';
+import { Home, AlertTriangle, Gauge } from 'lucide-react';
+import StatCard from './StatCard';
+
+const SEVERITY_COLORS = { CRITICAL: 'red', WARNING: 'orange' };
+
+// Ev seçilmediğinde /api/fleet/summary/ çıktısını gösterir
+const FleetOverview = ({ summary }) => {
+  if (!summary) return null;
+
+  const critical = summary.severity.CRITICAL || 0;
+  const ratedRooms = summary.house_types.reduce((acc, t) => acc + (t.overall_rating !== null ? t.rooms : 0), 0);
+  const avgRating = ratedRooms > 0
+    ? Math.round(summary.house_types.reduce((acc, t) => acc + (t.overall_rating || 0) * t.rooms, 0) / ratedRooms)
+    : 0;
+
+  return (
+    <Grid gutter="lg" mb="lg">
+      <Grid.Col span={{ base: 12, md: 4 }}>
+        <StatCard title="Toplam Ev" value={summary.houses} unit="ev" subtext={`(${summary.rooms} oda)`} icon={Home} color="blue" />
+      </Grid.Col>
+      <Grid.Col span={{ base: 12, md: 4 }}>
+        <StatCard title="Kritik Evler" value={critical} unit="ev" subtext="(son öneri raporu)" icon={AlertTriangle} color={critical > 0 ? "red" : "green"} />
+      </Grid.Col>
+      <Grid.Col span={{ base: 12, md: 4 }}>
+        <StatCard title="Ortalama Oda Skoru" value={avgRating} unit="/ 100" subtext="(overall)" icon={Gauge} color="teal" />
+      </Grid.Col>
+
+      <Grid.Col span={{ base: 12, lg: 6 }}>
+        <Card shadow="sm" padding="lg" radius="md" withBorder className="h-full">
+          <Group justify="space-between" mb="md">
+            <Title order={5}>Ev Tiplerine Göre</Title>
+            <Group gap="xs">
+              {Object.entries(summary.severity).map(([severity, count]) => (
+                <Badge key={severity} color={SEVERITY_COLORS[severity] || 'gray'} variant="light">{severity}: {count}</Badge>
+              ))}
+            </Group>
+          </Group>
+          <Table striped verticalSpacing="xs">
+            <Table.Thead>
+              <Table.Tr>
+                <Table.Th>Tip</Table.Th>
+                <Table.Th>Ev</Table.Th>
+                <Table.Th>Skor</Table.Th>
+                <Table.Th>Ping</Table.Th>
+                <Table.Th>Sinyal</Table.Th>
+              </Table.Tr>
+            </Table.Thead>
+            <Table.Tbody>
+              {summary.house_types.map((t) => (
+                <Table.Tr key={t.house_type}>
+                  <Table.Td><Text size="sm" fw={500}>{t.house_type}</Text></Table.Td>
+                  <Table.Td>{t.houses}</Table.Td>
+                  <Table.Td>{t.overall_rating ?? '-'}</Table.Td>
+                  <Table.Td>{t.avg_latency_ms !== null ? `${t.avg_latency_ms} ms` : '-'}</Table.Td>
+                  <Table.Td>{t.avg_signal_dbm !== null ? `${t.avg_signal_dbm} dBm` : '-'}</Table.Td>
+                </Table.Tr>
+              ))}
+            </Table.Tbody>
+          </Table>
+        </Card>
+      </Grid.Col>
+
+      <Grid.Col span={{ base: 12, lg: 6 }}>
+        <Card shadow="sm" padding="lg" radius="md" withBorder className="h-full">
+          <Title order={5} mb="md">En Kötü Odalar</Title>
+          <Table striped verticalSpacing="xs">
+            <Table.Thead>
+              <Table.Tr>
+                <Table.Th>Ev ID</Table.Th>
+                <Table.Th>Oda</Table.Th>
+                <Table.Th>Skor</Table.Th>
+                <Table.Th>Ping</Table.Th>
+              </Table.Tr>
+            </Table.Thead>
+            <Table.Tbody>
+              {summary.worst_rooms.map((room) => (
+                <Table.Tr key={`${room.house_id}-${room.room_name}`}>
+                  <Table.Td><Text size="sm" fw={500}>{room.house_id}</Text></Table.Td>
+                  <Table.Td>{room.room_name}</Table.Td>
+                  <Table.Td><Badge color="red" variant="light">{room.overall_rating}</Badge></Table.Td>
+                  <Table.Td>{room.avg_latency_ms} ms</Table.Td>
+                </Table.Tr>
+              ))}
+            </Table.Tbody>
+          </Table>
+        </Card>
+      </Grid.Col>
+    </Grid>
+  );
+};
+
+export default FleetOverview;
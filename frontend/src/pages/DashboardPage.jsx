@@ -9,6 +9,10 @@ import StatCard from '../components/StatCard';
 import QualityChart from '../components/QualityChart';
 import SignalStrengthChart from '../components/SignalStrengthChart';
 import SignalTable from '../components/SignalTable';
+import FleetOverview from '../components/FleetOverview';
+
+// Tablo ve grafiklerin kullandığı sinyal alanları (API sadece bu kolonları döner)
+const SIGNAL_FIELDS = 'timestamp,house_id,room,rssi,link_speed_mbps,latency_ms,packet_loss_rate,bssid';
 
 const DashboardPage = () => {
   const [data, setData] = useState([]);
@@ -16,6 +20,7 @@ const DashboardPage = () => {
   const [tableLoading, setTableLoading] = useState(false); 
   const [selectedHouse, setSelectedHouse] = useState(null);
   const [houseList, setHouseList] = useState([]);  
+  const [fleetSummary, setFleetSummary] = useState(null);
   // cursor
   const [cursors, setCursors] = useState([null]); 
   const [currentPage, setCurrentPage] = useState(1);
@@ -38,7 +43,7 @@ const DashboardPage = () => {
       setTableLoading(true);
       
       const currentCursor = cursors[pageIndex];
-      const params = { limit: 20 }; 
+      const params = { limit: 20, fields: SIGNAL_FIELDS }; 
       
       if (selectedHouse) params.house_id = selectedHouse;
       if (currentCursor) params.cursor = currentCursor;
@@ -63,6 +68,17 @@ const DashboardPage = () => {
     }
   };
 
+  // Ev seçilmediğinde filo özeti (önceden hesaplanmış sayaçlar)
+  useEffect(() => {
+    if (selectedHouse) {
+      setFleetSummary(null);
+      return;
+    }
+    axios.get('http://localhost:8000/api/fleet/summary/')
+      .then((res) => setFleetSummary(res.data))
+      .catch((err) => console.error("Filo özeti hatası:", err));
+  }, [selectedHouse]);
+
   useEffect(() => {
     setLoading(true);
     setCursors([null]);
@@ -70,7 +86,7 @@ const DashboardPage = () => {
     setHasNextPage(false);
     
     const initialFetch = async () => {
-        const params = { limit: 20 };
+        const params = { limit: 20, fields: SIGNAL_FIELDS };
         if (selectedHouse) params.house_id = selectedHouse;
         try {
             const res = await axios.get('http://localhost:8000/api/signals/', { params });
@@ -120,6 +136,8 @@ const DashboardPage = () => {
       {loading && data.length === 0 ? (
         <Center h={400}><Loader size="xl" type="bars" /></Center>
       ) : (
+        <>
+        {!selectedHouse && <FleetOverview summary={fleetSummary} />}
         <Grid gutter="lg">
           <Grid.Col span={{ base: 12, md: 4 }}>
             <StatCard title="Ortalama Hız" value={avgSpeed} unit="Mbps" subtext="(Download)" icon={Server} color="blue" />
@@ -150,6 +168,7 @@ const DashboardPage = () => {
             />
           </Grid.Col>
         </Grid>
+        </>
       )}
     </div>
   );
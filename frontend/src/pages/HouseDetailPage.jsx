@@ -13,19 +13,20 @@ const HouseDetailPage = () => {
   const { houseId } = useParams();
   const [roomsMetrics, setRoomsMetrics] = useState([]);
   const [recommendationData, setRecommendationData] = useState(null);
+  const [house, setHouse] = useState(null);
+  const [signalSummary, setSignalSummary] = useState(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [metricsRes, recRes] = await Promise.all([
-          axios.get(`http://localhost:8000/api/houses/${houseId}/metrics/`),
-          axios.get(`http://localhost:8000/api/houses/${houseId}/recommendations/`)
-            .catch(() => ({ data: null })) 
-        ]);
+        // Kayıt bilgisi, oda metrikleri, öneri ve sinyal özeti tek istekte gelir
+        const { data } = await axios.get(`http://localhost:8000/api/houses/${houseId}/dashboard/`);
 
-        setRoomsMetrics(metricsRes.data);
-        setRecommendationData(recRes.data);
+        setRoomsMetrics(data.rooms);
+        setRecommendationData(data.recommendation);
+        setHouse(data.house);
+        setSignalSummary(data.signals);
         
       } catch (err) {
         console.error("Veri çekme hatası:", err);
@@ -65,6 +66,15 @@ const HouseDetailPage = () => {
         <div>
           <Title order={2}>{houseId} Performans Karnesi</Title>
           <Text c="dimmed">Oda bazlı bağlantı kalitesi ve yapay zeka önerileri</Text>
+          {house && (
+            <Group gap="xs" mt={4}>
+              <Badge variant="light">{house.house_type}</Badge>
+              <Badge variant="light" color="gray">{house.area_sqm} m²</Badge>
+              {signalSummary && (
+                <Badge variant="light" color="teal">Son {signalSummary.window_hours} saat: {signalSummary.count} ölçüm</Badge>
+              )}
+            </Group>
+          )}
         </div>
       </div>
 
@@ -83,6 +93,7 @@ const HouseDetailPage = () => {
       <Grid>
         {roomsMetrics.map((room, index) => {
           const roomRec = recommendationData?.room_recommendations?.[room.room_name];
+          const roomSignals = signalSummary?.rooms?.[room.room_name];
 
           return (
             <Grid.Col key={index} span={{ base: 12, md: 6, lg: 4 }}>
@@ -125,6 +136,13 @@ const HouseDetailPage = () => {
                         {room.avg_latency_ms} ms
                       </Text>
                     </Grid.Col>
+                    {roomSignals && (
+                      <Grid.Col span={12}>
+                        <Text size="xs" c="dimmed">
+                          Son {signalSummary.window_hours} saat: {roomSignals.count} ölçüm, ort. {roomSignals.rssi} dBm
+                        </Text>
+                      </Grid.Col>
+                    )}
                   </Grid>
                 </div>
                 <div className="mt-auto pt-4 border-t border-gray-100">
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -22,6 +23,129 @@ load_dotenv()  # .env dosyasını yükle
 # MongoDB Ayarları
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://db:27017/")
 MONGO_DB_NAME = os.getenv("MONGO_DB_NAME", "wifi_analytics")
+# event_store indexlerini process başlarken otomatik oluştur
+MONGO_ENSURE_INDEXES = os.getenv("MONGO_ENSURE_INDEXES", "True") == "True"
+# Bağlantı havuzu: process başına en fazla/en az açık bağlantı ve boşta kalan bağlantının kapatılma süresi (ms, 0 = kapatma)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "0"))
+# Havuz doluyken bağlantı için en fazla bekleme (ms, 0 = sınırsız); aşılırsa istek hata alır
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "0"))
+# Sunucu seçimi, bağlantı kurma ve soket okuma zaman aşımları (ms, 0 = sınırsız)
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "0"))
+# İstemcinin varsayılan read preference'ı (primary, primaryPreferred, secondary, secondaryPreferred, nearest)
+MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE", "primary")
+# Varsayılan write concern: w ("1", "majority", ...; boş = sunucu varsayılanı) ve journal ("True"/"False"; boş = varsayılan)
+MONGO_WRITE_CONCERN = os.getenv("MONGO_WRITE_CONCERN", "")
+MONGO_WRITE_CONCERN_JOURNAL = os.getenv("MONGO_WRITE_CONCERN_JOURNAL", "")
+# Sunucu loglarında ve currentOp çıktısında görünen uygulama adı
+MONGO_APP_NAME = os.getenv("MONGO_APP_NAME", "wifi_analytics")
+# Okuma yönlendirme: sorgu başına read preference ve maxStalenessSeconds ("sorgu=mod[:saniye]", virgülle ayrılmış;
+# "*" tüm dashboard sorgularına uygulanır). Ör: "*=secondaryPreferred:90,get_fleet_summary=nearest". Boş = MONGO_READ_PREFERENCE
+MONGO_READ_ROUTES = os.getenv("MONGO_READ_ROUTES", "")
+# Her API isteğini causal consistency oturumunda çalıştır ve X-Causal-Token dön (read-your-writes, replica set gerekir)
+MONGO_CAUSAL_CONSISTENCY = os.getenv("MONGO_CAUSAL_CONSISTENCY", "False") == "True"
+
+# Rollup Ayarları
+# Dakikalık sinyal rollup'larının saklanacağı gün sayısı (saatlik/günlük rollup'lar silinmez)
+ROLLUP_MINUTE_RETENTION_DAYS = int(os.getenv("ROLLUP_MINUTE_RETENTION_DAYS", "7"))
+# Oda metriklerindeki p50/p90/p99'un hesaplandığı pencere (saatlik rollup sketch'leri birleştirilir)
+ROOM_PERCENTILE_WINDOW_HOURS = int(os.getenv("ROOM_PERCENTILE_WINDOW_HOURS", "24"))
+
+# Canlı Akış (SSE) Ayarları
+# inprocess | change_stream | auto (replica set varsa change_stream)
+LIVE_FEED_SOURCE = os.getenv("LIVE_FEED_SOURCE", "auto")
+# İstemci başına tutulacak en fazla bekleyen sinyal; dolunca en eskisi atılır
+LIVE_FEED_QUEUE_SIZE = int(os.getenv("LIVE_FEED_QUEUE_SIZE", "256"))
+
+# Ingest Ayarları
+# Sinyal ingest endpoint'lerinde DRF yerine derlenmiş doğrulayıcı + orjson kullanan hızlı yol
+INGEST_FAST_PATH = os.getenv("INGEST_FAST_PATH", "False") == "True"
+INGEST_BATCH_MAX_SIZE = int(os.getenv("INGEST_BATCH_MAX_SIZE", "5000"))
+# Write-behind buffer: tekil sinyaller kuyruğa alınıp arka planda toplu yazılır
+INGEST_BUFFER_ENABLED = os.getenv("INGEST_BUFFER_ENABLED", "False") == "True"
+# enqueue: kuyruğa alınınca yanıt ver (202) | flush: veritabanına yazılınca yanıt ver (201)
+INGEST_BUFFER_DURABILITY = os.getenv("INGEST_BUFFER_DURABILITY", "enqueue")
+INGEST_BUFFER_MAX_SIZE = int(os.getenv("INGEST_BUFFER_MAX_SIZE", "10000"))
+INGEST_BUFFER_FLUSH_EVENTS = int(os.getenv("INGEST_BUFFER_FLUSH_EVENTS", "500"))
+INGEST_BUFFER_FLUSH_INTERVAL_MS = int(os.getenv("INGEST_BUFFER_FLUSH_INTERVAL_MS", "50"))
+# flush modunda bir isteğin yazılmayı en fazla bekleyeceği süre
+INGEST_BUFFER_FLUSH_TIMEOUT_MS = int(os.getenv("INGEST_BUFFER_FLUSH_TIMEOUT_MS", "5000"))
+INGEST_BUFFER_RETRY_AFTER_SECONDS = int(os.getenv("INGEST_BUFFER_RETRY_AFTER_SECONDS", "1"))
+# Tekrar gönderilen okumalar (reading_id / Idempotency-Key): process başına hatırlanan son event_id sayısı
+INGEST_DEDUP_CACHE_SIZE = int(os.getenv("INGEST_DEDUP_CACHE_SIZE", "100000"))
+# bucketed formatta okuma id'lerinin ingest_dedup koleksiyonunda tutulma süresi
+INGEST_DEDUP_TTL_HOURS = int(os.getenv("INGEST_DEDUP_TTL_HOURS", "72"))
+
+# Aggregate Ayarları
+# Eventlere ev başına artan version ata ((aggregate_id, version) unique index ile korunur).
+# Opt-in: her append (tekil, batch, hızlı yol, buffer group commit) insert'ten önce batch'teki her ev için
+# aggregate_versions'a ayrı bir find_one_and_update yapar (ev başına +1 sıralı round trip).
+# Kapalıyken expected_version kullanılamaz ve load_aggregate snapshot'sız tam replay yapar.
+AGGREGATE_VERSIONING = os.getenv("AGGREGATE_VERSIONING", "False") == "True"
+# load_aggregate bu kadar veya daha fazla event oynattığında snapshot'ı ilerletir
+AGGREGATE_SNAPSHOT_EVERY = int(os.getenv("AGGREGATE_SNAPSHOT_EVERY", "1000"))
+# Ayrılan ama henüz yazılmamış versiyonların snapshot altında kalmaması için bekleme süresi
+AGGREGATE_SNAPSHOT_SETTLE_SECONDS = int(os.getenv("AGGREGATE_SNAPSHOT_SETTLE_SECONDS", "60"))
+
+# Sunucu Tarafı Analiz Ayarları (python manage.py analyze_signals)
+# Oda skorlarının hesaplandığı pencere ve pencerenin bölündüğü bucket süresi
+ANALYSIS_WINDOW_HOURS = int(os.getenv("ANALYSIS_WINDOW_HOURS", "24"))
+ANALYSIS_BUCKET_MINUTES = int(os.getenv("ANALYSIS_BUCKET_MINUTES", "60"))
+# Checkpoint'li sinyal okuyucuları (analyze_signals, detect_degradation) son bu kadar saniyeyi okumaz: _id'ler
+# yazıcılarda üretilir ve commit sırasıyla artmaz, geç commit edilen sinyal checkpoint'in gerisinde kalmasın
+SIGNAL_CHECKPOINT_LAG_SECONDS = int(os.getenv("SIGNAL_CHECKPOINT_LAG_SECONDS", "10"))
+
+# Degradation Detector Ayarları (python manage.py detect_degradation)
+# Hızlı EWMA son durumu, yavaş EWMA ve varyansı olağan durumu izler
+DEGRADATION_FAST_ALPHA = float(os.getenv("DEGRADATION_FAST_ALPHA", "0.3"))
+DEGRADATION_SLOW_ALPHA = float(os.getenv("DEGRADATION_SLOW_ALPHA", "0.02"))
+# Hızlı değerin yavaş değerden kaç standart sapma kötüleşmesi bozulma sayılır
+DEGRADATION_Z_THRESHOLD = float(os.getenv("DEGRADATION_Z_THRESHOLD", "4"))
+# Ev × oda × BSSID başına ısınma süresi (bu kadar sinyalden önce event üretilmez)
+DEGRADATION_MIN_SAMPLES = int(os.getenv("DEGRADATION_MIN_SAMPLES", "30"))
+
+# Ev Yanıt Önbelleği Ayarları (/api/houses/<id>/metrics/, /recommendations/ ve /dashboard/)
+HOUSE_CACHE_ENABLED = os.getenv("HOUSE_CACHE_ENABLED", "True") == "True"
+# Process içi LRU'nun bayt sınırı (değerlerin tahmini boyutu)
+HOUSE_CACHE_MAX_BYTES = int(os.getenv("HOUSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Bu süre boyunca değer taze sayılır; sonraki HOUSE_CACHE_STALE_SECONDS boyunca eski değer dönülüp arka planda yenilenir
+# (stale penceresi sadece HOUSE_CACHE_BACKEND ayarlıysa kullanılır)
+HOUSE_CACHE_TTL_SECONDS = int(os.getenv("HOUSE_CACHE_TTL_SECONDS", "30"))
+HOUSE_CACHE_STALE_SECONDS = int(os.getenv("HOUSE_CACHE_STALE_SECONDS", "300"))
+# Yeni sinyal gelen evin metrics ve dashboard yanıtları en fazla bu kadar gecikmeyle yeniden hesaplanır
+HOUSE_CACHE_SIGNAL_LAG_SECONDS = int(os.getenv("HOUSE_CACHE_SIGNAL_LAG_SECONDS", "5"))
+HOUSE_CACHE_REFRESH_WORKERS = int(os.getenv("HOUSE_CACHE_REFRESH_WORKERS", "2"))
+# Process'ler arası paylaşılan Django cache alias'ı (CACHES, ör. Redis); boş = sadece process içi
+HOUSE_CACHE_BACKEND = os.getenv("HOUSE_CACHE_BACKEND", "")
+
+# Ev Dashboard Ayarları (/api/houses/<id>/dashboard/)
+# Yanıttaki son sinyal sayısı ve dashboard sorgularını paralel çalıştıran thread sayısı (process başına)
+HOUSE_DASHBOARD_SIGNALS = int(os.getenv("HOUSE_DASHBOARD_SIGNALS", "20"))
+HOUSE_DASHBOARD_QUERY_WORKERS = int(os.getenv("HOUSE_DASHBOARD_QUERY_WORKERS", "8"))
+
+# Yanıt Sıkıştırma Ayarları (JSON/CSV/NDJSON yanıtları, Accept-Encoding ile br veya gzip)
+RESPONSE_COMPRESSION_ENABLED = os.getenv("RESPONSE_COMPRESSION_ENABLED", "True") == "True"
+# Bu boyutun altındaki yanıtlar sıkıştırılmaz (bayt)
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+# gzip seviyesi (1-9) ve brotli kalitesi (0-11); yüksek değer daha küçük yanıt ama istek başına daha fazla CPU
+RESPONSE_GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+RESPONSE_BROTLI_QUALITY = int(os.getenv("RESPONSE_BROTLI_QUALITY", "4"))
+
+# Export Ayarları
+# /api/export/signals/ Mongo cursor batch boyutu ve yanıt parçası başına satır sayısı
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "5000"))
+
+# Sinyal Saklama Ayarları
+# document: her sinyal ayrı event dokümanı (varsayılan)
+# compact: binary UUID, BSON datetime, payload'da house_id tekrarı yok
+# bucketed: ev × zaman penceresi başına paralel diziler (signal_buckets koleksiyonu)
+# Format değiştirmek için: python manage.py migrate_signal_storage --to <format>
+SIGNAL_STORAGE_FORMAT = os.getenv("SIGNAL_STORAGE_FORMAT", "document")
+SIGNAL_BUCKET_SPAN_MINUTES = int(os.getenv("SIGNAL_BUCKET_SPAN_MINUTES", "60"))
+SIGNAL_BUCKET_MAX_READINGS = int(os.getenv("SIGNAL_BUCKET_MAX_READINGS", "1000"))
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -51,6 +175,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'wifi_app.api.middleware.ResponseCompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -58,6 +183,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'wifi_app.api.middleware.CausalConsistencyMiddleware',
 ]
 
 ROOT_URLCONF = 'config.urls'
@@ -137,3 +263,14 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",
     "http://127.0.0.1:5173",
 ]
+# Causal consistency token'ı tarayıcıdan okunup sonraki isteklerde gönderilebilsin
+CORS_ALLOW_HEADERS = (*default_headers, "x-causal-token")
+CORS_EXPOSE_HEADERS = ["X-Causal-Token"]
+
+REST_FRAMEWORK = {
+    # JSON yanıtları orjson ile yazılır (wifi_app.api.renderers); Browsable API korunur
+    'DEFAULT_RENDERER_CLASSES': [
+        'wifi_app.api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
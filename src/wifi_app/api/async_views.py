@@ -0,0 +1,220 @@
+import asyncio
+import io
+import json
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from rest_framework import status
+from rest_framework.exceptions import ParseError, ValidationError
+from .parsers import NDJSONParser
+from .renderers import ColumnarJSONRenderer, ORJSONRenderer
+from .serializers import WifiSignalSerializer, HouseRegistrationSerializer
+from .views import (
+    batch_result, buffered_ingest_result, build_signal_event, house_dashboard_found, idempotency_key,
+    ingest_result, HouseListView, WifiSignalListView
+)
+from ..domain.events import HouseRegistered
+from ..infrastructure.async_event_store import get_async_event_store
+from ..infrastructure.cache import cached_house_response
+from ..infrastructure.event_store import get_event_store
+
+
+class AsyncAPIView(View):
+    """
+    ASGI altında çalışan async view'ların temel sınıfı. DRF APIView'ları async handler desteklemediği için
+    düz Django View kullanılır; doğrulama yine DRF serializer'ları ile yapılır.
+    """
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        # DRF APIView'larında olduğu gibi API endpoint'leri CSRF kontrolünden muaf
+        view.csrf_exempt = True
+        return view
+
+    @staticmethod
+    def parse_json(request):
+        try:
+            return json.loads(request.body or b'null')
+        except ValueError as exc:
+            raise ValidationError({"detail": f"JSON parse error - {exc}"})
+
+    renderer = ORJSONRenderer()
+
+    def respond(self, data, status_code=status.HTTP_200_OK, renderer=None):
+        body = (renderer or self.renderer).render(data)
+        return HttpResponse(body, status=status_code, content_type='application/json')
+
+
+class AsyncIngestWifiSignalView(AsyncAPIView):
+    """
+    [POST] IngestWifiSignalView'ın async karşılığı.
+    """
+    async def post(self, request):
+        try:
+            data = self.parse_json(request)
+        except ValidationError as exc:
+            return self.respond(exc.detail, status.HTTP_400_BAD_REQUEST)
+
+        serializer = WifiSignalSerializer(data=data)
+        if serializer.is_valid():
+            event = build_signal_event(serializer.validated_data, idempotency_key(request.headers))
+            if settings.INGEST_BUFFER_ENABLED:
+                # flush modunda yazılana kadar beklenir; event loop bloklanmasın diye worker thread'de
+                response_data, response_status = await asyncio.to_thread(buffered_ingest_result, event)
+                response = self.respond(response_data, response_status)
+                if response_status == status.HTTP_503_SERVICE_UNAVAILABLE:
+                    response['Retry-After'] = str(settings.INGEST_BUFFER_RETRY_AFTER_SECONDS)
+                return response
+
+            written = await get_async_event_store().append(event)
+            return self.respond(*ingest_result(event, written))
+        return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncIngestWifiSignalBatchView(AsyncAPIView):
+    """
+    [POST] IngestWifiSignalBatchView'ın async karşılığı (JSON dizisi veya NDJSON).
+    """
+    async def post(self, request):
+        try:
+            if request.content_type == NDJSONParser.media_type:
+                items = NDJSONParser().parse(
+                    io.BytesIO(request.body), parser_context={'encoding': request.encoding or settings.DEFAULT_CHARSET}
+                )
+            else:
+                items = self.parse_json(request)
+        except ParseError as exc:
+            return self.respond({"detail": str(exc.detail)}, status.HTTP_400_BAD_REQUEST)
+        except ValidationError as exc:
+            return self.respond(exc.detail, status.HTTP_400_BAD_REQUEST)
+
+        if not isinstance(items, list):
+            return self.respond({"error": "Expected a list of signals."}, status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.INGEST_BATCH_MAX_SIZE:
+            return self.respond(
+                {"error": f"Batch size exceeds limit ({settings.INGEST_BATCH_MAX_SIZE})."},
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        serializer = WifiSignalSerializer()
+        events = []
+        rejected = []
+        for index, item in enumerate(items):
+            try:
+                data = serializer.run_validation(item)
+            except ValidationError as exc:
+                rejected.append({"index": index, "errors": exc.detail})
+                continue
+            events.append(build_signal_event(data, idempotency_key(request.headers, index)))
+
+        written = await get_async_event_store().append_many(events) if events else []
+        return self.respond(*batch_result(events, written, rejected))
+
+
+class AsyncRegisterHouseView(AsyncAPIView):
+    """
+    [POST] RegisterHouseView'ın async karşılığı.
+    """
+    async def post(self, request):
+        try:
+            data = self.parse_json(request)
+        except ValidationError as exc:
+            return self.respond(exc.detail, status.HTTP_400_BAD_REQUEST)
+
+        serializer = HouseRegistrationSerializer(data=data)
+        if serializer.is_valid():
+            data = serializer.validated_data
+            event = HouseRegistered(
+                house_id=data['house_id'],
+                house_type=data['house_type'],
+                owner_name=data['owner_name'],
+                area_sqm=data['area_sqm']
+            )
+            await get_async_event_store().append(event)
+            return self.respond({"status": "house registered", "event_id": event.event_id}, status.HTTP_201_CREATED)
+        return self.respond(serializer.errors, status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncWifiSignalListView(AsyncAPIView):
+    """
+    [GET] WifiSignalListView'ın async karşılığı (aynı filtreler, keyset pagination ve ?format=columnar).
+    """
+    async def get(self, request):
+        renderer = None
+        if request.GET.get('format') == ColumnarJSONRenderer.format:
+            renderer = ColumnarJSONRenderer()
+        try:
+            query = WifiSignalListView.parse_query(request.GET)
+        except ValueError as e:
+            return self.respond({"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        results = await get_async_event_store().find_signals(**query)
+        next_cursor = results[-1]['mongo_id'] if results and len(results) >= query['limit'] else None
+        return self.respond({"results": results, "next_cursor": next_cursor}, renderer=renderer)
+
+
+class AsyncHouseListView(AsyncAPIView):
+    """
+    [GET] HouseListView'ın async karşılığı; aynı versiyonlu önbelleği ve ETag'i kullanır.
+    """
+    async def get(self, request):
+        store = get_async_event_store()
+        version = await store.get_registry_version()
+        etag = f'"houses-{version}"'
+
+        if etag in request.headers.get('If-None-Match', ''):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+            response['ETag'] = etag
+            return response
+
+        dropdown_data = HouseListView.cache.get(version)
+        if dropdown_data is None:
+            dropdown_data = HouseListView.build_dropdown(await store.get_registered_houses())
+            HouseListView.cache.set(version, dropdown_data)
+
+        response = self.respond(dropdown_data)
+        response['ETag'] = etag
+        return response
+
+
+def cached_house_query(kind, house_id, method):
+    """
+    Sync view'larla aynı ev yanıt önbelleğinden (cached_house_response) okur; iki yol aynı değerleri ve aynı
+    invalidation'ı paylaşır. Önbellek thread tabanlı single-flight kullandığı için çağrı ve önbellekte yoksa
+    sync store'un method sorgusu worker thread'de çalışır.
+    """
+    return asyncio.to_thread(
+        cached_house_response, kind, house_id, lambda: getattr(get_event_store(), method)(house_id)
+    )
+
+
+class AsyncHouseRoomMetricsView(AsyncAPIView):
+    """
+    [GET] HouseRoomMetricsView'ın async karşılığı.
+    """
+    async def get(self, request, house_id):
+        return self.respond(await cached_house_query('metrics', house_id, 'get_house_room_metrics'))
+
+
+class AsyncHouseRecommendationsView(AsyncAPIView):
+    """
+    [GET] HouseRecommendationsView'ın async karşılığı.
+    """
+    async def get(self, request, house_id):
+        recommendation = await cached_house_query('recommendations', house_id, 'get_latest_recommendation')
+        if recommendation:
+            return self.respond(recommendation)
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+
+class AsyncHouseDashboardView(AsyncAPIView):
+    """
+    [GET] HouseDashboardView'ın async karşılığı.
+    """
+    async def get(self, request, house_id):
+        dashboard = await cached_house_query('dashboard', house_id, 'get_house_dashboard')
+        if not house_dashboard_found(dashboard):
+            return self.respond({"error": "House not found."}, status.HTTP_404_NOT_FOUND)
+        return self.respond(dashboard)
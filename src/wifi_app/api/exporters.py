@@ -0,0 +1,152 @@
+import csv
+import io
+import json
+from ..infrastructure.signal_codec import SIGNAL_LIST_FIELDS
+
+try:
+    import orjson
+except ImportError:  # orjson kurulu değilse standart json kullanılır
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Arrow/Parquet formatları pyarrow gerektirir
+    pyarrow = None
+
+# Arrow şemasındaki sayısal kolonlar; diğerleri string
+INTEGER_COLUMNS = {"rssi", "link_speed_mbps", "latency_ms", "packet_loss_rate"}
+
+
+def chunked(rows, size):
+    """
+    Satır iterator'ını size'lık listelere böler (tüm sonucu belleğe almadan).
+    """
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class SignalExporter:
+    """
+    Düz sinyal satırlarını (MongoEventStore.iter_signals) bir dosya formatına byte parçaları olarak yazar.
+    Her parça bir batch'ten üretilir; bellek kullanımı batch boyutuyla sınırlıdır.
+    """
+    name = None
+    content_type = None
+    extension = None
+    requires = None
+
+    def __init__(self, columns, batch_size=5000):
+        self.columns = [name for name in SIGNAL_LIST_FIELDS if name in columns]
+        self.batch_size = batch_size
+
+    @classmethod
+    def available(cls):
+        return cls.requires is None or cls.requires()
+
+    def stream(self, rows):
+        raise NotImplementedError
+
+
+class NDJSONExporter(SignalExporter):
+    name = 'ndjson'
+    content_type = 'application/x-ndjson'
+    extension = 'ndjson'
+
+    def stream(self, rows):
+        if orjson is not None:
+            dumps = orjson.dumps
+            for batch in chunked(rows, self.batch_size):
+                yield b'\n'.join(dumps(row) for row in batch) + b'\n'
+            return
+        for batch in chunked(rows, self.batch_size):
+            yield ''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in batch).encode('utf-8')
+
+
+class CSVExporter(SignalExporter):
+    name = 'csv'
+    content_type = 'text/csv; charset=utf-8'
+    extension = 'csv'
+
+    def stream(self, rows):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+        columns = self.columns
+        for batch in chunked(rows, self.batch_size):
+            writer.writerows([row.get(name) for name in columns] for row in batch)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+
+class ArrowExporter(SignalExporter):
+    """
+    Arrow IPC stream formatı: şema bir kez, ardından her batch bir RecordBatch olarak yazılır.
+    """
+    name = 'arrow'
+    content_type = 'application/vnd.apache.arrow.stream'
+    extension = 'arrows'
+    requires = staticmethod(lambda: pyarrow is not None)
+
+    def schema(self):
+        return pyarrow.schema([
+            (name, pyarrow.int64() if name in INTEGER_COLUMNS else pyarrow.string()) for name in self.columns
+        ])
+
+    def record_batch(self, batch, schema):
+        arrays = [
+            pyarrow.array([row.get(name) for row in batch], type=schema.field(name).type)
+            for name in self.columns
+        ]
+        return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+    def open_writer(self, sink, schema):
+        return pyarrow.ipc.new_stream(sink, schema)
+
+    def stream(self, rows):
+        schema = self.schema()
+        sink = io.BytesIO()
+        writer = self.open_writer(sink, schema)
+        for batch in chunked(rows, self.batch_size):
+            self.write(writer, self.record_batch(batch, schema))
+            yield self.drain(sink)
+        writer.close()
+        yield self.drain(sink)
+
+    def write(self, writer, record_batch):
+        writer.write_batch(record_batch)
+
+    @staticmethod
+    def drain(sink):
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+
+class ParquetExporter(ArrowExporter):
+    """
+    Parquet: her batch ayrı bir row group olarak yazılır; footer yanıtın sonunda gönderilir.
+    """
+    name = 'parquet'
+    content_type = 'application/vnd.apache.parquet'
+    extension = 'parquet'
+
+    def open_writer(self, sink, schema):
+        return pyarrow.parquet.ParquetWriter(sink, schema, compression='zstd')
+
+    def write(self, writer, record_batch):
+        writer.write_batch(record_batch)
+
+
+EXPORTERS = {exporter.name: exporter for exporter in (NDJSONExporter, CSVExporter, ArrowExporter, ParquetExporter)}
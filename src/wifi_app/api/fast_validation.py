@@ -0,0 +1,220 @@
+import re
+from collections.abc import Mapping
+from django.core.exceptions import ImproperlyConfigured
+from django.core.validators import MaxLengthValidator, MinLengthValidator, ProhibitNullCharactersValidator
+from rest_framework import fields as drf_fields, serializers
+from rest_framework.settings import api_settings
+from rest_framework.validators import ProhibitSurrogateCharactersValidator
+
+# Unicode surrogate aralığı (ProhibitSurrogateCharactersValidator ile aynı kontrol)
+SURROGATE_RE = re.compile('[\ud800-\udfff]')
+INT_FAST_LIMIT = 10 ** 18
+
+
+class FieldInvalid(Exception):
+    """
+    Tek bir alanın hata mesajları (DRF'deki ValidationError.detail listesi).
+    """
+    def __init__(self, messages):
+        self.messages = messages
+
+
+class SkipField(Exception):
+    pass
+
+
+def _fail(field, key, **kwargs):
+    raise FieldInvalid([str(field.error_messages[key]).format(**kwargs)])
+
+
+def _empty_value(field):
+    """
+    Alan gönderilmediğinde DRF Field.validate_empty_values + get_default davranışı.
+    """
+    if field.required:
+        _fail(field, 'required')
+    if field.default is drf_fields.empty:
+        raise SkipField()
+    return field.default() if callable(field.default) else field.default
+
+
+def _validator_checks(field, allowed):
+    """
+    Alan validator'larını sırasıyla değer kontrollerine çevirir. Desteklenmeyen bir validator varsa
+    hızlı yol serializer ile aynı sonucu garanti edemeyeceği için derleme hata verir.
+    """
+    checks = []
+    for validator in field.validators:
+        if not isinstance(validator, allowed):
+            raise ImproperlyConfigured(
+                f"Fast ingest validator does not support {type(validator).__name__} on '{field.field_name}'."
+            )
+        if isinstance(validator, MaxLengthValidator):
+            limit, message = validator.limit_value, validator.message
+            checks.append(lambda value, limit=limit, message=message: str(message) if len(value) > limit else None)
+        elif isinstance(validator, MinLengthValidator):
+            limit, message = validator.limit_value, validator.message
+            checks.append(lambda value, limit=limit, message=message: str(message) if len(value) < limit else None)
+        elif isinstance(validator, ProhibitNullCharactersValidator):
+            message = validator.message
+            checks.append(lambda value, message=message: str(message) if '\x00' in value else None)
+        elif isinstance(validator, ProhibitSurrogateCharactersValidator):
+            message = validator.message
+
+            def check(value, message=message):
+                match = SURROGATE_RE.search(value)
+                return str(message).format(code_point=ord(match.group())) if match else None
+            checks.append(check)
+    return checks
+
+
+def _run_checks(checks, value):
+    errors = None
+    for check in checks:
+        error = check(value)
+        if error is not None:
+            errors = errors or []
+            errors.append(error)
+    if errors:
+        raise FieldInvalid(errors)
+    return value
+
+
+def compile_char_field(field):
+    checks = _validator_checks(field, (
+        MaxLengthValidator, MinLengthValidator, ProhibitNullCharactersValidator, ProhibitSurrogateCharactersValidator
+    ))
+    trim, allow_blank, allow_null = field.trim_whitespace, field.allow_blank, field.allow_null
+
+    def validate(data):
+        if data is drf_fields.empty:
+            return _empty_value(field)
+        # CharField.run_validation: boş string kontrolü diğer kontrollerden önce yapılır
+        if data == '' or (trim and str(data).strip() == ''):
+            if not allow_blank:
+                _fail(field, 'blank')
+            return ''
+        if data is None:
+            if not allow_null:
+                _fail(field, 'null')
+            return None
+        if isinstance(data, bool) or not isinstance(data, (str, int, float)):
+            _fail(field, 'invalid')
+        value = str(data)
+        if trim:
+            value = value.strip()
+        return _run_checks(checks, value) if checks else value
+    return validate
+
+
+def compile_integer_field(field):
+    if field.max_value is not None or field.min_value is not None:
+        raise ImproperlyConfigured(f"Fast ingest validator does not support bounds on '{field.field_name}'.")
+    _validator_checks(field, ())
+    re_decimal, max_string_length, allow_null = field.re_decimal, field.MAX_STRING_LENGTH, field.allow_null
+
+    def validate(data):
+        if data is drf_fields.empty:
+            return _empty_value(field)
+        if data is None:
+            if not allow_null:
+                _fail(field, 'null')
+            return None
+        # JSON'dan gelen int değerler için IntegerField.to_internal_value ile aynı sonucu veren kısa yol
+        # (str(data) basamak sınırına takılabilecek çok büyük sayılar normal yoldan geçer)
+        if type(data) is int and -INT_FAST_LIMIT < data < INT_FAST_LIMIT:
+            return data
+        if isinstance(data, str) and len(data) > max_string_length:
+            _fail(field, 'max_string_length')
+        try:
+            return int(re_decimal.sub('', str(data)))
+        except (ValueError, TypeError):
+            _fail(field, 'invalid')
+    return validate
+
+
+def compile_choice_field(field):
+    _validator_checks(field, ())
+    choices, allow_blank, allow_null = field.choice_strings_to_values, field.allow_blank, field.allow_null
+
+    def validate(data):
+        if data is drf_fields.empty:
+            return _empty_value(field)
+        if data is None:
+            if not allow_null:
+                _fail(field, 'null')
+            return None
+        if data == '' and allow_blank:
+            return ''
+        # str alt sınıfı olmayan değerler için DRF'deki str(data) dönüşümü
+        key = data if type(data) is str else str(data)
+        try:
+            return choices[key]
+        except KeyError:
+            _fail(field, 'invalid_choice', input=data)
+    return validate
+
+
+# Alan tipi -> derleyici. Alt sınıflar to_internal_value'yu değiştirebileceği için sadece tam tip eşleşir
+FIELD_COMPILERS = {
+    drf_fields.ChoiceField: compile_choice_field,
+    drf_fields.IntegerField: compile_integer_field,
+    drf_fields.CharField: compile_char_field,
+}
+
+
+class CompiledValidator:
+    """
+    Düz (iç içe olmayan) bir DRF Serializer'ının alanlarından derlenmiş doğrulayıcı.
+    Kabul/red kararları, varsayılanlar ve hata mesajları serializer.run_validation ile aynıdır;
+    alan başına DRF Field nesnesi, ReturnDict ve ErrorDetail kurulumu yapılmaz.
+    """
+
+    def __init__(self, serializer_class):
+        serializer = serializer_class()
+        if serializer_class.validate is not serializers.Serializer.validate or serializer.validators:
+            raise ImproperlyConfigured(f"{serializer_class.__name__}: object level validation is not supported.")
+        self.name = serializer_class.__name__
+        self.error_messages = serializer.error_messages
+        self.fields = []
+        for name, field in serializer.fields.items():
+            if field.read_only or field.source != name:
+                raise ImproperlyConfigured(f"Fast ingest validator does not support field '{name}'.")
+            compile_field = FIELD_COMPILERS.get(type(field))
+            if compile_field is None:
+                raise ImproperlyConfigured(f"Fast ingest validator does not support {type(field).__name__}.")
+            self.fields.append((name, compile_field(field)))
+
+    def validate(self, data):
+        """
+        (validated_data, None) veya (None, errors) döner. errors, serializer.run_validation'ın
+        fırlattığı ValidationError.detail ile aynı şekildedir.
+        """
+        if data is None:
+            return None, [str(self.error_messages['null'])]
+        if not isinstance(data, Mapping):
+            message = str(self.error_messages['invalid']).format(datatype=type(data).__name__)
+            return None, {api_settings.NON_FIELD_ERRORS_KEY: [message]}
+
+        validated = {}
+        errors = None
+        empty = drf_fields.empty
+        for name, validate_field in self.fields:
+            try:
+                validated[name] = validate_field(data.get(name, empty))
+            except FieldInvalid as exc:
+                errors = errors or {}
+                errors[name] = exc.messages
+            except SkipField:
+                pass
+        if errors:
+            return None, errors
+        return validated, None
+
+    def errors_for_single(self, errors):
+        """
+        Tek kayıt endpoint'i için serializer.errors karşılığı (boş gövde için 'No data provided').
+        """
+        if isinstance(errors, list):
+            return {api_settings.NON_FIELD_ERRORS_KEY: ['No data provided']}
+        return errors
@@ -0,0 +1,177 @@
+import json
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from rest_framework import status
+from .fast_validation import CompiledValidator
+from .serializers import WifiSignalSerializer
+from .views import (
+    IngestWifiSignalView,
+    IngestWifiSignalBatchView,
+    build_signal_event,
+    buffered_ingest_result,
+    batch_ingest_result,
+    idempotency_key,
+    ingest_result,
+)
+from ..infrastructure.event_store import get_event_store
+
+try:
+    import orjson
+except ImportError:  # orjson kurulu değilse standart json kullanılır
+    orjson = None
+
+signal_validator = CompiledValidator(WifiSignalSerializer)
+
+
+def loads(body, strict=True):
+    """
+    JSON gövdeyi çözer. orjson hızlı yoldur; orjson'un reddettiği girdiler (ör. 64 bit'i aşan sayılar,
+    NaN) DRF parser'ları ile aynı kararı vermek için standart json ile tekrar denenir.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    text = body.decode('utf-8') if isinstance(body, bytes) else body
+    if strict:
+        # DRF JSONParser (STRICT_JSON) NaN/Infinity kabul etmez
+        return json.loads(text, parse_constant=_reject_constant)
+    return json.loads(text)
+
+
+def _reject_constant(value):
+    raise ValueError(f'Out of range float values are not JSON compliant: {value!r}')
+
+
+def dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def json_response(data, status_code, retry_after=False):
+    response = HttpResponse(dumps(data), status=status_code, content_type='application/json')
+    if retry_after:
+        response['Retry-After'] = str(settings.INGEST_BUFFER_RETRY_AFTER_SECONDS)
+    return response
+
+
+class NDJSONLineError(ValueError):
+    pass
+
+
+class FastIngestView(View):
+    """
+    DRF APIView yerine düz Django View üzerinde çalışan ingest endpoint'lerinin temel sınıfı.
+    Sadece UTF-8 JSON (ve NDJSON) POST istekleri hızlı yoldan işlenir; diğer tüm istekler
+    (form verisi, farklı charset, GET/OPTIONS vb.) aynı yanıtı vermesi için DRF view'ına devredilir.
+    """
+    fallback_view_class = None
+    fallback = None
+    media_types = ('application/json',)
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(fallback=cls.fallback_view_class.as_view(), **initkwargs)
+        # Devredilen DRF ingest view'ı gibi CSRF kontrolünden muaf (DRF APIView.as_view ile aynı)
+        view.csrf_exempt = True
+        return view
+
+    def dispatch(self, request, *args, **kwargs):
+        content_type = request.content_type
+        charset = (request.content_params.get('charset') or 'utf-8').lower().replace('_', '-')
+        if request.method != 'POST' or content_type not in self.media_types or charset not in ('utf-8', 'utf8'):
+            return self.fallback(request, *args, **kwargs)
+        try:
+            data = self.parse(request.body, content_type)
+        except ValueError as exc:
+            return json_response({"detail": self.parse_error(exc, content_type)}, status.HTTP_400_BAD_REQUEST)
+        self.headers = request.headers
+        return self.handle(data)
+
+    def parse(self, body, content_type):
+        # DRF boş gövdeyi {} olarak görür
+        if not body:
+            return {}
+        return loads(body)
+
+    def parse_error(self, exc, content_type):
+        return f'JSON parse error - {exc}'
+
+    def handle(self, data):
+        raise NotImplementedError
+
+
+class FastIngestWifiSignalView(FastIngestView):
+    """
+    [POST] IngestWifiSignalView'ın DRF serializer'ı olmadan çalışan hızlı karşılığı (INGEST_FAST_PATH).
+    """
+    fallback_view_class = IngestWifiSignalView
+
+    def handle(self, data):
+        validated, errors = signal_validator.validate(data)
+        if errors is not None:
+            return json_response(signal_validator.errors_for_single(errors), status.HTTP_400_BAD_REQUEST)
+
+        event = build_signal_event(validated, idempotency_key(self.headers))
+        if settings.INGEST_BUFFER_ENABLED:
+            response_data, response_status = buffered_ingest_result(event)
+            return json_response(
+                response_data, response_status,
+                retry_after=response_status == status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        return json_response(*ingest_result(event, get_event_store().append(event)))
+
+
+class FastIngestWifiSignalBatchView(FastIngestView):
+    """
+    [POST] IngestWifiSignalBatchView'ın hızlı karşılığı (JSON dizisi veya NDJSON).
+    """
+    fallback_view_class = IngestWifiSignalBatchView
+    media_types = ('application/json', 'application/x-ndjson')
+
+    def parse(self, body, content_type):
+        if content_type == 'application/x-ndjson':
+            items = []
+            # NDJSONParser ile aynı satır ayrımı ve hata mesajı
+            for line_no, line in enumerate(body.decode('utf-8').splitlines(), start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    items.append(loads(line, strict=False))
+                except ValueError as exc:
+                    raise NDJSONLineError(f'NDJSON parse error (line {line_no}) - {exc}')
+            return items
+        return super().parse(body, content_type)
+
+    def parse_error(self, exc, content_type):
+        if isinstance(exc, NDJSONLineError):
+            return str(exc)
+        return super().parse_error(exc, content_type)
+
+    def handle(self, items):
+        if not isinstance(items, list):
+            return json_response({"error": "Expected a list of signals."}, status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.INGEST_BATCH_MAX_SIZE:
+            return json_response(
+                {"error": f"Batch size exceeds limit ({settings.INGEST_BATCH_MAX_SIZE})."},
+                status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        events = []
+        rejected = []
+        validate = signal_validator.validate
+        for index, item in enumerate(items):
+            validated, errors = validate(item)
+            if errors is not None:
+                rejected.append({"index": index, "errors": errors})
+                continue
+            events.append(build_signal_event(validated, idempotency_key(self.headers, index)))
+
+        response_data, response_status = batch_ingest_result(events, rejected)
+        return json_response(response_data, response_status)
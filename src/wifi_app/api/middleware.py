@@ -0,0 +1,190 @@
+import gzip
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import JsonResponse
+from django.utils.cache import patch_vary_headers
+from ..infrastructure.async_mongo_client import AsyncMongoDBClient
+from ..infrastructure.mongo_client import MongoDBClient
+from ..infrastructure.read_routing import (
+    CAUSAL_TOKEN_HEADER,
+    async_causal_session,
+    causal_session,
+    decode_causal_token,
+    encode_causal_token,
+)
+
+try:
+    import brotli
+except ImportError:  # brotli kurulu değilse sadece gzip sunulur
+    brotli = None
+
+# Sıkıştırılan içerik tipleri; HTML (Browsable API, CSRF token'ı içerir) BREACH riski nedeniyle sıkıştırılmaz
+COMPRESSIBLE_CONTENT_TYPES = ('application/json', 'application/x-ndjson', 'text/csv', 'text/plain')
+
+
+class CausalConsistencyMiddleware:
+    """
+    MONGO_CAUSAL_CONSISTENCY=True iken her /api/ isteğini bir causal consistency oturumunda çalıştırır.
+    Oturum pymongo'ya bind edilir; view'lar, projeksiyon yazmaları ve worker thread'e devredilen store
+    çağrıları (asyncio.to_thread bağlamı kopyalar) aynı oturumu kullanır. Yanıttaki X-Causal-Token
+    sonraki istekte gönderilirse o istekteki okumalar (secondary'den olsa bile) token'daki yazmaları görür.
+    ASGI'da async ve sync istemcinin oturumları birlikte açılır; token ikisinin en yenisidir.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.MONGO_CAUSAL_CONSISTENCY:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    @staticmethod
+    def _token(request):
+        """
+        İstekteki token (yoksa None); geçersizse ValueError.
+        """
+        token = request.headers.get(CAUSAL_TOKEN_HEADER)
+        if token:
+            decode_causal_token(token)
+        return token or None
+
+    @staticmethod
+    def _respond(response, *sessions):
+        token = encode_causal_token(*sessions)
+        if token is not None:
+            response[CAUSAL_TOKEN_HEADER] = token
+        return response
+
+    @staticmethod
+    def _invalid(error):
+        return JsonResponse({"error": str(error)}, status=400)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        if not request.path.startswith('/api/'):
+            return self.get_response(request)
+        try:
+            token = self._token(request)
+        except ValueError as e:
+            return self._invalid(e)
+        with causal_session(MongoDBClient.get_client(), token) as session:
+            response = self.get_response(request)
+        return self._respond(response, session)
+
+    async def __acall__(self, request):
+        if not request.path.startswith('/api/'):
+            return await self.get_response(request)
+        try:
+            token = self._token(request)
+        except ValueError as e:
+            return self._invalid(e)
+        async with async_causal_session(AsyncMongoDBClient.get_client(), token) as async_session:
+            with causal_session(MongoDBClient.get_client(), token) as session:
+                response = await self.get_response(request)
+        return self._respond(response, session, async_session)
+
+
+def compress_gzip(content):
+    # mtime=0: aynı içerik için aynı bayt dizisi (ETag/önbellek dostu)
+    return gzip.compress(content, compresslevel=settings.RESPONSE_GZIP_LEVEL, mtime=0)
+
+
+def compress_brotli(content):
+    return brotli.compress(content, quality=settings.RESPONSE_BROTLI_QUALITY)
+
+
+def available_encodings():
+    """
+    Sunucunun sunabildiği kodlamalar, eşit q değerinde tercih sırasıyla.
+    """
+    encodings = {}
+    if brotli is not None:
+        encodings['br'] = compress_brotli
+    encodings['gzip'] = compress_gzip
+    return encodings
+
+
+def negotiate_encoding(accept_encoding, encodings):
+    """
+    Accept-Encoding başlığına göre kullanılacak kodlama (q değeri en yüksek olan); uygun kodlama yoksa None.
+    Başlıkta geçmeyen kodlamalar için "*" q değeri geçerlidir.
+    """
+    weights = {}
+    for item in accept_encoding.split(','):
+        name, _, params = item.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[name] = quality
+    best, best_quality = None, 0.0
+    for name in encodings:
+        quality = weights.get(name, weights.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class ResponseCompressionMiddleware:
+    """
+    RESPONSE_COMPRESSION_MIN_BYTES'tan büyük JSON/CSV/NDJSON yanıtlarını Accept-Encoding'e göre brotli
+    (brotli paketi kuruluysa) veya gzip ile sıkıştırır. Streaming yanıtlar (export, SSE) olduğu gibi geçer:
+    export'un arrow/parquet gövdesi zaten sıkıştırılmıştır, SSE'de ise olayların tamponlanmaması gerekir.
+    Sıkıştırılmış gövde daha büyük çıkarsa yanıt değiştirilmez.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.RESPONSE_COMPRESSION_ENABLED:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+        self.encodings = available_encodings()
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if not response.get('Content-Type', '').startswith(COMPRESSIBLE_CONTENT_TYPES):
+            return response
+        if len(response.content) < settings.RESPONSE_COMPRESSION_MIN_BYTES:
+            return response
+
+        # Önbellekler yanıtı Accept-Encoding'e göre ayırsın (sıkıştırılmamış yanıt için de)
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = negotiate_encoding(request.headers.get('Accept-Encoding', ''), self.encodings)
+        if encoding is None:
+            return response
+        compressed = self.encodings[encoding](response.content)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # Gövde baytları değiştiği için güçlü ETag zayıflatılır (Django GZipMiddleware ile aynı)
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
@@ -0,0 +1,56 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # orjson kurulu değilse DRF'nin JSONRenderer'ı kullanılır
+    orjson = None
+
+# orjson'un DRF'den farklı biçimlediği tipler (datetime'ın milisaniyeye kesilmesi, dataclass) DRF'nin encoder'ına
+# bırakılır; sayı anahtarlı sözlükler json modülü gibi string anahtara çevrilir
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+) if orjson else 0
+
+_drf_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    DRF JSONRenderer'ın orjson ile çalışan karşılığı (varsayılan renderer, REST_FRAMEWORK ayarı).
+    Çıktı kompakt UTF-8'dir; orjson'un tanımadığı tipler DRF'nin JSONEncoder'ı ile çevrilir.
+    Browsable API için girinti istenirse (Accept: application/json; indent=4) DRF'nin yoluna düşer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=_drf_encoder.default, option=ORJSON_OPTIONS)
+
+
+def columnar(data):
+    """
+    Sayfalı liste yanıtını ({"results": [...], ...}) alan başına bir dizi içeren biçime çevirir:
+    {"columns": {"alan": [...]}, "count": n, ...}. Sütun sırası ilk satırın alan sırasıdır.
+    Hata yanıtları gibi results içermeyen veriler olduğu gibi döner.
+    """
+    if not isinstance(data, dict) or not isinstance(data.get('results'), list):
+        return data
+    rows = data['results']
+    names = list(rows[0]) if rows else []
+    columns = {name: [row.get(name) for row in rows] for name in names}
+    return {"columns": columns, "count": len(rows), **{k: v for k, v in data.items() if k != 'results'}}
+
+
+class ColumnarJSONRenderer(ORJSONRenderer):
+    """
+    ?format=columnar ile seçilen renderer: satır listesini sütunlara çevirip JSON olarak yazar.
+    Alan adları satır başına tekrarlanmadığı için büyük sayfalarda yanıt küçülür ve istemci tarafında
+    doğrudan grafik/dataframe'e verilebilir.
+    """
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(columnar(data), accepted_media_type, renderer_context)
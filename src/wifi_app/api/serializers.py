@@ -13,6 +13,8 @@ class WifiSignalSerializer(serializers.Serializer):
     latency_ms = serializers.IntegerField(required=False, default=0)
     packet_loss_rate = serializers.IntegerField(required=False, default=0)
     bssid = serializers.CharField(max_length=100, required=False, default="")
+    # İstemcinin okuma id'si: tekrar gönderilen okuma aynı event_id'yi alır ve bir kez yazılır
+    reading_id = serializers.CharField(max_length=100, required=False)
 
 class HouseRegistrationSerializer(serializers.Serializer):
     house_id = serializers.CharField(max_length=100)
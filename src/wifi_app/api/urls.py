@@ -1,19 +1,48 @@
+from django.conf import settings
 from django.urls import path
+from .async_views import (
+    AsyncIngestWifiSignalView,
+    AsyncIngestWifiSignalBatchView,
+    AsyncRegisterHouseView,
+    AsyncWifiSignalListView,
+    AsyncHouseListView,
+    AsyncHouseRoomMetricsView,
+    AsyncHouseRecommendationsView,
+    AsyncHouseDashboardView
+)
 from .views import (
     IngestWifiSignalView, 
+    IngestWifiSignalBatchView,
     RegisterHouseView, 
     WifiSignalListView,
     HouseListView,
     IngestRecommendationView,
     IngestMetricsView,
     HouseRoomMetricsView,
-    HouseRecommendationsView
+    HouseRecommendationsView,
+    HouseDashboardView,
+    HouseSignalTimeseriesView,
+    FleetSummaryView,
+    SignalStreamView,
+    SignalExportView,
+    MetricsView
 )
+from .fast_views import FastIngestWifiSignalView, FastIngestWifiSignalBatchView
+
+# INGEST_FAST_PATH açıkken sinyal ingest endpoint'leri DRF serializer'ı yerine derlenmiş doğrulayıcıyı kullanır
+if settings.INGEST_FAST_PATH:
+    ingest_signal_view = FastIngestWifiSignalView.as_view()
+    ingest_signal_batch_view = FastIngestWifiSignalBatchView.as_view()
+else:
+    ingest_signal_view = IngestWifiSignalView.as_view()
+    ingest_signal_batch_view = IngestWifiSignalBatchView.as_view()
 
 urlpatterns = [
     # POST
     # Sensörlerden gelen ham sinyalleri kaydeder
-    path('ingest/signal/', IngestWifiSignalView.as_view(), name='ingest-signal'),
+    path('ingest/signal/', ingest_signal_view, name='ingest-signal'),
+    # Sensörlerden gelen sinyalleri toplu halde (JSON dizisi / NDJSON) kaydeder
+    path('ingest/signals/batch/', ingest_signal_batch_view, name='ingest-signal-batch'),
     # Analiz scriptinden gelen oda performans skorlarını kaydeder
     path('ingest/metrics/', IngestMetricsView.as_view(), name='ingest-metrics'),
     # Analiz scriptinden gelen yapay zeka önerilerini kaydeder
@@ -27,6 +56,28 @@ urlpatterns = [
     path('houses/<str:house_id>/metrics/', HouseRoomMetricsView.as_view(), name='house-room-metrics'),
     # Bir ev için oluşturulmuş en son öneri raporunu döner
     path('houses/<str:house_id>/recommendations/', HouseRecommendationsView.as_view(), name='house-recommendations'),   
+    # Ev sayfasının tüm verisini (kayıt, oda metrikleri, öneri, son sinyaller) tek istekte döner
+    path('houses/<str:house_id>/dashboard/', HouseDashboardView.as_view(), name='house-dashboard'),
+    # Bir evin sinyal metriklerini rollup'lardan zaman serisi olarak döner (Dashboard grafikleri için)
+    path('houses/<str:house_id>/timeseries/', HouseSignalTimeseriesView.as_view(), name='house-signal-timeseries'),
+    # Tüm evlerin özetini döner (Dashboard "Tüm Evler" görünümü için)
+    path('fleet/summary/', FleetSummaryView.as_view(), name='fleet-summary'),
     # Ham sinyal listesini döner (Dashboard grafikleri için)
     path('signals/', WifiSignalListView.as_view(), name='get-signals'),
+    # Filtrelenmiş sinyalleri NDJSON/CSV/Arrow/Parquet dosyası olarak stream eder (toplu dışa aktarım)
+    path('export/signals/', SignalExportView.as_view(), name='signal-export'),
+    # Yeni sinyalleri Server-Sent Events ile canlı yayınlar (ASGI)
+    path('stream/signals/', SignalStreamView.as_view(), name='signal-stream'),
+    # Process içi çalışma metrikleri (ingest buffer vb.)
+    path('metrics/', MetricsView.as_view(), name='metrics'),
+
+    # ASYNC (ASGI altında çalışır; aynı endpoint'lerin non-blocking karşılıkları)
+    path('async/ingest/signal/', AsyncIngestWifiSignalView.as_view(), name='async-ingest-signal'),
+    path('async/ingest/signals/batch/', AsyncIngestWifiSignalBatchView.as_view(), name='async-ingest-signal-batch'),
+    path('async/register/house/', AsyncRegisterHouseView.as_view(), name='async-register-house'),
+    path('async/houses/', AsyncHouseListView.as_view(), name='async-house-list'),
+    path('async/houses/<str:house_id>/metrics/', AsyncHouseRoomMetricsView.as_view(), name='async-house-room-metrics'),
+    path('async/houses/<str:house_id>/recommendations/', AsyncHouseRecommendationsView.as_view(), name='async-house-recommendations'),
+    path('async/houses/<str:house_id>/dashboard/', AsyncHouseDashboardView.as_view(), name='async-house-dashboard'),
+    path('async/signals/', AsyncWifiSignalListView.as_view(), name='async-get-signals'),
 ]
\ No newline at end of file
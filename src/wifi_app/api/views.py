@@ -1,13 +1,155 @@
 import io
+import json
+import asyncio
 import qrcode
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.parsers import JSONParser
+from rest_framework.exceptions import ValidationError
+from rest_framework.settings import api_settings
 from rest_framework import status
+from datetime import timezone as dt_timezone
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.views import View
+from bson import ObjectId
 from .serializers import WifiSignalSerializer, HouseRegistrationSerializer,RoomPerformanceSerializer,PerformanceRecommendationSerializer
 from ..domain.events import WifiSignalCaptured, HouseRegistered, RoomPerformanceCalculated, PerformanceRecommendationGenerated
-from ..infrastructure.event_store import MongoEventStore
+from ..domain.events import reading_event_id
+from ..infrastructure.event_store import get_event_store
+from ..infrastructure.cache import VersionedCache, cached_house_response
+from ..infrastructure.live_feed import live_signal_broker
+from ..infrastructure.ingest_buffer import get_ingest_buffer, BufferFull
+from ..infrastructure.metrics import metrics_snapshot
+from ..infrastructure.projections.rollups import RESOLUTIONS
+from ..infrastructure.signal_codec import SIGNAL_LIST_FIELDS, flatten_signal
+from .exporters import EXPORTERS
+from .parsers import NDJSONParser
+from .renderers import ColumnarJSONRenderer
+
+
+def parse_query_time(value):
+    """
+    ISO 8601 zamanı naive UTC datetime'a çevirir (event zaman damgalarıyla aynı format).
+    """
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"Invalid datetime: {value}")
+    if timezone.is_aware(parsed):
+        parsed = timezone.make_naive(parsed, dt_timezone.utc)
+    return parsed
+
+def idempotency_key(headers, index=None):
+    """
+    Idempotency-Key başlığı; batch isteklerinde kayıt sırasıyla birleştirilir (reading_id'si olmayan kayıtlar için).
+    """
+    key = headers.get('Idempotency-Key')
+    if key and index is not None:
+        return f"{key}/{index}"
+    return key
+
+def build_signal_event(data, idempotency_key=None):
+    """
+    Doğrulanmış sinyal verisinden WifiSignalCaptured eventi üretir.
+    reading_id (yoksa idempotency_key) verilmişse event_id ev + okuma id'sinden deterministik üretilir.
+    """
+    event = WifiSignalCaptured(
+        house_id=data['house_id'],
+        room=data['room'],
+        rssi=data['rssi'],
+        device_id=data['device_id'],
+        band=data['band'],
+        channel=data['channel'],
+        ssid=data['ssid'],
+        link_speed_mbps=data.get('link_speed_mbps', 0),
+        latency_ms=data.get('latency_ms', 0),
+        packet_loss_rate=data.get('packet_loss_rate', 0),
+        bssid=data.get('bssid', "")
+    )
+    reading_id = data.get('reading_id') or idempotency_key
+    if reading_id:
+        event.event_id = reading_event_id(event.house_id, reading_id)
+    return event
+
+def ingest_result(event, written):
+    """
+    Tekil ingest yanıtı (gövde, status). Daha önce yazılmış okuma (tekrar gönderim) 200 ile başarı sayılır.
+    """
+    if written:
+        return {"status": "success", "event_id": event.event_id}, status.HTTP_201_CREATED
+    return {"status": "duplicate", "event_id": event.event_id}, status.HTTP_200_OK
+
+def serialize_signal(evt):
+    """
+    WifiSignalCaptured event dokümanını API'nin döndüğü düz sinyal formatına çevirir.
+    """
+    return flatten_signal(evt)
+
+def buffered_ingest_result(event):
+    """
+    Sinyali write-behind buffer'a bırakır ve (yanıt gövdesi, status) döner. Buffer doluysa 503 döner.
+    enqueue modunda 202 (kuyruğa alındı), flush modunda yazılana kadar bekleyip 201 döner.
+    """
+    wait_for_flush = settings.INGEST_BUFFER_DURABILITY == 'flush'
+    try:
+        ticket = get_ingest_buffer().submit(event, wait_for_flush=wait_for_flush)
+    except BufferFull:
+        return {"error": "Ingest buffer is full, retry later."}, status.HTTP_503_SERVICE_UNAVAILABLE
+
+    if ticket is None:
+        return {"status": "accepted", "event_id": event.event_id}, status.HTTP_202_ACCEPTED
+
+    if not ticket.wait(settings.INGEST_BUFFER_FLUSH_TIMEOUT_MS / 1000) or ticket.error is not None:
+        return {"error": "Signal could not be persisted in time.", "event_id": event.event_id}, \
+            status.HTTP_503_SERVICE_UNAVAILABLE
+    return {"status": "success", "event_id": event.event_id}, status.HTTP_201_CREATED
+
+def buffered_ingest_response(event):
+    """
+    buffered_ingest_result'ın DRF yanıtı; 503 yanıtlarına Retry-After eklenir.
+    """
+    data, response_status = buffered_ingest_result(event)
+    response = Response(data, status=response_status)
+    if response_status == status.HTTP_503_SERVICE_UNAVAILABLE:
+        response['Retry-After'] = str(settings.INGEST_BUFFER_RETRY_AFTER_SECONDS)
+    return response
+
+def batch_ingest_result(events, rejected):
+    """
+    Toplu ingest sonucunu (yanıt gövdesi, status) olarak döner; geçerli eventler tek insert_many ile yazılır.
+    Daha önce yazılmış okumalar kabul edilmiş sayılır, duplicates alanında ayrıca belirtilir.
+    """
+    written = []
+    if events:
+        store = get_event_store()
+        written = store.append_many(events)
+    return batch_result(events, written, rejected)
+
+def batch_result(events, written, rejected):
+    """
+    Yazılmış (written) dokümanlara göre toplu ingest yanıtı (gövde, status); async view da kullanır.
+    """
+    response_data = {
+        "accepted": len(events),
+        "duplicates": len(events) - len(written),
+        "rejected_count": len(rejected),
+        "rejected": rejected,
+        "event_ids": [event.event_id for event in events]
+    }
+    if not events:
+        response_status = status.HTTP_400_BAD_REQUEST if rejected else status.HTTP_200_OK
+    elif rejected:
+        response_status = status.HTTP_207_MULTI_STATUS
+    else:
+        response_status = status.HTTP_201_CREATED
+    return response_data, response_status
 
 class IngestWifiSignalView(APIView):
     """
@@ -16,27 +158,48 @@ class IngestWifiSignalView(APIView):
     def post(self, request):
         serializer = WifiSignalSerializer(data=request.data)
         if serializer.is_valid():
-            data = serializer.validated_data
-            event = WifiSignalCaptured(
-                house_id=data['house_id'],
-                room=data['room'],
-                rssi=data['rssi'],
-                device_id=data['device_id'],
-                band=data['band'],
-                channel=data['channel'],
-                ssid=data['ssid'],
-                link_speed_mbps=data.get('link_speed_mbps', 0),
-                latency_ms=data.get('latency_ms', 0),
-                packet_loss_rate=data.get('packet_loss_rate', 0),
-                bssid=data.get('bssid', "")
-            )
-            store = MongoEventStore()
-            store.append(event)
-            
-            return Response({"status": "success", "event_id": event.event_id}, status=status.HTTP_201_CREATED)
+            event = build_signal_event(serializer.validated_data, idempotency_key(request.headers))
+            if settings.INGEST_BUFFER_ENABLED:
+                return buffered_ingest_response(event)
+
+            store = get_event_store()
+            response_data, response_status = ingest_result(event, store.append(event))
+            return Response(response_data, status=response_status)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+class IngestWifiSignalBatchView(APIView):
+    """
+    [POST] Birden fazla sinyali (JSON dizisi veya NDJSON) tek istekte karşılar.
+    Geçerli kayıtlar tek bir insert_many ile yazılır, reddedilenler index ve hata detayıyla döner.
+    """
+    parser_classes = [JSONParser, NDJSONParser]
+
+    def post(self, request):
+        items = request.data
+        if not isinstance(items, list):
+            return Response({"error": "Expected a list of signals."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > settings.INGEST_BATCH_MAX_SIZE:
+            return Response(
+                {"error": f"Batch size exceeds limit ({settings.INGEST_BATCH_MAX_SIZE})."},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        # Tek serializer örneği tüm kayıtlar için tekrar kullanılır (field kurulumu bir kez yapılır)
+        serializer = WifiSignalSerializer()
+        events = []
+        rejected = []
+        for index, item in enumerate(items):
+            try:
+                data = serializer.run_validation(item)
+            except ValidationError as exc:
+                rejected.append({"index": index, "errors": exc.detail})
+                continue
+            events.append(build_signal_event(data, idempotency_key(request.headers, index)))
+
+        response_data, response_status = batch_ingest_result(events, rejected)
+        return Response(response_data, status=response_status)
+
 class RegisterHouseView(APIView):
     """
     [POST] Yeni bir evi sisteme tanımlar (HouseRegistered eventi oluşturur).
@@ -53,7 +216,7 @@ class RegisterHouseView(APIView):
                 area_sqm=data['area_sqm']
             )
             
-            store = MongoEventStore()
+            store = get_event_store()
             store.append(event)
             
             return Response({"status": "house registered", "event_id": event.event_id}, status=status.HTTP_201_CREATED)
@@ -62,66 +225,148 @@ class RegisterHouseView(APIView):
  
 class WifiSignalListView(APIView):
     """
-    [GET] Wifi sinyallerini Cursor Pagination ile döner.
+    [GET] Wifi sinyallerini keyset (cursor) pagination ile döner.
+    Parametreler: house_id, since, until (ISO 8601), room, band, device_id, order (desc/asc),
+    fields (virgülle ayrılmış alan listesi; mongo_id her zaman döner), limit (en fazla 500), cursor
     Format: { "results": [...], "next_cursor": "xyz" }
+    ?format=columnar: { "columns": {"rssi": [...], ...}, "count": n, "next_cursor": "xyz" }
     """
+    MAX_LIMIT = 500
+    renderer_classes = [*api_settings.DEFAULT_RENDERER_CLASSES, ColumnarJSONRenderer]
+
     def get(self, request):
-        store = MongoEventStore()
-        house_id_param = request.query_params.get('house_id', None)
-        limit_param = request.query_params.get('limit', 50)
-        cursor_param = request.query_params.get('cursor', None)
-        
         try:
-            limit = int(limit_param)
-            if limit > 500: limit = 500
+            query = self.parse_query(request.query_params)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        store = get_event_store()
+        results = store.find_signals(**query)
+
+        next_cursor = None
+        if results and len(results) >= query['limit']:
+            next_cursor = results[-1]['mongo_id']
+
+        return Response({"results": results, "next_cursor": next_cursor}, status=status.HTTP_200_OK)
+
+    @classmethod
+    def parse_query(cls, params):
+        """
+        Query parametrelerini MongoEventStore.find_signals argümanlarına çevirir; geçersiz değerde ValueError.
+        """
+        try:
+            limit = min(int(params.get('limit', 50)), cls.MAX_LIMIT)
         except ValueError:
             limit = 50
-        try:
-            raw_events = store.get_recent_signals(limit=limit, house_id=house_id_param, cursor=cursor_param)
-        except Exception as e:
-            return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-        clean_data = []
-        last_id = None 
-        for evt in raw_events:
-            payload = evt.get('payload', {})
-            mongo_id = evt.get('_id')
-            last_id = mongo_id 
-
-            item = {
-                "mongo_id": mongo_id,
-                "event_id": str(evt.get('event_id')),
-                "timestamp": evt.get('timestamp'),
-                "house_id": payload.get('house_id'),
-                "room": payload.get('room'),
-                "rssi": payload.get('rssi'),
-                "ssid": payload.get('ssid'),
-                "band": payload.get('band'),
-                "device_id": payload.get('device_id'),
-                "link_speed_mbps": payload.get('link_speed_mbps', 0),
-                "latency_ms": payload.get('latency_ms', 0),
-                "packet_loss_rate": payload.get('packet_loss_rate', 0),
-                "bssid": payload.get('bssid', "")
-            }
-            clean_data.append(item)
+        if limit < 1:
+            raise ValueError("limit must be a positive integer")
 
-        next_cursor = None
-        if len(clean_data) >= limit and last_id:
-            next_cursor = last_id
-            
-        response_data = {
-            "results": clean_data,
-            "next_cursor": next_cursor
-        }
+        order = params.get('order', 'desc')
+        if order not in ('desc', 'asc'):
+            raise ValueError("order must be one of: desc, asc")
+
+        cursor = params.get('cursor') or None
+        if cursor is not None:
+            if not ObjectId.is_valid(cursor):
+                raise ValueError(f"Invalid cursor: {cursor}")
+            cursor = ObjectId(cursor)
 
-        return Response(response_data, status=status.HTTP_200_OK)
+        fields = None
+        if params.get('fields'):
+            fields = [name.strip() for name in params['fields'].split(',') if name.strip()]
+            unknown = [name for name in fields if name not in SIGNAL_LIST_FIELDS]
+            if unknown:
+                raise ValueError(
+                    f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(SIGNAL_LIST_FIELDS)}"
+                )
+
+        since = parse_query_time(params.get('since'))
+        until = parse_query_time(params.get('until'))
+        if since and until and since >= until:
+            raise ValueError("since must be earlier than until")
+
+        return {
+            "house_id": params.get('house_id') or None,
+            "since": since,
+            "until": until,
+            "room": params.get('room') or None,
+            "band": params.get('band') or None,
+            "device_id": params.get('device_id') or None,
+            "order": order,
+            "cursor": cursor,
+            "limit": limit,
+            "fields": fields,
+        }
     
+class SignalExportView(View):
+    """
+    [GET] Sinyalleri sayfalama olmadan, Mongo cursor'ından büyük batch'lerle okuyup dosya olarak stream eder.
+    Parametreler: format (ndjson/csv/arrow/parquet), /api/signals/ filtreleri (house_id, since, until, room,
+    band, device_id, fields, cursor), order (varsayılan asc), limit (opsiyonel, sınırsız)
+    DRF'nin ?format= parametresiyle çakışmaması için düz Django View'dır.
+    """
+    def get(self, request):
+        export_format = request.GET.get('format', 'ndjson')
+        exporter_class = EXPORTERS.get(export_format)
+        if exporter_class is None:
+            return JsonResponse(
+                {"error": f"format must be one of: {', '.join(EXPORTERS)}"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if not exporter_class.available():
+            return JsonResponse(
+                {"error": f"format '{export_format}' requires pyarrow on the server"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            query = WifiSignalListView.parse_query(request.GET)
+        except ValueError as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if not request.GET.get('order'):
+            query['order'] = 'asc'
+        limit = request.GET.get('limit')
+        if limit and (not limit.isdigit() or int(limit) < 1):
+            return JsonResponse({"error": "limit must be a positive integer"}, status=status.HTTP_400_BAD_REQUEST)
+        query['limit'] = int(limit) if limit else None
+
+        batch_size = settings.EXPORT_BATCH_SIZE
+        exporter = exporter_class(query['fields'] or SIGNAL_LIST_FIELDS, batch_size=batch_size)
+        rows = get_event_store().iter_signals(**query, batch_size=batch_size)
+
+        response = StreamingHttpResponse(exporter.stream(rows), content_type=exporter.content_type)
+        filename = f"signals-{query['house_id'] or 'all'}.{exporter.extension}"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
 class HouseListView(APIView):
     """
-    [GET] Kayıtlı evlerin listesini döner
+    [GET] Kayıtlı evlerin listesini döner.
+    Liste registry versiyonuna göre önbelleklenir; ETag / If-None-Match ile değişmeyen liste 304 döner.
     """
+    cache = VersionedCache()
+
     def get(self, request):
-        store = MongoEventStore()
-        houses = store.get_registered_houses()
+        store = get_event_store()
+        version = store.get_registry_version()
+        etag = f'"houses-{version}"'
+
+        if etag in request.headers.get('If-None-Match', ''):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response['ETag'] = etag
+            return response
+
+        dropdown_data = self.cache.get(version)
+        if dropdown_data is None:
+            dropdown_data = self.build_dropdown(store.get_registered_houses())
+            self.cache.set(version, dropdown_data)
+
+        response = Response(dropdown_data, status=status.HTTP_200_OK)
+        response['ETag'] = etag
+        return response
+
+    @staticmethod
+    def build_dropdown(houses):
         dropdown_data = []
         dropdown_data.append({
             "value": "", 
@@ -133,8 +378,7 @@ class HouseListView(APIView):
                 "value": h.get('house_id'),
                 "label": f"{h.get('owner_name')} - {h.get('house_type')}"
             })
-            
-        return Response(dropdown_data, status=status.HTTP_200_OK)
+        return dropdown_data
     
 class IngestMetricsView(APIView):
     """
@@ -156,7 +400,7 @@ class IngestMetricsView(APIView):
                 avg_latency_ms=data['avg_latency_ms'],
                 packet_loss_avg=data['packet_loss_avg']
             )
-            store = MongoEventStore()
+            store = get_event_store()
             store.append(event)
             return Response({"status": "metrics saved"}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -175,7 +419,7 @@ class IngestRecommendationView(APIView):
                 global_recommendation_text=data['global_recommendation_text'],
                 global_severity=data['global_severity']
             )
-            store = MongoEventStore()
+            store = get_event_store()
             store.append(event)
             return Response({"status": "recommendation saved"}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
@@ -183,21 +427,157 @@ class IngestRecommendationView(APIView):
 class HouseRoomMetricsView(APIView):
     """
     [GET] Bir evin odalarındaki en son performans verilerini döner.
-    Artık EventStore içindeki hazır metodu kullanıyor.
+    Artık EventStore içindeki hazır metodu kullanıyor. Her oda gecikme/RSSI p50/p90/p99 (percentiles) içerir.
+    Yanıt önbellekten gelir; yeni RoomPerformanceCalculated eventi önbelleği geçersiz kılar.
     """
     def get(self, request, house_id):
-        store = MongoEventStore()        
-        rooms_metrics = store.get_house_room_metrics(house_id)        
+        rooms_metrics = cached_house_response(
+            'metrics', house_id, lambda: get_event_store().get_house_room_metrics(house_id)
+        )
         return Response(rooms_metrics, status=status.HTTP_200_OK)
 
 class HouseRecommendationsView(APIView):
     """
     [GET] Bir ev için oluşturulmuş en son öneri raporunu döner.
+    Yanıt önbellekten gelir; yeni PerformanceRecommendationGenerated eventi önbelleği geçersiz kılar.
     """
     def get(self, request, house_id):
-        store = MongoEventStore()
-        recommendation = store.get_latest_recommendation(house_id)
+        recommendation = cached_house_response(
+            'recommendations', house_id, lambda: get_event_store().get_latest_recommendation(house_id)
+        )
         
         if recommendation:
             return Response(recommendation, status=status.HTTP_200_OK)
         return Response(None, status=status.HTTP_204_NO_CONTENT)
+
+def house_dashboard_found(dashboard):
+    """
+    Evin kaydı veya herhangi bir verisi var mı (yoksa dashboard 404 döner).
+    """
+    return bool(
+        dashboard['house'] or dashboard['rooms'] or dashboard['recommendation'] or dashboard['signals']['latest']
+    )
+
+class HouseDashboardView(APIView):
+    """
+    [GET] Ev sayfasının tüm verisini tek istekte döner: kayıt bilgisi, oda metrikleri (yüzdeliklerle),
+    son öneri raporu ve son sinyallerin özeti. Sorgular sunucuda paralel çalışır.
+    Yanıt önbellekten gelir; evin yeni kayıt/oda metriği/öneri eventi önbelleği geçersiz kılar.
+    """
+    def get(self, request, house_id):
+        dashboard = cached_house_response(
+            'dashboard', house_id, lambda: get_event_store().get_house_dashboard(house_id)
+        )
+        if not house_dashboard_found(dashboard):
+            return Response({"error": "House not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(dashboard, status=status.HTTP_200_OK)
+
+class HouseSignalTimeseriesView(APIView):
+    """
+    [GET] Bir evin sinyal metriklerini önceden hesaplanmış rollup'lardan zaman serisi olarak döner.
+    Parametreler: resolution (1m/1h/1d), since, until (ISO 8601), room, band
+    """
+    # Zaman aralığı verilmezse çözünürlüğe göre varsayılan pencere
+    DEFAULT_WINDOWS = {'1m': 6 * 60, '1h': 7 * 24, '1d': 90}
+    MAX_POINTS = 10000
+
+    def get(self, request, house_id):
+        resolution = request.query_params.get('resolution', '1h')
+        if resolution not in RESOLUTIONS:
+            return Response(
+                {"error": f"resolution must be one of: {', '.join(RESOLUTIONS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        width = RESOLUTIONS[resolution]
+
+        try:
+            until = parse_query_time(request.query_params.get('until')) or timezone.now().replace(tzinfo=None)
+            since = parse_query_time(request.query_params.get('since')) \
+                or until - width * self.DEFAULT_WINDOWS[resolution]
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if since >= until:
+            return Response({"error": "since must be earlier than until"}, status=status.HTTP_400_BAD_REQUEST)
+        if (until - since) / width > self.MAX_POINTS:
+            return Response({"error": "Time range too large for this resolution"}, status=status.HTTP_400_BAD_REQUEST)
+
+        store = get_event_store()
+        points = store.get_signal_timeseries(
+            house_id, resolution, since, until,
+            room=request.query_params.get('room'),
+            band=request.query_params.get('band')
+        )
+        return Response({
+            "house_id": house_id,
+            "resolution": resolution,
+            "since": since,
+            "until": until,
+            "points": points
+        }, status=status.HTTP_200_OK)
+
+class FleetSummaryView(APIView):
+    """
+    [GET] Tüm evlerin özetini döner: son önerilerin önem derecesi sayıları, oda skoru histogramları,
+    ev tipi başına ortalamalar ve en kötü oda listesi. Evlerin eventleri taranmaz; fleet projeksiyonunun
+    artımlı sayaçları okunur.
+    Parametre: worst (en kötü oda sayısı, varsayılan 10, en fazla 100)
+    """
+    DEFAULT_WORST = 10
+    MAX_WORST = 100
+
+    def get(self, request):
+        worst = request.query_params.get('worst')
+        if worst is not None and (not worst.isdigit() or int(worst) > self.MAX_WORST):
+            return Response(
+                {"error": f"worst must be an integer between 0 and {self.MAX_WORST}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        store = get_event_store()
+        summary = store.get_fleet_summary(int(worst) if worst is not None else self.DEFAULT_WORST)
+        return Response(summary, status=status.HTTP_200_OK)
+
+class SignalStreamView(View):
+    """
+    [GET] Yeni gelen Wi-Fi sinyallerini Server-Sent Events olarak canlı yayınlar (ASGI gerektirir).
+    Parametre: house_id (opsiyonel). Yavaş istemcilerde atlanan kayıt sayısı 'dropped' eventi ile bildirilir.
+    """
+    HEARTBEAT_SECONDS = 15
+
+    async def get(self, request):
+        if not isinstance(request, ASGIRequest):
+            return JsonResponse(
+                {"error": "Live stream requires the ASGI server (config.asgi:application)."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+
+        subscription = live_signal_broker.subscribe(house_id=request.GET.get('house_id') or None)
+        response = StreamingHttpResponse(self.events(subscription), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    async def events(self, subscription):
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    evt = await asyncio.wait_for(subscription.queue.get(), timeout=self.HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                dropped = subscription.take_dropped()
+                if dropped:
+                    yield f"event: dropped\ndata: {json.dumps({'count': dropped})}\n\n"
+
+                item = serialize_signal(evt)
+                yield f"id: {item['mongo_id']}\ndata: {json.dumps(item, cls=DjangoJSONEncoder)}\n\n"
+        finally:
+            live_signal_broker.unsubscribe(subscription)
+
+class MetricsView(APIView):
+    """
+    [GET] Process içi çalışma metriklerini döner (ingest buffer kuyruk derinliği, flush süreleri vb.).
+    """
+    def get(self, request):
+        return Response(metrics_snapshot(), status=status.HTTP_200_OK)
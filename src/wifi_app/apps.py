@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+
+
+class WifiAppConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'wifi_app'
+
+    def ready(self):
+        from .infrastructure.event_store import MongoEventStore
+        from .infrastructure.projections import project_appended_events
+        from .infrastructure.live_feed import live_signal_broker
+        from .infrastructure.cache import invalidate_house_cache
+
+        MongoEventStore.subscribe(project_appended_events)
+        # Önbellek, projeksiyonlar yazıldıktan sonra geçersiz kılınır
+        MongoEventStore.subscribe(invalidate_house_cache)
+        MongoEventStore.subscribe(live_signal_broker.publish_appended)
@@ -0,0 +1,114 @@
+from .analysis import SIGNAL_SUM_FIELDS
+
+
+class HouseAggregate:
+    """
+    Bir evin event akışından kurulan durumu: kayıt bilgisi, oda bazlı sinyal toplamları, odaların en son
+    performans metrikleri ve en son öneri raporu.
+
+    apply() sıradan bağımsızdır (toplamlar birikir, "en son" kayıtlar timestamp'e göre seçilir); böylece
+    snapshot'tan sonra kalan eventler hangi sırayla okunursa okunsun aynı durum elde edilir.
+    version, uygulanan eventlerin en büyük aggregate versiyonudur.
+    """
+    event_types = (
+        'HouseRegistered', 'WifiSignalCaptured', 'RoomPerformanceCalculated', 'PerformanceRecommendationGenerated'
+    )
+
+    def __init__(self, house_id):
+        self.house_id = house_id
+        self.version = 0
+        self.event_count = 0
+        self.house = None
+        self.registered_at = None
+        # oda -> {"count", "rssi_sum", "latency_sum", "loss_sum", "speed_sum", "last_signal_at"}
+        self.rooms = {}
+        # oda -> {"timestamp", "payload"}
+        self.room_metrics = {}
+        self.recommendation = None
+
+    def apply(self, doc):
+        handler = self._handlers.get(doc.get('event_type'))
+        if handler is None:
+            return
+        handler(self, doc.get('payload', {}), doc.get('timestamp'))
+        self.event_count += 1
+        version = doc.get('version')
+        if version is not None and version > self.version:
+            self.version = version
+
+    def _house_registered(self, payload, timestamp):
+        if self.registered_at is None or timestamp >= self.registered_at:
+            self.house = payload
+            self.registered_at = timestamp
+
+    def _signal_captured(self, payload, timestamp):
+        room = self.rooms.get(payload.get('room'))
+        if room is None:
+            room = self.rooms[payload.get('room')] = {
+                "count": 0, **{field: 0 for field in SIGNAL_SUM_FIELDS.values()}, "last_signal_at": None
+            }
+        room["count"] += 1
+        for field, state_field in SIGNAL_SUM_FIELDS.items():
+            room[state_field] += payload.get(field) or 0
+        if room["last_signal_at"] is None or timestamp > room["last_signal_at"]:
+            room["last_signal_at"] = timestamp
+
+    def _room_performance_calculated(self, payload, timestamp):
+        current = self.room_metrics.get(payload.get('room_name'))
+        if current is None or timestamp >= current["timestamp"]:
+            self.room_metrics[payload.get('room_name')] = {"timestamp": timestamp, "payload": payload}
+
+    def _recommendation_generated(self, payload, timestamp):
+        if self.recommendation is None or timestamp >= self.recommendation["timestamp"]:
+            self.recommendation = {"timestamp": timestamp, "payload": payload}
+
+    _handlers = {
+        'HouseRegistered': _house_registered,
+        'WifiSignalCaptured': _signal_captured,
+        'RoomPerformanceCalculated': _room_performance_calculated,
+        'PerformanceRecommendationGenerated': _recommendation_generated,
+    }
+
+    def room_averages(self):
+        """
+        Oda başına sinyal ortalamaları ({oda: {"count", "avg_rssi", "avg_latency_ms", ...}}).
+        """
+        averages = {}
+        for room, stats in self.rooms.items():
+            count = stats["count"] or 1
+            averages[room] = {
+                "count": stats["count"],
+                "avg_rssi": stats["rssi_sum"] / count,
+                "avg_latency_ms": stats["latency_sum"] / count,
+                "avg_packet_loss": stats["loss_sum"] / count,
+                "avg_link_speed_mbps": stats["speed_sum"] / count,
+                "last_signal_at": stats["last_signal_at"],
+            }
+        return averages
+
+    def to_state(self):
+        """
+        Snapshot dokümanına yazılacak durum. Oda adları Mongo alan adı olarak kullanılmaz (nokta/$ içerebilir).
+        """
+        return {
+            "event_count": self.event_count,
+            "house": self.house,
+            "registered_at": self.registered_at,
+            "rooms": [{"room": room, **stats} for room, stats in self.rooms.items()],
+            "room_metrics": [{"room": room, **metrics} for room, metrics in self.room_metrics.items()],
+            "recommendation": self.recommendation,
+        }
+
+    @classmethod
+    def from_state(cls, house_id, version, state):
+        aggregate = cls(house_id)
+        aggregate.version = version
+        aggregate.event_count = state.get('event_count', 0)
+        aggregate.house = state.get('house')
+        aggregate.registered_at = state.get('registered_at')
+        aggregate.rooms = {item.pop('room'): item for item in (dict(r) for r in state.get('rooms', []))}
+        aggregate.room_metrics = {
+            item.pop('room'): item for item in (dict(m) for m in state.get('room_metrics', []))
+        }
+        aggregate.recommendation = state.get('recommendation')
+        return aggregate
@@ -0,0 +1,162 @@
+import numpy as np
+from .events import RoomPerformanceCalculated, PerformanceRecommendationGenerated
+
+# Oda istatistiklerinde tutulan toplam alanları (sinyal payload alanı -> state alanı)
+SIGNAL_SUM_FIELDS = {
+    'rssi': 'rssi_sum',
+    'latency_ms': 'latency_sum',
+    'packet_loss_rate': 'loss_sum',
+    'link_speed_mbps': 'speed_sum',
+}
+
+ROOM_RECOMMENDATIONS = {
+    'NONE': {"action": "NONE", "text": "Bağlantı kalitesi mükemmel.", "severity": "INFO"},
+    'CHECK_NODE': {"action": "CHECK_NODE", "text": "Mesh düğümü arızalı olabilir, kontrol edin.", "severity": "CRITICAL"},
+    'MESH_NEEDED': {"action": "MESH_NEEDED", "text": "Sinyal kritik seviyede. Mesh sistemi veya kablolu AP şart.", "severity": "CRITICAL"},
+    'EXTENDER': {"action": "EXTENDER", "text": "Sinyal zayıf. Menzil genişletici (Extender) önerilir.", "severity": "WARNING"},
+    'OPTIMIZE': {"action": "OPTIMIZE", "text": "Kanal çakışması olabilir, modem ayarlarını kontrol edin.", "severity": "INFO"},
+}
+
+
+def group_sums(group_index, n_groups, columns):
+    """
+    Her satırın grup index'ine göre sütun toplamlarını ve satır sayılarını hesaplar (np.bincount).
+    columns: {alan_adi: np.ndarray}
+    """
+    counts = np.bincount(group_index, minlength=n_groups)
+    sums = {
+        name: np.bincount(group_index, weights=values, minlength=n_groups)
+        for name, values in columns.items()
+    }
+    return counts, sums
+
+
+def calculate_performance_scores(avg_rssi, avg_latency, avg_loss):
+    """
+    Oda ortalamalarına göre gaming/streaming/video call skorlarını vektörel olarak hesaplar.
+    Bantlar datagenerator'daki kurallarla aynıdır; bant içindeki rastgele değer yerine
+    metriğe göre doğrusal interpolasyon kullanılır (aynı veri her zaman aynı skoru verir).
+    """
+    avg_rssi = np.asarray(avg_rssi, dtype=float)
+    avg_latency = np.asarray(avg_latency, dtype=float)
+    avg_loss = np.asarray(avg_loss, dtype=float)
+
+    # 1. Gaming Score: Ping ve paket kaybı önemli
+    gaming = np.select(
+        [
+            (avg_latency < 30) & (avg_loss < 1),
+            avg_latency < 60,
+            avg_latency < 100,
+        ],
+        [
+            np.clip(100 - avg_latency / 30 * 10, 90, 100),
+            np.clip(89 - (avg_latency - 30) / 30 * 19, 70, 89),
+            np.clip(69 - (avg_latency - 60) / 40 * 29, 40, 69),
+        ],
+        default=np.clip(39 - (avg_latency - 100) / 200 * 29, 10, 39)
+    )
+
+    # 2. Streaming Score: Sinyal gücü önemli
+    streaming = np.select(
+        [avg_rssi > -60, avg_rssi > -75],
+        [
+            np.clip(90 + (avg_rssi + 60) / 30 * 10, 90, 100),
+            np.clip(70 + (avg_rssi + 75) / 15 * 19, 70, 89),
+        ],
+        default=np.clip(30 + (avg_rssi + 95) / 20 * 30, 30, 60)
+    )
+
+    # 3. Video Call Score
+    video_call = (gaming + streaming) / 2
+
+    gaming = gaming.astype(int)
+    streaming = streaming.astype(int)
+    video_call = video_call.astype(int)
+    overall = ((gaming + streaming + video_call) / 3).astype(int)
+    return gaming, streaming, video_call, overall
+
+
+def recommendation_codes(avg_rssi, is_mesh):
+    """
+    Oda ortalama RSSI değerlerine göre öneri kodlarını (ROOM_RECOMMENDATIONS anahtarları) döner.
+    """
+    avg_rssi = np.asarray(avg_rssi, dtype=float)
+    is_mesh = np.asarray(is_mesh, dtype=bool)
+    return np.select(
+        [
+            avg_rssi > -65,
+            (avg_rssi < -80) & is_mesh,
+            avg_rssi < -80,
+            avg_rssi < -70,
+        ],
+        ['NONE', 'CHECK_NODE', 'MESH_NEEDED', 'EXTENDER'],
+        default='OPTIMIZE'
+    )
+
+
+def global_recommendation(room_recommendations):
+    """
+    Oda önerilerinden evin genel değerlendirmesini (metin, önem derecesi) üretir.
+    """
+    critical_rooms = [r for r, v in room_recommendations.items() if v["severity"] == "CRITICAL"]
+
+    if len(critical_rooms) > 0:
+        text = f"Dikkat! {', '.join(critical_rooms)} odalarında ciddi kapsama sorunu tespit edildi. Acil optimizasyon gerekli."
+        return text, "CRITICAL"
+    if any(v["severity"] == "WARNING" for v in room_recommendations.values()):
+        return "Genel performans iyi ancak bazı kör noktalar mevcut. İyileştirme yapılabilir.", "WARNING"
+    return "Tebrikler! Ev genelinde Wi-Fi performansı mükemmel seviyede.", "INFO"
+
+
+def analyze_rooms(house_ids, rooms, counts, sums, house_types):
+    """
+    Oda bazlı toplam istatistiklerinden analiz eventlerini üretir.
+
+    house_ids, rooms: oda satırlarının ev ve oda adları (aynı uzunlukta diziler)
+    counts: oda başına sinyal sayısı, sums: {state_alani: oda başına toplam}
+    house_types: {house_id: house_type}
+    Dönen liste: her oda için RoomPerformanceCalculated, her ev için PerformanceRecommendationGenerated.
+    """
+    counts = np.asarray(counts, dtype=float)
+    valid = counts > 0
+    safe_counts = np.where(valid, counts, 1)
+    avg_rssi = np.asarray(sums['rssi_sum'], dtype=float) / safe_counts
+    avg_latency = np.asarray(sums['latency_sum'], dtype=float) / safe_counts
+    avg_loss = np.asarray(sums['loss_sum'], dtype=float) / safe_counts
+    avg_speed = np.asarray(sums['speed_sum'], dtype=float) / safe_counts
+
+    # Ortalamalar datagenerator'daki gibi tamsayıya çevrilerek skorlanır
+    gaming, streaming, video_call, overall = calculate_performance_scores(
+        avg_rssi.astype(int), avg_latency.astype(int), avg_loss
+    )
+    is_mesh = np.array(["Mesh" in (house_types.get(h) or "") for h in house_ids], dtype=bool)
+    codes = recommendation_codes(avg_rssi.astype(int), is_mesh)
+
+    events = []
+    room_recommendations = {}
+    for i in np.flatnonzero(valid):
+        house_id = house_ids[i]
+        room = rooms[i]
+        events.append(RoomPerformanceCalculated(
+            house_id=house_id,
+            room_name=room,
+            gaming_score=int(gaming[i]),
+            streaming_score=int(streaming[i]),
+            video_call_score=int(video_call[i]),
+            overall_rating=int(overall[i]),
+            avg_signal_dbm=int(avg_rssi[i]),
+            avg_speed_mbps=int(avg_speed[i]),
+            avg_latency_ms=int(avg_latency[i]),
+            packet_loss_avg=round(float(avg_loss[i]), 2)
+        ))
+        room_recommendations.setdefault(house_id, {})[room] = dict(ROOM_RECOMMENDATIONS[codes[i]])
+
+    for house_id, recommendations in room_recommendations.items():
+        text, severity = global_recommendation(recommendations)
+        events.append(PerformanceRecommendationGenerated(
+            house_id=house_id,
+            room_recommendations=recommendations,
+            global_recommendation_text=text,
+            global_severity=severity
+        ))
+    return events
@@ -0,0 +1,265 @@
+import math
+from .events import SignalDegradationDetected, reading_event_id
+
+# Metrik -> kural. direction: -1 değer düştüğünde (RSSI), +1 yükseldiğinde (gecikme, paket kaybı) bozulma.
+# min_delta: z-skoru ne olursa olsun bozulma sayılması için gereken en küçük fark (gürültüsüz odalarda
+# küçük oynamaların alarm üretmemesi için). quantile: eşiğin altına inemeyeceği yüzdelik (P² tahmini).
+DEGRADATION_RULES = {
+    'rssi': {"direction": -1, "min_delta": 10, "quantile": None, "severity": "WARNING"},
+    'latency_ms': {"direction": 1, "min_delta": 40, "quantile": 0.95, "severity": "WARNING"},
+    'packet_loss_rate': {"direction": 1, "min_delta": 5, "quantile": None, "severity": "CRITICAL"},
+}
+
+
+class P2Quantile:
+    """
+    P² algoritması (Jain & Chlamtac) ile tek bir yüzdeliğin sabit bellekli tahmini: 5 işaretçinin
+    yüksekliği ve konumu tutulur, her yeni değerde parabolik interpolasyonla güncellenir.
+    """
+    __slots__ = ('p', 'heights', 'positions', 'desired')
+
+    def __init__(self, p, heights=None, positions=None, desired=None):
+        self.p = p
+        self.heights = heights if heights is not None else []
+        self.positions = positions if positions is not None else [0, 1, 2, 3, 4]
+        self.desired = desired if desired is not None else [0, 2 * p, 4 * p, 2 + 2 * p, 4]
+
+    def add(self, x):
+        q = self.heights
+        if len(q) < 5:
+            q.append(x)
+            if len(q) == 5:
+                q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self.positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        p = self.p
+        desired = self.desired
+        desired[1] += p / 2
+        desired[2] += p
+        desired[3] += (1 + p) / 2
+        desired[4] += 1
+
+        for i in (1, 2, 3):
+            d = desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                # Parabolik tahmin işaretçi sırasını bozuyorsa doğrusal tahmine dönülür
+                candidate = q[i] + d / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = candidate
+                n[i] += d
+
+    def value(self):
+        q = self.heights
+        if not q:
+            return None
+        if len(q) < 5:
+            ordered = sorted(q)
+            return ordered[min(len(ordered) - 1, int(self.p * len(ordered)))]
+        return q[2]
+
+    def to_doc(self):
+        return {"p": self.p, "heights": self.heights, "positions": self.positions, "desired": self.desired}
+
+    @classmethod
+    def from_doc(cls, doc):
+        return cls(doc['p'], doc['heights'], doc['positions'], doc['desired'])
+
+
+class MetricState:
+    """
+    Tek bir metrik için akış istatistikleri: hızlı EWMA (son durum), yavaş EWMA ve EWM varyansı (referans),
+    isteğe bağlı P² yüzdelik tahmini ve bozulma durumunda olup olmadığı.
+    """
+    __slots__ = ('fast', 'slow', 'var', 'quantile', 'degraded')
+
+    def __init__(self, fast=None, slow=None, var=0.0, quantile=None, degraded=False):
+        self.fast = fast
+        self.slow = slow
+        self.var = var
+        self.quantile = quantile
+        self.degraded = degraded
+
+    def to_doc(self):
+        return {
+            "fast": self.fast, "slow": self.slow, "var": self.var, "degraded": self.degraded,
+            "quantile": self.quantile.to_doc() if self.quantile is not None else None,
+        }
+
+    @classmethod
+    def from_doc(cls, doc):
+        quantile = doc.get('quantile')
+        return cls(
+            doc.get('fast'), doc.get('slow'), doc.get('var', 0.0),
+            P2Quantile.from_doc(quantile) if quantile else None, doc.get('degraded', False)
+        )
+
+
+class DegradationDetector:
+    """
+    Sinyal akışındaki ani bozulmaları (RSSI düşüşü, gecikme sıçraması, paket kaybı patlaması) ev × oda × BSSID
+    bazında, anahtar başına sabit bellekle yakalar.
+
+    Her metrik için hızlı EWMA son durumu, yavaş EWMA ve varyansı olağan durumu izler. Hızlı değer yavaş
+    değerden z_threshold standart sapma ve kuralın min_delta'sından (gecikmede ayrıca P² p95'ten) fazla
+    kötü yönde ayrılınca SignalDegradationDetected üretilir. Durum düzelene (fark eşiğin yarısının altına
+    inene) kadar aynı anahtar/metrik için tekrar event üretilmez. Kalıcı bir değişiklikte yavaş EWMA yeni
+    seviyeye yaklaştıkça durum kendiliğinden temizlenir.
+    """
+
+    def __init__(self, fast_alpha=0.3, slow_alpha=0.02, z_threshold=4.0, min_samples=30, rules=None):
+        self.fast_alpha = fast_alpha
+        self.slow_alpha = slow_alpha
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        self.rules = rules or DEGRADATION_RULES
+        # (house_id, room, bssid) -> {"samples": n, "metrics": {metrik: MetricState}}
+        self.states = {}
+
+    def _new_state(self):
+        return {
+            "samples": 0,
+            "metrics": {
+                metric: MetricState(quantile=P2Quantile(rule["quantile"]) if rule["quantile"] else None)
+                for metric, rule in self.rules.items()
+            },
+        }
+
+    def process(self, docs):
+        """
+        Sinyal dokümanlarını sırayla işler; üretilen SignalDegradationDetected eventlerini ve
+        durumu değişen anahtarları döner. Event id'leri tetikleyen sinyalin _id'sinden türetilir; aynı
+        sinyaller yeniden işlendiğinde aynı eventler üretilir ve store'da tekrar yazılmaz.
+        """
+        events = []
+        touched = set()
+        for doc in docs:
+            payload = doc.get('payload', {})
+            key = (doc.get('aggregate_id') or payload.get('house_id'), payload.get('room'), payload.get('bssid') or "")
+            touched.add(key)
+            events.extend(self.update(key, payload, doc.get('_id')))
+        return events, touched
+
+    def update(self, key, payload, signal_id=None):
+        state = self.states.get(key)
+        if state is None:
+            state = self.states[key] = self._new_state()
+        state["samples"] += 1
+        samples = state["samples"]
+        warm = samples > self.min_samples
+        fast_alpha = self.fast_alpha
+        slow_alpha = self.slow_alpha
+        z_threshold = self.z_threshold
+        rules = self.rules
+
+        events = []
+        for metric, stats in state["metrics"].items():
+            value = payload.get(metric)
+            if value is None:
+                continue
+            if stats.slow is None:
+                stats.fast = stats.slow = float(value)
+                continue
+            stats.fast += fast_alpha * (value - stats.fast)
+            # Referansa giren sapma eşik bandına kırpılır: bozulma anındaki değerler varyansı hemen şişirip
+            # eşiği uzaklaştıramaz, kalıcı bir seviye değişikliğine ise referans yavaşça uyum sağlar.
+            # EWM varyansı (West): sapma güncellenmeden önceki ortalamaya göre hesaplanır
+            band = max(z_threshold * math.sqrt(stats.var), rules[metric]["min_delta"])
+            diff = value - stats.slow
+            if diff > band:
+                diff = band
+            elif diff < -band:
+                diff = -band
+            increment = slow_alpha * diff
+            stats.slow += increment
+            stats.var = (1 - slow_alpha) * (stats.var + diff * increment)
+            if stats.quantile is not None:
+                stats.quantile.add(value)
+            if warm:
+                event = self._evaluate(key, metric, stats, samples, signal_id)
+                if event is not None:
+                    events.append(event)
+        return events
+
+    def threshold(self, metric, stats):
+        """
+        Metriğin bozulma eşiği (hızlı EWMA'nın bu değerin kötü tarafına geçmesi bozulmadır).
+        """
+        rule = self.rules[metric]
+        delta = max(self.z_threshold * math.sqrt(stats.var), rule["min_delta"])
+        threshold = stats.slow + rule["direction"] * delta
+        if stats.quantile is not None and rule["direction"] > 0:
+            quantile = stats.quantile.value()
+            if quantile is not None:
+                threshold = max(threshold, quantile)
+        return threshold
+
+    def _evaluate(self, key, metric, stats, samples, signal_id=None):
+        rule = self.rules[metric]
+        direction = rule["direction"]
+        threshold = self.threshold(metric, stats)
+        # Kötü yöndeki fark, eşik farkına oranla
+        excess = (stats.fast - stats.slow) * direction
+        limit = (threshold - stats.slow) * direction
+        if not stats.degraded:
+            if excess <= limit:
+                return None
+            stats.degraded = True
+            house_id, room, bssid = key
+            event = SignalDegradationDetected(
+                house_id=house_id,
+                room=room,
+                bssid=bssid,
+                metric=metric,
+                value=round(stats.fast, 2),
+                baseline=round(stats.slow, 2),
+                threshold=round(threshold, 2),
+                severity=rule["severity"],
+                samples=samples,
+            )
+            if signal_id is not None:
+                event.event_id = reading_event_id(house_id, f"degradation/{room}/{bssid}/{metric}/{signal_id}")
+            return event
+        if excess < limit / 2:
+            stats.degraded = False
+        return None
+
+    def state_doc(self, key):
+        state = self.states[key]
+        house_id, room, bssid = key
+        return {
+            "house_id": house_id,
+            "room": room,
+            "bssid": bssid,
+            "samples": state["samples"],
+            "metrics": {metric: stats.to_doc() for metric, stats in state["metrics"].items()},
+        }
+
+    def load_state_doc(self, doc):
+        key = (doc['house_id'], doc['room'], doc['bssid'])
+        self.states[key] = {
+            "samples": doc.get('samples', 0),
+            "metrics": {
+                metric: MetricState.from_doc(doc['metrics'][metric]) if metric in doc.get('metrics', {})
+                else self._new_state()["metrics"][metric]
+                for metric in self.rules
+            },
+        }
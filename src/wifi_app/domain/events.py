@@ -1,15 +1,93 @@
+import os
 import uuid
 from datetime import datetime
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+# uuid4 varyant karakteri: ilk hex hanenin üst iki biti 10 yapılır (8, 9, a, b)
+_VARIANT = {c: '89ab'[int(c, 16) & 3] for c in '0123456789abcdef'}
+
+
+def new_event_id():
+    """
+    uuid4 ile aynı formatta (versiyon 4, RFC 4122 varyantı) rastgele id üretir;
+    UUID nesnesi oluşturmadan doğrudan hex string'den biçimlendirir.
+    """
+    h = os.urandom(16).hex()
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_VARIANT[h[16]]}{h[17:20]}-{h[20:]}"
+
+
+# İstemcinin verdiği okuma id'lerinden deterministik event_id (uuid5) üretmek için sabit namespace
+READING_ID_NAMESPACE = uuid.UUID('5c22c712-6265-4213-8def-4e66de8f8566')
+
+
+def reading_event_id(house_id, reading_id):
+    """
+    Ev ve istemci okuma id'si (veya idempotency key) için her seferinde aynı event_id'yi üretir.
+    Tekrar gönderilen okuma aynı event_id ile gelir ve event_id unique index'ine takılır.
+    """
+    return str(uuid.uuid5(READING_ID_NAMESPACE, f"{house_id}/{reading_id}"))
+
+
+def is_idempotent_event_id(event_id):
+    """
+    event_id reading_event_id ile mi üretildi (uuid versiyon hanesi 5). Rastgele (v4) id'ler tekrar
+    gelmeyeceği için tekilleştirme önbelleğine alınmaz.
+    """
+    return isinstance(event_id, str) and len(event_id) == 36 and event_id[14] == '5'
+
+
+def copy_container(value):
+    """
+    Payload'daki list/dict alanlarını (JSON benzeri iç içe değerler) kopyalar; copy.deepcopy'nin
+    memo ve reduce maliyeti olmadan asdict'in kopyalama davranışını korur.
+    """
+    if isinstance(value, dict):
+        return {k: copy_container(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(copy_container(v) for v in value)
+    return value
+
+
+# Event sınıfı -> derlenmiş to_dict fonksiyonu
+_SERIALIZERS = {}
+
+
+def compile_to_dict(cls):
+    """
+    Sınıfın alanlarından doküman sözlüğünü tek ifadede kuran bir serializer fonksiyonu üretir
+    (dataclasses'ın __init__ üretmesi gibi). list/dict alanları asdict gibi kopyalanır.
+    """
+    payload_fields = [f for f in fields(cls) if f.name not in ('event_id', 'timestamp')]
+    items = []
+    for f in payload_fields:
+        value = f"self.{f.name}"
+        if f.type in (list, dict, 'list', 'dict'):
+            value = f"copy_container({value})"
+        items.append(f"{f.name!r}: {value}")
+    aggregate = "self.house_id" if any(f.name == 'house_id' for f in payload_fields) else "None"
+    source = (
+        "def to_dict(self):\n"
+        "    return {\n"
+        "        'event_id': self.event_id,\n"
+        f"        'event_type': {cls.__name__!r},\n"
+        f"        'aggregate_id': {aggregate},\n"
+        "        'timestamp': self.timestamp.isoformat(),\n"
+        f"        'payload': {{{', '.join(items)}}},\n"
+        "    }\n"
+    )
+    namespace = {}
+    exec(source, {'copy_container': copy_container}, namespace)
+    return namespace['to_dict']
+
+
+@dataclass(slots=True)
 class Event:
     event_id: str = field(init=False)
     timestamp: datetime = field(init=False)
-    
+
     def __post_init__(self):
-        self.event_id = str(uuid.uuid4())
+        self.event_id = new_event_id()
         self.timestamp = datetime.utcnow()
 
     @property
@@ -17,19 +95,13 @@ class Event:
         return self.__class__.__name__
 
     def to_dict(self):
-        data = asdict(self)
-        payload = {k: v for k, v in data.items() if k not in ['event_id', 'timestamp']}
-        aggregate_id = payload.get('house_id')
-
-        return {
-            "event_id": self.event_id,
-            "event_type": self.event_type,
-            "aggregate_id": aggregate_id,
-            "timestamp": self.timestamp.isoformat(),
-            "payload": payload
-        }
-
-@dataclass
+        # Sınıfa özel serializer ilk çağrıda derlenir; alt sınıflar kendi serializer'ını alır
+        serializer = _SERIALIZERS.get(type(self))
+        if serializer is None:
+            serializer = _SERIALIZERS[type(self)] = compile_to_dict(type(self))
+        return serializer(self)
+
+@dataclass(slots=True)
 class HouseRegistered(Event):
     house_id: str
     house_type: str
@@ -37,7 +109,7 @@ class HouseRegistered(Event):
     area_sqm: int
     rooms: list = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class WifiSignalCaptured(Event):
     house_id: str
     room: str
@@ -51,7 +123,7 @@ class WifiSignalCaptured(Event):
     packet_loss_rate: int = 0
     bssid: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class RoomPerformanceCalculated(Event):
     house_id: str
     room_name: str
@@ -64,9 +136,22 @@ class RoomPerformanceCalculated(Event):
     avg_latency_ms: int
     packet_loss_avg: float
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceRecommendationGenerated(Event):
     house_id: str
     room_recommendations: dict 
     global_recommendation_text: str 
-    global_severity: str            
\ No newline at end of file
+    global_severity: str
+
+
+@dataclass(slots=True)
+class SignalDegradationDetected(Event):
+    house_id: str
+    room: str
+    bssid: str
+    metric: str            # rssi | latency_ms | packet_loss_rate
+    value: float           # Kısa vadeli (hızlı EWMA) değer
+    baseline: float        # Uzun vadeli (yavaş EWMA) değer
+    threshold: float       # Aşılan eşik
+    severity: str
+    samples: int
@@ -0,0 +1,93 @@
+import math
+
+# Bağıl hata: dönen yüzdelik gerçek değerin en fazla %1 uzağındadır. Anahtarlar bu değerden türetildiği için
+# değiştirilirse saklanan sketch'ler birleştirilemez (rollup'lar yeniden oluşturulmalıdır).
+RELATIVE_ACCURACY = 0.01
+# Mutlak değeri bundan küçük değerler "z" (sıfır) bin'ine düşer
+MIN_INDEXABLE = 1e-9
+
+_GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
+
+
+def sketch_key(value):
+    """
+    Değerin DDSketch bin anahtarı: pozitifler "p{i}", negatifler (RSSI) "n{i}", sıfır "z".
+    i = ceil(log_gamma(|value|)); bin [gamma^(i-1), gamma^i) aralığını kapsar.
+    """
+    if value > MIN_INDEXABLE:
+        return f"p{math.ceil(math.log(value) / _LOG_GAMMA)}"
+    if value < -MIN_INDEXABLE:
+        return f"n{math.ceil(math.log(-value) / _LOG_GAMMA)}"
+    return "z"
+
+
+def _key_value(key):
+    # Bin'in temsilci değeri: iki sınırın bağıl hatayı eşitleyen ortası
+    if key == "z":
+        return 0.0
+    value = 2 * _GAMMA ** int(key[1:]) / (_GAMMA + 1)
+    return value if key[0] == "p" else -value
+
+
+def _key_order(key):
+    if key == "z":
+        return 0
+    index = int(key[1:])
+    # Negatiflerde büyük indeks daha küçük değerdir
+    return index + 1e6 if key[0] == "p" else -index - 1e6
+
+
+class DDSketch:
+    """
+    Birleştirilebilir yüzdelik sketch'i (DDSketch): değerler logaritmik bin'lere sayılır, {anahtar: adet}
+    olarak saklanır. İki sketch'in birleşimi adetlerin toplamıdır; bu yüzden Mongo'da $inc ile artımlı
+    güncellenebilir ve bucket'lar, odalar veya evler arasında kayıpsız birleştirilebilir.
+    """
+    __slots__ = ('bins',)
+
+    def __init__(self, bins=None):
+        self.bins = dict(bins) if bins else {}
+
+    def add(self, value, count=1):
+        key = sketch_key(value)
+        self.bins[key] = self.bins.get(key, 0) + count
+
+    def merge(self, other):
+        bins = self.bins
+        for key, count in (other.bins if isinstance(other, DDSketch) else other).items():
+            bins[key] = bins.get(key, 0) + count
+        return self
+
+    @property
+    def count(self):
+        return sum(self.bins.values())
+
+    def quantile(self, q):
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs):
+        """
+        Birden fazla yüzdeliği tek sıralamayla hesaplar; boş sketch'te her biri None döner.
+        """
+        total = self.count
+        if not total:
+            return [None] * len(qs)
+        ordered = sorted(self.bins.items(), key=lambda item: _key_order(item[0]))
+        results = []
+        for q in qs:
+            rank = q * (total - 1)
+            seen = 0
+            for key, count in ordered:
+                seen += count
+                if seen > rank:
+                    break
+            results.append(_key_value(key))
+        return results
+
+    def to_doc(self):
+        return dict(self.bins)
+
+    @classmethod
+    def from_doc(cls, doc):
+        return cls(doc)
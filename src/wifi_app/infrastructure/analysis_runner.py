@@ -0,0 +1,160 @@
+from datetime import timedelta
+import numpy as np
+from django.conf import settings
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from .event_store import signal_high_water
+from .projections import HouseRegistryProjection
+from .projections.base import DUPLICATE_KEY_ERROR
+from ..domain.analysis import SIGNAL_SUM_FIELDS, group_sums, analyze_rooms
+
+
+class SignalAnalysisRunner:
+    """
+    Son çalıştırmadan sonra gelen WifiSignalCaptured eventlerini okuyup oda bazlı toplamları günceller,
+    etkilenen evler için RoomPerformanceCalculated ve PerformanceRecommendationGenerated eventleri üretir.
+    Son SIGNAL_CHECKPOINT_LAG_SECONDS içinde eklenen sinyaller bir sonraki çalıştırmaya bırakılır
+    (signal_high_water); geç commit edilen sinyaller checkpoint'in gerisinde kalıp atlanmaz.
+
+    Oda toplamları analysis_room_windows koleksiyonunda ev × oda × zaman bucket'ı (ANALYSIS_BUCKET_MINUTES,
+    sinyalin _id zamanı) başına tutulur. Skorlar son ANALYSIS_WINDOW_HOURS içindeki bucket'lardan hesaplanır;
+    böylece yakın zamanda kötüleşen bir oda geçmişin ortalamasında kaybolmaz. Pencere sonu işlenen batch'in
+    son sinyalidir (geçmiş veri yeniden analiz edilirken de pencere o ana göre kayar); pencereden çıkan
+    bucket'lar silinir.
+
+    Her güncelleme işlenen batch'in son _id'sini (through_id) yazar ve sadece daha eski state'lere uygulanır;
+    böylece checkpoint yazılmadan önce yarıda kalan bir çalıştırma tekrarlandığında aynı batch iki kez sayılmaz.
+    """
+    state_collection_name = 'analysis_room_windows'
+    checkpoint_collection_name = 'analysis_checkpoints'
+    checkpoint_id = 'signals'
+
+    def __init__(self, store, batch_size=100000):
+        self.store = store
+        self.db = store.db
+        self.batch_size = batch_size
+        self.state_collection = self.db[self.state_collection_name]
+        self.checkpoint_collection = self.db[self.checkpoint_collection_name]
+
+    def reset(self):
+        self.state_collection.delete_many({})
+        self.checkpoint_collection.delete_one({"_id": self.checkpoint_id})
+
+    def load_checkpoint(self):
+        doc = self.checkpoint_collection.find_one({"_id": self.checkpoint_id})
+        return doc.get('last_id') if doc else None
+
+    def save_checkpoint(self, last_id):
+        self.checkpoint_collection.update_one(
+            {"_id": self.checkpoint_id}, {"$set": {"last_id": last_id}}, upsert=True
+        )
+
+    def run(self):
+        """
+        Checkpoint'ten itibaren tüm yeni sinyalleri batch'ler halinde işler.
+        Dönüş: {"signals": işlenen sinyal, "houses": skorlanan ev, "events": üretilen event sayısı}
+        """
+        last_id = self.load_checkpoint()
+        high_water = signal_high_water()
+        stats = {"signals": 0, "houses": 0, "events": 0}
+        while True:
+            docs = self.store.get_signals_after(last_id, limit=self.batch_size, before_id=high_water)
+            if not docs:
+                break
+            through_id = docs[-1]['_id']
+            window_start = self.window_start(through_id)
+            houses = self.accumulate(docs, through_id)
+            events = self.score_houses(houses, window_start)
+            self.store.append_many(events)
+            # Sayfa dolmadıysa sınırın altındaki her şey okundu; checkpoint sınıra ilerler
+            last_id = through_id if len(docs) >= self.batch_size else high_water
+            self.save_checkpoint(last_id)
+            self.state_collection.delete_many({"bucket": {"$lt": window_start}})
+
+            stats["signals"] += len(docs)
+            stats["houses"] += len(houses)
+            stats["events"] += len(events)
+        return stats
+
+    @staticmethod
+    def bucket_start(object_id):
+        """
+        Sinyalin (_id eklenme zamanı) düştüğü analiz bucket'ının başlangıcı (naive UTC).
+        """
+        span = timedelta(minutes=settings.ANALYSIS_BUCKET_MINUTES)
+        at = object_id.generation_time.replace(tzinfo=None)
+        return at - (at - at.min) % span
+
+    def window_start(self, through_id):
+        """
+        through_id'de biten skor penceresinin ilk bucket'ı.
+        """
+        return self.bucket_start(through_id) - timedelta(hours=settings.ANALYSIS_WINDOW_HOURS) + \
+            timedelta(minutes=settings.ANALYSIS_BUCKET_MINUTES)
+
+    def accumulate(self, docs, through_id):
+        """
+        Batch'teki sinyalleri (ev, oda, bucket) bazında toplayıp state'e $inc ile ekler; etkilenen evleri döner.
+        """
+        key_index = {}
+        group_index = np.empty(len(docs), dtype=np.int64)
+        columns = {field: np.empty(len(docs), dtype=float) for field in SIGNAL_SUM_FIELDS}
+        for i, doc in enumerate(docs):
+            payload = doc.get('payload', {})
+            key = (doc.get('aggregate_id'), payload.get('room'), self.bucket_start(doc['_id']))
+            group_index[i] = key_index.setdefault(key, len(key_index))
+            for field in SIGNAL_SUM_FIELDS:
+                columns[field][i] = payload.get(field) or 0
+
+        counts, sums = group_sums(group_index, len(key_index), columns)
+
+        operations = []
+        for (house_id, room, bucket), g in key_index.items():
+            inc = {"count": int(counts[g])}
+            for field, state_field in SIGNAL_SUM_FIELDS.items():
+                inc[state_field] = float(sums[field][g])
+            operations.append(UpdateOne(
+                {"house_id": house_id, "room": room, "bucket": bucket, "through_id": {"$lt": through_id}},
+                {"$inc": inc, "$set": {"through_id": through_id}},
+                upsert=True
+            ))
+        try:
+            self.state_collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as exc:
+            # Duplicate key: bu batch o oda bucket'ı için zaten uygulanmış
+            errors = [e for e in exc.details.get('writeErrors', []) if e.get('code') != DUPLICATE_KEY_ERROR]
+            if errors:
+                raise
+        return {house_id for house_id, _, _ in key_index}
+
+    def score_houses(self, house_ids, window_start):
+        """
+        Verilen evlerin window_start'tan itibaren bucket'larını oda bazında toplayıp analiz eventlerini üretir.
+        """
+        if not house_ids:
+            return []
+        house_ids = list(house_ids)
+        state_fields = list(SIGNAL_SUM_FIELDS.values())
+        states = list(self.state_collection.aggregate([
+            {"$match": {"house_id": {"$in": house_ids}, "bucket": {"$gte": window_start}}},
+            {"$group": {
+                "_id": {"house_id": "$house_id", "room": "$room"},
+                "count": {"$sum": "$count"},
+                **{field: {"$sum": f"${field}"} for field in state_fields},
+            }},
+        ]))
+        registry = HouseRegistryProjection().collection(self.db).find(
+            {"_id": {"$in": house_ids}}, {"payload.house_type": 1}
+        )
+        house_types = {doc['_id']: doc.get('payload', {}).get('house_type') for doc in registry}
+
+        return analyze_rooms(
+            house_ids=[s['_id']['house_id'] for s in states],
+            rooms=[s['_id']['room'] for s in states],
+            counts=np.array([s.get('count', 0) for s in states], dtype=float),
+            sums={
+                state_field: np.array([s.get(state_field, 0) for s in states], dtype=float)
+                for state_field in state_fields
+            },
+            house_types=house_types
+        )
@@ -0,0 +1,224 @@
+import asyncio
+from bson import ObjectId
+from django.conf import settings
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from .async_mongo_client import AsyncMongoDBClient
+from .dedup import get_recent_event_ids
+from .event_store import EventStoreQueries, MongoEventStore, ConcurrencyError, get_event_store, is_version_conflict
+from .indexes import ensure_indexes
+from .mongo_client import MongoDBClient
+from .projections import HouseRegistryProjection
+from .projections.fleet import summarize_fleet
+from .projections.rollups import ROLLUP_METRICS, room_percentiles, summarize_rollup
+from .read_routing import routed
+from .signal_codec import SIGNAL_EVENT_TYPE, encode_compact, decode_signal
+from ..domain.events import Event
+
+
+class AsyncMongoEventStore(EventStoreQueries):
+    """
+    MongoEventStore ile aynı API'ye sahip async event store. Sorgu şekilleri ortaktır.
+    Projeksiyonlar gibi subscriber'lar sync olduğu için eklenen eventler worker thread'de
+    yayınlanır; event loop bloklanmaz ve yanıt dönmeden okuma modelleri güncellenmiş olur.
+    SIGNAL_STORAGE_FORMAT=bucketed iken yazma ve sinyal okumaları sync store'a worker thread'de devredilir.
+    """
+
+    def __init__(self):
+        self.db = AsyncMongoDBClient.get_db()
+        self.collection = self.db['event_store']
+        self.signal_format = settings.SIGNAL_STORAGE_FORMAT
+        self.bucketed = self.signal_format == 'bucketed'
+
+    async def _ensure_indexes(self):
+        # Index kurulumu sync store ile ortak, process başına bir kez yapılır
+        if settings.MONGO_ENSURE_INDEXES and not MongoEventStore._indexes_ensured:
+            await asyncio.to_thread(ensure_indexes, MongoDBClient.get_db())
+            MongoEventStore._indexes_ensured = True
+
+    async def _publish(self, docs):
+        if MongoEventStore._subscribers:
+            await asyncio.to_thread(MongoEventStore.publish, MongoDBClient.get_db(), docs)
+
+    async def _reserve_versions(self, docs, expected_version=None):
+        # MongoEventStore._reserve_versions ile aynı sayaç ve atama
+        if not settings.AGGREGATE_VERSIONING:
+            self._check_versioning(expected_version)
+            return
+        counts = self._version_counts(docs)
+        self._check_expected_version(counts, expected_version)
+        versions = self.db[self.versions_collection_name]
+        heads = {}
+        for aggregate_id, count in counts.items():
+            try:
+                heads[aggregate_id] = await versions.find_one_and_update(
+                    **self._reserve_versions_args(aggregate_id, count, expected_version)
+                )
+            except DuplicateKeyError:
+                heads[aggregate_id] = None
+        self._assign_versions(docs, counts, heads, expected_version)
+
+    async def _insert(self, docs):
+        # MongoEventStore._insert ile aynı: daha önce yazılmış event_id'ler başarı sayılır ve döner
+        try:
+            if len(docs) == 1:
+                await self.collection.insert_one(self._encode(docs[0]))
+            else:
+                await self.collection.insert_many([self._encode(doc) for doc in docs], ordered=False)
+        except DuplicateKeyError as exc:
+            if is_version_conflict(exc.details or {}):
+                raise ConcurrencyError(str(exc)) from exc
+            duplicates = self._duplicate_event_ids(exc, docs)
+            if duplicates is None:
+                raise
+            return duplicates
+        except BulkWriteError as exc:
+            if any(is_version_conflict(error) for error in exc.details.get('writeErrors', [])):
+                raise ConcurrencyError(str(exc)) from exc
+            duplicates = self._duplicate_event_ids(exc, docs)
+            if duplicates is None:
+                raise
+            return duplicates
+        return set()
+
+    async def _write_versioned(self, docs, expected_version=None):
+        # MongoEventStore._write_versioned ile aynı tekilleştirme; yazılan dokümanları döner
+        recent = get_recent_event_ids()
+        docs, _ = recent.split(docs)
+        if not docs:
+            return []
+        await self._ensure_indexes()
+        await self._reserve_versions(docs, expected_version)
+        duplicates = await self._insert(docs)
+        recent.remember((doc['event_id'] for doc in docs), len(duplicates))
+        if duplicates:
+            return [doc for doc in docs if doc['event_id'] not in duplicates]
+        return docs
+
+    async def append(self, event: Event, expected_version=None):
+        """
+        Herhangi bir Domain Event'i veritabanına kaydeder.
+        """
+        if self.bucketed:
+            return await asyncio.to_thread(get_event_store().append, event, expected_version)
+        written = await self._write_versioned([event.to_dict()], expected_version)
+        if written:
+            await self._publish(written)
+        return bool(written)
+
+    def _encode(self, doc):
+        # compact formatta sinyal dokümanı encode edilir; _id yazıldıktan sonra asıl dokümana kopyalanır
+        if self.signal_format != 'compact' or doc.get('event_type') != SIGNAL_EVENT_TYPE:
+            return doc
+        encoded = encode_compact(doc)
+        doc['_id'] = encoded['_id'] = encoded.get('_id') or ObjectId()
+        return encoded
+
+    async def append_many(self, events, expected_version=None):
+        """
+        Birden fazla Domain Event'i tek bir unordered insert_many çağrısıyla kaydeder.
+        """
+        if self.bucketed:
+            return await asyncio.to_thread(get_event_store().append_many, events, expected_version)
+        docs = [event.to_dict() for event in events]
+        if not docs:
+            return []
+        written = await self._write_versioned(docs, expected_version)
+        if written:
+            await self._publish(written)
+        return written
+
+    async def load_aggregate(self, house_id, snapshot_every=None):
+        # Snapshot + replay sync store'da worker thread'de çalışır
+        return await asyncio.to_thread(get_event_store().load_aggregate, house_id, snapshot_every)
+
+    async def get_registered_houses(self):
+        cursor = self._registered_houses_cursor()
+        return [doc.get('payload', {}) async for doc in cursor]
+
+    async def get_registry_version(self):
+        projection = HouseRegistryProjection()
+        doc = await self.db[projection.versions_collection].find_one({"_id": projection.name})
+        return doc.get('version', 0) if doc else 0
+
+    async def get_recent_signals(self, limit=50, house_id=None, cursor=None):
+        if self.bucketed:
+            return await asyncio.to_thread(get_event_store().get_recent_signals, limit, house_id, cursor)
+        events = [decode_signal(doc) for doc in await self._recent_signals_cursor(limit, house_id, cursor).to_list()]
+        for event in events:
+            event['_id'] = str(event['_id'])
+        return events
+
+    async def get_signals_after(self, after_id=None, limit=10000, before_id=None):
+        if self.bucketed:
+            return await asyncio.to_thread(get_event_store().get_signals_after, after_id, limit, before_id)
+        return [
+            decode_signal(doc) for doc in await self._signals_after_cursor(after_id, limit, before_id).to_list()
+        ]
+
+    async def find_signals(self, house_id=None, since=None, until=None, room=None, band=None, device_id=None,
+                           order='desc', cursor=None, limit=50, fields=None):
+        if self.signal_format != 'document':
+            return await asyncio.to_thread(
+                get_event_store().find_signals, house_id, since, until, room, band, device_id,
+                order, cursor, limit, fields
+            )
+        house_id, id_range, match = self._signal_filter(
+            house_id, since, until, room, band, device_id, order, cursor
+        )
+        fields = None if fields is None else set(fields) | {"mongo_id"}
+        pipeline = self._find_signals_pipeline(self._signal_query(house_id, id_range, match), order, limit, fields)
+        return await (await routed(self.collection, 'find_signals').aggregate(pipeline)).to_list()
+
+    async def get_latest_recommendation(self, house_id):
+        docs = await self._latest_recommendation_cursor(house_id).to_list()
+        return self._recommendation_payload(docs[0] if docs else None)
+
+    async def get_house_room_metrics(self, house_id):
+        rooms_metrics = [doc.get('payload', {}) async for doc in self._room_metrics_cursor(house_id)]
+        rollups = await self._room_rollups_cursor(house_id, self._percentile_window_start()).to_list()
+        return self._attach_percentiles(rooms_metrics, room_percentiles(rollups))
+
+    async def get_house_dashboard(self, house_id):
+        # MongoEventStore.get_house_dashboard ile aynı; sorgular asyncio.gather ile eşzamanlı çalışır
+        since = self._percentile_window_start()
+        parts = (
+            self._house_cursor(house_id).to_list(),
+            self._room_metrics_cursor(house_id).to_list(),
+            self._room_rollups_cursor(house_id, since, ROLLUP_METRICS).to_list(),
+            self._latest_recommendation_cursor(house_id).to_list(),
+            self.find_signals(
+                house_id=house_id, limit=settings.HOUSE_DASHBOARD_SIGNALS, fields=self.DASHBOARD_SIGNAL_FIELDS
+            ),
+        )
+        if settings.MONGO_CAUSAL_CONSISTENCY:
+            house, rooms, rollups, recommendation, latest = [await part for part in parts]
+        else:
+            house, rooms, rollups, recommendation, latest = await asyncio.gather(*parts)
+        return self._house_dashboard(
+            house_id, house[0] if house else None, [doc.get('payload', {}) for doc in rooms], rollups,
+            recommendation[0] if recommendation else None, latest
+        )
+
+    async def get_fleet_summary(self, worst=10):
+        summary = summarize_fleet(await self._fleet_summary_cursor().to_list())
+        summary["worst_rooms"] = [doc.get('payload', {}) async for doc in self._worst_rooms_cursor(worst)] if worst else []
+        return summary
+
+    async def get_signal_timeseries(self, house_id, resolution, since, until, room=None, band=None):
+        cursor = self._timeseries_cursor(house_id, resolution, since, until, room, band)
+        return [summarize_rollup(doc) async for doc in cursor]
+
+
+_shared_store = None
+
+
+def get_async_event_store():
+    """
+    get_event_store'un async karşılığı: process genelinde paylaşılan AsyncMongoEventStore.
+    """
+    global _shared_store
+    store = _shared_store
+    if store is None or store.db.client is not AsyncMongoDBClient.get_client() \
+            or store.signal_format != settings.SIGNAL_STORAGE_FORMAT:
+        store = _shared_store = AsyncMongoEventStore()
+    return store
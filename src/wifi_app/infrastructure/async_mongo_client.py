@@ -0,0 +1,35 @@
+from pymongo import AsyncMongoClient
+from django.conf import settings
+from .metrics import register_metrics
+from .mongo_client import PoolMetrics, client_options
+
+
+class AsyncMongoDBClient:
+    """
+    MongoDBClient'ın asyncio karşılığı (pymongo'nun native async API'si, Motor ile aynı kullanım).
+    İstemci ilk kullanıldığı event loop'a bağlanır; ASGI sunucusunun tek loop'u içinde paylaşılır.
+    Havuz/zaman aşımı seçenekleri sync istemciyle ortaktır, havuz metrikleri 'async_mongo_pool' adıyla yayınlanır.
+    """
+    _client = None
+    _pool_metrics = None
+    metrics_name = 'async_mongo_pool'
+
+    @classmethod
+    def get_client(cls):
+        if cls._client is None:
+            cls._pool_metrics = PoolMetrics()
+            register_metrics(cls.metrics_name, cls._pool_metrics.snapshot)
+            cls._client = AsyncMongoClient(
+                settings.MONGO_URI, event_listeners=[cls._pool_metrics], **client_options()
+            )
+        return cls._client
+
+    @classmethod
+    def get_db(cls):
+        client = cls.get_client()
+        return client[settings.MONGO_DB_NAME]
+
+    @classmethod
+    def reset(cls):
+        # Fork sonrası çocuk process ebeveynin istemcisini bırakır
+        cls._client = None
@@ -0,0 +1,416 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import caches
+from .metrics import register_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class VersionedCache:
+    """
+    Process içi, versiyon anahtarlı önbellek. Sadece en son versiyonun değeri tutulur;
+    kaynak versiyon arttığında eski değer kendiliğinden geçersiz olur (TTL yok).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._value = None
+
+    def get(self, version):
+        with self._lock:
+            if self._version == version:
+                return self._value
+        return None
+
+    def set(self, version, value):
+        with self._lock:
+            self._version = version
+            self._value = value
+
+    def clear(self):
+        with self._lock:
+            self._version = None
+            self._value = None
+
+
+def approximate_size(value):
+    """
+    JSON benzeri bir değerin (dict/list/str/sayı, Mongo'dan dönen tipler) yaklaşık bellek boyutu.
+    Değer serileştirilmeden tek geçişte hesaplanır; LRU'nun bayt sınırı için yeterince doğrudur.
+    """
+    size = 0
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (str, bytes)):
+            size += len(item) + 8
+        elif isinstance(item, dict):
+            size += 16 * len(item)
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            size += 8 * len(item)
+            stack.extend(item)
+        else:
+            size += 16
+    return size
+
+
+class _Entry:
+    __slots__ = ('value', 'size', 'generation', 'epoch', 'fresh_until', 'stale_until')
+
+    def __init__(self, value, size, generation, epoch, fresh_until, stale_until):
+        self.value = value
+        self.size = size
+        self.generation = generation
+        self.epoch = epoch
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class _Flight:
+    """
+    Bir anahtar için devam eden tek hesaplama; aynı anahtarı isteyenler sonucunu bekler.
+    """
+    __slots__ = ('done', 'value', 'failed', 'invalidated')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.failed = False
+        self.invalidated = False
+
+
+class ResponseCache:
+    """
+    Bayt sınırlı, process içi LRU yanıt önbelleği. İsteğe bağlı olarak paylaşılan bir Django cache
+    backend'i (shared) ikinci katman olarak kullanılır.
+
+    - Taze (ttl) değerler doğrudan dönülür. Süresi dolmuş ama stale penceresindeki değer de dönülür ve
+      arka planda tek bir yenileme başlatılır (stale-while-revalidate).
+    - Değer yoksa aynı anahtar için tek hesaplama yapılır (single-flight), eşzamanlı istekler onu bekler.
+    - invalidate anahtarı siler; devam eden hesaplama sonucu saklanmaz. shared varsa anahtarın nesli
+      (generation) paylaşılan cache'te artırılır, diğer process'lerin yerel kopyaları da geçersiz olur.
+    - Sık değişen kaynaklar için invalidate yerine mark(tag) kullanılır: zaman mark_interval saniyelik
+      dilimlere (epoch) bölünür; tag'li bir değer, hesaplandığı epoch'ta veya sonrasında tag işaretlenmişse
+      o epoch bittiğinde geçersiz olur. Değerler en fazla mark_interval gecikir ve sürekli değişen bir kaynak
+      için anahtar başına epoch'ta en fazla bir kez yeniden hesaplanır.
+    """
+
+    def __init__(self, max_bytes, ttl, stale_ttl, shared=None, executor=None, prefix='response_cache',
+                 mark_interval=None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.shared = shared
+        self.executor = executor
+        self.prefix = prefix
+        self.mark_interval = mark_interval
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._marks = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "hits": 0, "stale_hits": 0, "misses": 0, "coalesced": 0, "shared_hits": 0,
+            "evictions": 0, "invalidations": 0, "mark_expirations": 0, "refreshes": 0, "refresh_errors": 0,
+        }
+
+    def _generation_key(self, key):
+        return f"{self.prefix}:gen:{key}"
+
+    def _mark_key(self, tag):
+        return f"{self.prefix}:mark:{tag}"
+
+    def _value_key(self, key, generation):
+        return f"{self.prefix}:{key}:{generation}"
+
+    def _epoch(self):
+        # Process'ler arası karşılaştırılabilmesi için duvar saati
+        if not self.mark_interval:
+            return 0
+        return int(time.time() // self.mark_interval)
+
+    def _versions(self, key, tag):
+        """
+        Anahtarın nesli ve tag'in son işaretlendiği epoch (işaret yoksa None); shared varsa tek get_many ile.
+        """
+        if self.shared is None:
+            if tag is None:
+                return 0, None
+            with self._lock:
+                return 0, self._marks.get(tag)
+        generation_key = self._generation_key(key)
+        if tag is None:
+            return self.shared.get(generation_key, 0), None
+        mark_key = self._mark_key(tag)
+        found = self.shared.get_many([generation_key, mark_key])
+        return found.get(generation_key, 0), found.get(mark_key)
+
+    @staticmethod
+    def _marked_after(value_epoch, mark, epoch):
+        # Değerin epoch'unda veya sonrasında işaret var ve o epoch bitti
+        return mark is not None and mark >= value_epoch and epoch > value_epoch
+
+    def get_or_compute(self, key, compute, tag=None):
+        """
+        key için önbellekteki değeri, yoksa compute() sonucunu döner. tag verilirse değer mark(tag) ile
+        en fazla mark_interval gecikmeyle geçersiz olur.
+        """
+        generation, mark = self._versions(key, tag)
+        epoch = self._epoch()
+        now = time.monotonic()
+        refresh = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._marked_after(entry.epoch, mark, epoch):
+                self._stats["mark_expirations"] += 1
+                self._drop(key)
+                entry = None
+            if entry is not None and (entry.generation != generation or now >= entry.stale_until):
+                self._drop(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if now < entry.fresh_until:
+                    self._stats["hits"] += 1
+                    return entry.value
+                self._stats["stale_hits"] += 1
+                if key not in self._flights:
+                    refresh = self._flights[key] = _Flight()
+                    self._stats["refreshes"] += 1
+            else:
+                flight = self._flights.get(key)
+                if flight is None:
+                    flight = self._flights[key] = _Flight()
+                    self._stats["misses"] += 1
+                    leader = True
+                else:
+                    self._stats["coalesced"] += 1
+                    leader = False
+
+        versions = (generation, mark, epoch)
+        if entry is not None:
+            if refresh is not None:
+                if self.executor is not None:
+                    self.executor.submit(self._run, key, compute, refresh, versions, True)
+                else:
+                    self._run(key, compute, refresh, versions, True)
+            return entry.value
+
+        if not leader:
+            flight.done.wait()
+            if flight.invalidated:
+                # Hesaplama sürerken kaynak değişti; eski değer yerine yeni bir hesaplama başlatılır/beklenir
+                return self.get_or_compute(key, compute, tag)
+            if not flight.failed:
+                return flight.value
+            # Lider hata aldıysa bu istek kendi hesaplamasını yapar ve hatayı kendisi görür
+            return compute()
+        return self._run(key, compute, flight, versions, False)
+
+    def _run(self, key, compute, flight, versions, background):
+        generation = versions[0]
+        try:
+            value, value_epoch = self._load(key, compute, versions)
+        except Exception:
+            flight.failed = True
+            if not background:
+                raise
+            with self._lock:
+                self._stats["refresh_errors"] += 1
+            logger.exception("Response cache refresh failed for %s", key)
+        else:
+            flight.value = value
+            self._store(key, value, generation, value_epoch, flight)
+            return value
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+            flight.done.set()
+
+    def _load(self, key, compute, versions):
+        """
+        (değer, değerin hesaplandığı epoch). Paylaşılan cache'teki değer tag işaretiyle eskimişse yeniden hesaplanır.
+        """
+        generation, mark, epoch = versions
+        if self.shared is not None:
+            stored = self.shared.get(self._value_key(key, generation), _MISSING)
+            if stored is not _MISSING and not self._marked_after(stored[0], mark, epoch):
+                with self._lock:
+                    self._stats["shared_hits"] += 1
+                return stored[1], stored[0]
+        value = compute()
+        if self.shared is not None:
+            self.shared.set(self._value_key(key, generation), (epoch, value), self.ttl)
+        return value, epoch
+
+    def _store(self, key, value, generation, epoch, flight):
+        size = approximate_size(value) + len(key)
+        if size > self.max_bytes:
+            return
+        now = time.monotonic()
+        with self._lock:
+            if flight.invalidated:
+                return
+            self._drop(key)
+            self._entries[key] = _Entry(
+                value, size, generation, epoch, now + self.ttl, now + self.ttl + self.stale_ttl
+            )
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._stats["evictions"] += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def invalidate(self, key):
+        with self._lock:
+            self._drop(key)
+            flight = self._flights.pop(key, None)
+            if flight is not None:
+                flight.invalidated = True
+            self._stats["invalidations"] += 1
+        if self.shared is not None:
+            generation_key = self._generation_key(key)
+            if not self.shared.add(generation_key, 1, None):
+                try:
+                    self.shared.incr(generation_key)
+                except ValueError:
+                    # Anahtar add ile incr arasında silindi/süresi doldu
+                    self.shared.set(generation_key, 1, None)
+
+    def mark(self, tag):
+        """
+        tag'e bağlı değerlerin kaynağı değişti: değerler en geç bu epoch'un sonunda geçersiz olur.
+        Process başına tag ve epoch için en fazla bir kez paylaşılan cache'e yazılır.
+        """
+        if not self.mark_interval:
+            return
+        epoch = self._epoch()
+        with self._lock:
+            if self._marks.get(tag) == epoch:
+                return
+            self._marks[tag] = epoch
+        if self.shared is not None:
+            # İşaretten eski değerler en geç ttl + stale_ttl sonra zaten silinir
+            self.shared.set(self._mark_key(tag), epoch, self.ttl + self.stale_ttl + 2 * self.mark_interval)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for flight in self._flights.values():
+                flight.invalidated = True
+            self._flights.clear()
+            self._bytes = 0
+
+    def metrics(self):
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "shared": self.shared is not None,
+            }
+
+
+_MISSING = object()
+
+# Önbelleğe alınan ev yanıtları ve onları geçersiz kılan eventler
+HOUSE_CACHE_INVALIDATIONS = {
+    'HouseRegistered': ('dashboard',),
+    'RoomPerformanceCalculated': ('metrics', 'dashboard'),
+    'PerformanceRecommendationGenerated': ('recommendations', 'dashboard'),
+}
+# Her sinyalle değişen (oda rollup yüzdelikleri, dashboard'daki son sinyaller) yanıtlar; WifiSignalCaptured ile
+# "signals:<house>" tag'i işaretlenir
+HOUSE_CACHE_SIGNAL_KINDS = ('metrics', 'dashboard')
+
+_house_cache = None
+_house_cache_lock = threading.Lock()
+
+
+def get_house_cache():
+    """
+    Process genelinde paylaşılan ev yanıt önbelleğini döner (ilk çağrıda oluşturulur).
+    """
+    global _house_cache
+    if _house_cache is None:
+        with _house_cache_lock:
+            if _house_cache is None:
+                shared = caches[settings.HOUSE_CACHE_BACKEND] if settings.HOUSE_CACHE_BACKEND else None
+                _house_cache = ResponseCache(
+                    max_bytes=settings.HOUSE_CACHE_MAX_BYTES,
+                    ttl=settings.HOUSE_CACHE_TTL_SECONDS,
+                    # Paylaşılan cache yoksa başka process'lerin invalidation'ları görülmez; eski değer
+                    # TTL'den fazla sunulmasın diye stale penceresi kapatılır
+                    stale_ttl=settings.HOUSE_CACHE_STALE_SECONDS if shared is not None else 0,
+                    shared=shared,
+                    executor=ThreadPoolExecutor(
+                        max_workers=settings.HOUSE_CACHE_REFRESH_WORKERS, thread_name_prefix='house-cache-refresh'
+                    ),
+                    prefix='house_cache',
+                    mark_interval=settings.HOUSE_CACHE_SIGNAL_LAG_SECONDS,
+                )
+                register_metrics('house_cache', _house_cache.metrics)
+    return _house_cache
+
+
+def cached_house_response(kind, house_id, compute):
+    """
+    Ev yanıtını (kind: metrics | recommendations | dashboard) önbellekten döner; HOUSE_CACHE_ENABLED=False ise compute().
+    """
+    if not settings.HOUSE_CACHE_ENABLED:
+        return compute()
+    tag = f"signals:{house_id}" if kind in HOUSE_CACHE_SIGNAL_KINDS else None
+    return get_house_cache().get_or_compute(f"{kind}:{house_id}", compute, tag=tag)
+
+
+def invalidate_house_cache(db, docs):
+    """
+    MongoEventStore subscriber'ı: eklenen HouseRegistered / RoomPerformanceCalculated /
+    PerformanceRecommendationGenerated eventlerinin evine ait yanıtları (HOUSE_CACHE_INVALIDATIONS) geçersiz
+    kılar. WifiSignalCaptured eventleri evin "signals" tag'ini işaretler; HOUSE_CACHE_SIGNAL_KINDS yanıtları en geç
+    HOUSE_CACHE_SIGNAL_LAG_SECONDS sonra yeniden hesaplanır. Projeksiyonlardan sonra çalışır; yeniden hesaplanan
+    yanıt yeni okuma modelini görür.
+    """
+    if not settings.HOUSE_CACHE_ENABLED:
+        return
+    keys = set()
+    signal_houses = set()
+    for doc in docs:
+        event_type = doc.get('event_type')
+        house_id = doc.get('aggregate_id') or doc.get('payload', {}).get('house_id')
+        if event_type == 'WifiSignalCaptured':
+            signal_houses.add(house_id)
+            continue
+        kinds = HOUSE_CACHE_INVALIDATIONS.get(event_type, ())
+        keys.update(f"{kind}:{house_id}" for kind in kinds)
+    if keys or signal_houses:
+        cache = get_house_cache()
+        for key in keys:
+            cache.invalidate(key)
+        for house_id in signal_houses:
+            cache.mark(f"signals:{house_id}")
+
+
+def _reset_after_fork():
+    # Yenileme thread'leri fork'ta çocuğa geçmez; çocuk kendi önbelleğini kurar
+    global _house_cache, _house_cache_lock
+    _house_cache = None
+    _house_cache_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+from django.conf import settings
+from ..domain.events import is_idempotent_event_id
+from .metrics import register_metrics
+
+
+class RecentEventIds:
+    """
+    Bu process'in yazdığı veya tekrar olarak gördüğü idempotent event_id'lerin LRU önbelleği.
+    Tekrar gönderilen bir okuma önbellekteyse veritabanına gitmeden atlanır; önbellekte olmayan
+    (yaygın, tekrar olmayan) okumalar için ek sorgu yapılmaz, tekrarları event_id unique index'i yakalar.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._ids = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"skipped_events": 0, "stored_duplicates": 0}
+
+    def split(self, docs):
+        """
+        Dokümanları (yazılacaklar, atlanan tekrar sayısı) olarak ayırır: batch içinde tekrar eden ve
+        önbellekte olan idempotent event_id'ler atlanır.
+        """
+        fresh = []
+        batch_ids = set()
+        skipped = 0
+        with self._lock:
+            for doc in docs:
+                event_id = doc.get('event_id')
+                if is_idempotent_event_id(event_id):
+                    if event_id in batch_ids or event_id in self._ids:
+                        skipped += 1
+                        continue
+                    batch_ids.add(event_id)
+                fresh.append(doc)
+            self._stats["skipped_events"] += skipped
+        return fresh, skipped
+
+    def remember(self, event_ids, duplicates=0):
+        ids = self._ids
+        with self._lock:
+            for event_id in event_ids:
+                if not is_idempotent_event_id(event_id):
+                    continue
+                ids[event_id] = None
+                ids.move_to_end(event_id)
+            while len(ids) > self.max_size:
+                ids.popitem(last=False)
+            self._stats["stored_duplicates"] += duplicates
+
+    def metrics(self):
+        with self._lock:
+            return {**self._stats, "cached_ids": len(self._ids), "capacity": self.max_size}
+
+
+_recent = None
+_recent_lock = threading.Lock()
+
+
+def get_recent_event_ids():
+    """
+    Process genelinde paylaşılan idempotent event_id önbelleğini döner (ilk çağrıda oluşturulur).
+    """
+    global _recent
+    if _recent is None:
+        with _recent_lock:
+            if _recent is None:
+                _recent = RecentEventIds(settings.INGEST_DEDUP_CACHE_SIZE)
+                register_metrics('ingest_dedup', _recent.metrics)
+    return _recent
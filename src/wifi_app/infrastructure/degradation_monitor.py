@@ -0,0 +1,86 @@
+from django.conf import settings
+from pymongo import ReplaceOne
+from .event_store import signal_high_water
+from ..domain.degradation import DegradationDetector
+
+
+class DegradationMonitor:
+    """
+    Son checkpoint'ten sonra gelen WifiSignalCaptured eventlerini eklenme sırasıyla DegradationDetector'e
+    verir ve üretilen SignalDegradationDetected eventlerini event_store'a yazar.
+
+    Dedektör durumu tüm sinyal akışını gören tek bir tüketicide tutulur (web worker'larında tutulsaydı her
+    process akışın sadece bir kısmını görürdü). Her batch'ten sonra değişen anahtarların durumu
+    degradation_state koleksiyonuna, son _id analysis_checkpoints'e yazılır; yeniden başlayan tüketici
+    istatistikleri baştan ısıtmak zorunda kalmaz. Analiz gibi son SIGNAL_CHECKPOINT_LAG_SECONDS bir sonraki
+    çalıştırmaya bırakılır (signal_high_water); geç commit edilen sinyaller dedektörü atlamaz.
+    """
+    state_collection_name = 'degradation_state'
+    checkpoint_collection_name = 'analysis_checkpoints'
+    checkpoint_id = 'degradation'
+
+    def __init__(self, store, batch_size=10000, detector=None):
+        self.store = store
+        self.db = store.db
+        self.batch_size = batch_size
+        self.state_collection = self.db[self.state_collection_name]
+        self.checkpoint_collection = self.db[self.checkpoint_collection_name]
+        self.detector = detector or DegradationDetector(
+            fast_alpha=settings.DEGRADATION_FAST_ALPHA,
+            slow_alpha=settings.DEGRADATION_SLOW_ALPHA,
+            z_threshold=settings.DEGRADATION_Z_THRESHOLD,
+            min_samples=settings.DEGRADATION_MIN_SAMPLES,
+        )
+        self._loaded = False
+
+    def reset(self):
+        self.state_collection.delete_many({})
+        self.checkpoint_collection.delete_one({"_id": self.checkpoint_id})
+        self.detector.states.clear()
+
+    def load(self):
+        for doc in self.state_collection.find({}, {"_id": 0}):
+            self.detector.load_state_doc(doc)
+        self._loaded = True
+
+    def load_checkpoint(self):
+        doc = self.checkpoint_collection.find_one({"_id": self.checkpoint_id})
+        return doc.get('last_id') if doc else None
+
+    def save(self, touched, last_id):
+        operations = []
+        for key in touched:
+            doc = self.detector.state_doc(key)
+            operations.append(ReplaceOne(
+                {"house_id": doc['house_id'], "room": doc['room'], "bssid": doc['bssid']}, doc, upsert=True
+            ))
+        if operations:
+            self.state_collection.bulk_write(operations, ordered=False)
+        self.checkpoint_collection.update_one(
+            {"_id": self.checkpoint_id}, {"$set": {"last_id": last_id}}, upsert=True
+        )
+
+    def run(self):
+        """
+        Checkpoint'ten itibaren tüm yeni sinyalleri işler.
+        Dönüş: {"signals": işlenen sinyal, "events": üretilen SignalDegradationDetected sayısı}
+        """
+        if not self._loaded:
+            self.load()
+        last_id = self.load_checkpoint()
+        high_water = signal_high_water()
+        stats = {"signals": 0, "events": 0}
+        while True:
+            docs = self.store.get_signals_after(last_id, limit=self.batch_size, before_id=high_water)
+            if not docs:
+                break
+            # Sayfa dolmadıysa sınırın altındaki her şey okundu; checkpoint sınıra ilerler
+            last_id = docs[-1]['_id'] if len(docs) >= self.batch_size else high_water
+            events, touched = self.detector.process(docs)
+            if events:
+                self.store.append_many(events)
+            self.save(touched, last_id)
+
+            stats["signals"] += len(docs)
+            stats["events"] += len(events)
+        return stats
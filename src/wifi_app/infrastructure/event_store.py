@@ -1,89 +1,806 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from django.conf import settings
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+from .dedup import get_recent_event_ids
 from .mongo_client import MongoDBClient
+from .read_routing import routed
+from .indexes import ensure_indexes, find_collection_scans
+from .projections import (
+    LatestRoomMetricsProjection,
+    LatestRecommendationProjection,
+    HouseRegistryProjection,
+    SignalRollupProjection,
+    FleetSummaryProjection
+)
+from .projections.fleet import summarize_fleet
+from .projections.rollups import (
+    ROLLUP_METRICS, ROOM_PERCENTILE_METRICS, merge_rollups, room_percentiles, summarize_rollup
+)
+from .signal_codec import (
+    SIGNAL_EVENT_TYPE, SIGNAL_LIST_FIELDS, encode_compact, decode_signal, flatten_signal,
+    flatten_signal_projection
+)
+from .signal_buckets import BucketedSignalStore
+from .snapshots import AggregateSnapshotStore
+from ..domain.aggregates import HouseAggregate
 from ..domain.events import Event
 from bson import ObjectId
 
-class MongoEventStore:
+VERSION_INDEX_NAME = 'aggregate_version_unique'
+EVENT_ID_INDEX_NAME = 'event_id_unique'
+DUPLICATE_KEY_ERROR = 11000
+
+
+class ConcurrencyError(Exception):
+    """
+    Aggregate'in versiyonu beklenenden farklı (başka bir yazıcı araya event ekledi).
+    Çağıran aggregate'i yeniden yükleyip işlemi tekrar denemeli.
+    """
+
+
+def is_version_conflict(error):
+    """
+    Duplicate key hatası (aggregate_id, version) unique index'inden mi geliyor.
+    """
+    return VERSION_INDEX_NAME in str(error.get('errmsg', '')) or \
+        set(error.get('keyPattern', {})) == {'aggregate_id', 'version'}
+
+
+def is_duplicate_event(error):
+    """
+    Duplicate key hatası event_id unique index'inden mi geliyor (aynı event daha önce yazılmış).
+    """
+    if error.get('code', DUPLICATE_KEY_ERROR) != DUPLICATE_KEY_ERROR:
+        return False
+    return EVENT_ID_INDEX_NAME in str(error.get('errmsg', '')) or set(error.get('keyPattern', {})) == {'event_id'}
+
+
+class EventStoreQueries:
+    """
+    Sync ve async event store'ların ortak sorgu şekilleri. Cursor metodları sadece self.db ve
+    self.collection kullanır; pymongo'nun sync ve async cursor'ları aynı zincir API'sine sahiptir.
+    """
+    # Sunucu tarafı analizin ve degradation detector'ün sinyallerden okuduğu alanlar
+    ANALYSIS_FIELDS = {
+        "aggregate_id": 1,
+        "payload.room": 1,
+        "payload.bssid": 1,
+        "payload.rssi": 1,
+        "payload.latency_ms": 1,
+        "payload.packet_loss_rate": 1,
+        "payload.link_speed_mbps": 1,
+        "enc": 1,
+    }
+    # Ev dashboard'undaki son sinyallerin alanları
+    DASHBOARD_SIGNAL_FIELDS = ("timestamp", "room", "band", "rssi", "latency_ms", "link_speed_mbps", "packet_loss_rate")
+    # Aggregate başına son ayrılan versiyon ({_id: house_id, version})
+    versions_collection_name = 'aggregate_versions'
+
+    # Okuma metodları cursor'larını buradan alır; ensure_indexes --check aynı cursor'ları explain() ile denetler.
+    # Dashboard sorguları routed() ile MONGO_READ_ROUTES'taki read preference'la okunur; yazmalar primary'ye gider.
+
+    def _registered_houses_cursor(self):
+        return routed(HouseRegistryProjection().collection(self.db), 'get_registered_houses')\
+            .find({}, {"payload": 1}).sort("_id", 1)
+
+    def _house_cursor(self, house_id):
+        return routed(HouseRegistryProjection().collection(self.db), 'get_registered_houses')\
+            .find({"_id": house_id}, {"_id": 0, "payload": 1}).limit(1)
+
+    def _recent_signals_cursor(self, limit=50, house_id=None, cursor=None):
+        query = {"event_type": "WifiSignalCaptured"}
+        
+        if house_id:
+            query["aggregate_id"] = house_id
+
+        if cursor:
+            try:
+                query["_id"] = {"$lt": ObjectId(cursor)}
+            except:
+                pass 
+
+        return routed(self.collection, 'get_recent_signals').find(query)\
+            .sort("_id", -1)\
+            .limit(int(limit))
+
+    def _signals_after_cursor(self, after_id=None, limit=10000, before_id=None):
+        query = {"event_type": "WifiSignalCaptured"}
+        id_range = {}
+        if after_id is not None:
+            id_range["$gt"] = after_id
+        if before_id is not None:
+            id_range["$lt"] = before_id
+        if id_range:
+            query["_id"] = id_range
+        return self.collection.find(query, self.ANALYSIS_FIELDS)\
+            .sort("_id", 1)\
+            .limit(int(limit))
+
+    @staticmethod
+    def _signal_filter(house_id=None, since=None, until=None, room=None, band=None, device_id=None,
+                       order='desc', cursor=None):
+        """
+        find_signals sorgusunun (_id aralığı, payload eşitlikleri) parçaları. since/until _id'nin zaman
+        damgasına (saniye hassasiyetinde ekleme zamanı) uygulanır; böylece event_type/aggregate_id/_id
+        indexleri kullanılır. cursor, sıralama yönünde son görülen _id'dir.
+        """
+        id_range = {}
+        if since is not None:
+            id_range["$gte"] = ObjectId.from_datetime(since)
+        upper = ObjectId.from_datetime(until) if until is not None else None
+        if cursor is not None:
+            if order == 'desc':
+                upper = min(upper, cursor) if upper is not None else cursor
+            else:
+                id_range["$gt"] = cursor
+        if upper is not None:
+            id_range["$lt"] = upper
+        match = {name: value for name, value in (("room", room), ("band", band), ("device_id", device_id)) if value}
+        return house_id, id_range, match
+
+    def _signal_query(self, house_id, id_range, match):
+        query = {"event_type": SIGNAL_EVENT_TYPE}
+        if house_id:
+            query["aggregate_id"] = house_id
+        if id_range:
+            query["_id"] = id_range
+        for name, value in match.items():
+            query[f"payload.{name}"] = value
+        return query
+
+    def _find_signals_pipeline(self, query, order='desc', limit=50, fields=None):
+        pipeline = [
+            {"$match": query},
+            {"$sort": {"_id": -1 if order == 'desc' else 1}},
+        ]
+        if limit is not None:
+            pipeline.append({"$limit": int(limit)})
+        pipeline.append({"$project": flatten_signal_projection(fields)})
+        return pipeline
+
+    def _find_signals_cursor(self, query, order='desc', limit=50, projection=None):
+        # Pipeline'ın $match + $sort kısmı; explain ve compact format okuması için
+        cursor = routed(self.collection, 'find_signals').find(query, projection)\
+            .sort("_id", -1 if order == 'desc' else 1)
+        return cursor.limit(int(limit)) if limit is not None else cursor
+
+    def _latest_recommendation_cursor(self, house_id):
+        return routed(LatestRecommendationProjection().collection(self.db), 'get_latest_recommendation')\
+            .find({"_id": house_id}).limit(1)
+
+    def _room_metrics_cursor(self, house_id):
+        return routed(LatestRoomMetricsProjection().collection(self.db), 'get_house_room_metrics').find(
+            {"house_id": house_id}, {"_id": 0, "payload": 1}
+        )
+
+    def _fleet_summary_cursor(self):
+        # Birkaç sayaç dokümanı; _id sıralaması planı _id index'ine (IXSCAN) yönlendirir
+        return routed(FleetSummaryProjection().collection(self.db), 'get_fleet_summary').find({}).sort("_id", 1)
+
+    def _worst_rooms_cursor(self, limit=10):
+        return routed(LatestRoomMetricsProjection().collection(self.db), 'get_fleet_summary').find(
+            {"payload.overall_rating": {"$ne": None}}, {"_id": 0, "payload": 1}
+        ).sort("payload.overall_rating", 1).limit(int(limit))
+
+    def _room_rollups_cursor(self, house_id, since, metrics=ROOM_PERCENTILE_METRICS):
+        projection = {"_id": 0, "room": 1, "count": 1}
+        projection.update({metric: 1 for metric in metrics})
+        return routed(SignalRollupProjection().collection(self.db), 'get_house_room_metrics').find(
+            {"house_id": house_id, "resolution": '1h', "bucket": {"$gte": since}}, projection
+        )
+
+    @staticmethod
+    def _percentile_window_start():
+        return datetime.utcnow().replace(minute=0, second=0, microsecond=0) \
+            - timedelta(hours=settings.ROOM_PERCENTILE_WINDOW_HOURS - 1)
+
+    @staticmethod
+    def _attach_percentiles(rooms_metrics, percentiles):
+        # RoomPerformanceCalculated oda adı room_name, sinyallerin oda adı room alanındadır
+        for metrics in rooms_metrics:
+            metrics['percentiles'] = percentiles.get(metrics.get('room_name'))
+        return rooms_metrics
+
+    @staticmethod
+    def _recommendation_payload(doc):
+        if not doc:
+            return None
+        payload = doc.get('payload', {})
+        payload['generated_at'] = doc.get('timestamp')
+        return payload
+
+    @classmethod
+    def _house_dashboard(cls, house_id, house, rooms_metrics, rollups, recommendation, latest_signals):
+        """
+        get_house_dashboard parçalarını tek yanıtta birleştirir. Oda yüzdelikleri ve pencere içi sinyal özeti
+        aynı saatlik rollup dokümanlarından hesaplanır.
+        """
+        cls._attach_percentiles(rooms_metrics, room_percentiles(rollups))
+        rooms = {}
+        for room, acc in merge_rollups(rollups, lambda doc: doc.get('room'), ROLLUP_METRICS).items():
+            item = {"count": acc["count"]}
+            for metric in ROLLUP_METRICS:
+                stats = acc.get(metric)
+                count = stats["sketch"].count if stats else 0
+                item[metric] = round(stats["sum"] / count, 2) if count else None
+            rooms[room] = item
+        return {
+            "house_id": house_id,
+            "house": house.get('payload') if house else None,
+            "rooms": rooms_metrics,
+            "recommendation": cls._recommendation_payload(recommendation),
+            "signals": {
+                "window_hours": settings.ROOM_PERCENTILE_WINDOW_HOURS,
+                "count": sum(item["count"] for item in rooms.values()),
+                "rooms": rooms,
+                "latest": latest_signals,
+            },
+        }
+
+    def _timeseries_cursor(self, house_id, resolution, since, until, room=None, band=None):
+        query = {
+            "house_id": house_id,
+            "resolution": resolution,
+            "bucket": {"$gte": since, "$lt": until}
+        }
+        if room:
+            query["room"] = room
+        if band:
+            query["band"] = band
+        return routed(SignalRollupProjection().collection(self.db), 'get_signal_timeseries')\
+            .find(query, {"_id": 0, "expires_at": 0})\
+            .sort("bucket", 1)
+
+    def _aggregate_events_cursor(self, house_id, after_version=None, batch_size=1000):
+        # Snapshot yoksa evin tüm geçmişi (versiyonlama öncesi eventler dahil), varsa sadece sonrası
+        if after_version is None:
+            query = {"event_type": {"$in": list(HouseAggregate.event_types)}, "aggregate_id": house_id}
+        else:
+            query = {"aggregate_id": house_id, "version": {"$gt": after_version}}
+        return self.collection.find(query).batch_size(batch_size)
+
+    @staticmethod
+    def _version_counts(docs):
+        counts = {}
+        for doc in docs:
+            aggregate_id = doc.get('aggregate_id')
+            if aggregate_id is not None:
+                counts[aggregate_id] = counts.get(aggregate_id, 0) + 1
+        return counts
+
+    @staticmethod
+    def _reserve_versions_args(aggregate_id, count, expected_version=None):
+        """
+        aggregate_versions sayacından count adet versiyon ayıran find_one_and_update argümanları.
+        expected_version verilirse sayaç sadece bu değerdeyse artırılır (optimistic concurrency).
+        """
+        query = {"_id": aggregate_id}
+        if expected_version is not None:
+            query["version"] = expected_version
+        return {
+            "filter": query,
+            "update": {"$inc": {"version": count}},
+            # Sayaç dokümanı yoksa aggregate'in ilk eventi yazılıyordur
+            "upsert": expected_version is None or expected_version == 0,
+            "return_document": ReturnDocument.AFTER,
+        }
+
+    @staticmethod
+    def _assign_versions(docs, counts, heads, expected_version=None):
+        """
+        Ayrılan versiyon aralıklarını dokümanlara sırasıyla atar. heads: {aggregate_id: güncellenmiş sayaç dokümanı}
+        """
+        next_versions = {}
+        for aggregate_id, count in counts.items():
+            head = heads.get(aggregate_id)
+            if head is None:
+                raise ConcurrencyError(
+                    f"Aggregate {aggregate_id!r} is not at expected version {expected_version}."
+                )
+            next_versions[aggregate_id] = head['version'] - count + 1
+        for doc in docs:
+            aggregate_id = doc.get('aggregate_id')
+            if aggregate_id in next_versions:
+                doc['version'] = next_versions[aggregate_id]
+                next_versions[aggregate_id] += 1
+
+    @staticmethod
+    def _check_versioning(expected_version):
+        if expected_version is not None:
+            raise ValueError("expected_version requires AGGREGATE_VERSIONING=True.")
+
+    @staticmethod
+    def _check_expected_version(counts, expected_version):
+        if expected_version is not None and len(counts) > 1:
+            raise ValueError("expected_version requires all events to belong to the same aggregate.")
+
+    @staticmethod
+    def _duplicate_event_ids(exc, sources):
+        """
+        Unordered insert hatasında event_id unique index'ine takılan (daha önce yazılmış) kaynak dokümanların
+        event_id'leri. Başka bir yazma hatası da varsa None döner ve çağıran hatayı yükseltir.
+        """
+        if isinstance(exc, DuplicateKeyError):
+            return {sources[0]['event_id']} if is_duplicate_event(exc.details or {}) else None
+        errors = exc.details.get('writeErrors', [])
+        if not all(is_duplicate_event(error) for error in errors):
+            return None
+        return {sources[error['index']]['event_id'] for error in errors}
+
+    def _events_cursor(self, event_types, batch_size=1000, before_id=None):
+        query = {"event_type": {"$in": list(event_types)}}
+        if before_id is not None:
+            query["_id"] = {"$lt": before_id}
+        return self.collection.find(query)\
+            .sort("_id", 1)\
+            .batch_size(batch_size)
+
+
+class MongoEventStore(EventStoreQueries):
+    # Indexler process başına bir kez oluşturulur
+    _indexes_ensured = False
+    # append sonrası çağrılan handler'lar: handler(db, docs)
+    _subscribers = []
+
     def __init__(self):
         self.db = MongoDBClient.get_db()
         self.collection = self.db['event_store']
+        # Sinyal saklama formatı: document (eski) | compact | bucketed
+        self.signal_format = settings.SIGNAL_STORAGE_FORMAT
+        self.signal_buckets = BucketedSignalStore(self.db) if self.signal_format == 'bucketed' else None
+        self.snapshots = AggregateSnapshotStore(self.db)
+        if settings.MONGO_ENSURE_INDEXES and not MongoEventStore._indexes_ensured:
+            ensure_indexes(self.db)
+            MongoEventStore._indexes_ensured = True
+
+    @classmethod
+    def subscribe(cls, handler):
+        """
+        Eklenen eventleri dinleyecek bir handler kaydeder (projeksiyonlar vb.).
+        """
+        if handler not in cls._subscribers:
+            cls._subscribers.append(handler)
+
+    @classmethod
+    def publish(cls, db, docs):
+        """
+        Eklenen event dokümanlarını kayıtlı handler'lara iletir.
+        """
+        for handler in cls._subscribers:
+            handler(db, docs)
+
+    def _publish(self, docs):
+        self.publish(self.db, docs)
+
+    def _insert(self, docs, sources=None):
+        """
+        Dokümanları event_store'a unordered yazar. event_id'si zaten kayıtlı olanlar (tekrar gönderilen
+        okumalar) hata değil başarı sayılır; dönüş bu dokümanların event_id kümesidir.
+        """
+        sources = sources or docs
+        try:
+            if len(docs) == 1:
+                self.collection.insert_one(docs[0])
+            else:
+                self.collection.insert_many(docs, ordered=False)
+        except (DuplicateKeyError, BulkWriteError) as exc:
+            duplicates = self._duplicate_event_ids(exc, sources)
+            if duplicates is None:
+                raise
+            return duplicates
+        return set()
 
-    def append(self, event: Event):
+    def _write(self, docs):
+        """
+        Event dokümanlarını saklama formatına göre yazar ve her dokümana _id atar.
+        Sinyaller compact formatta event_store'a veya bucketed formatta signal_buckets'a gider;
+        subscriber'lar her durumda eski doküman şeklini görür.
+        Dönüş: daha önce yazılmış olduğu için atlanan dokümanların event_id'leri.
+        """
+        if self.signal_format == 'document':
+            return self._insert(docs)
+
+        signals = [d for d in docs if d.get('event_type') == SIGNAL_EVENT_TYPE]
+        others = [d for d in docs if d.get('event_type') != SIGNAL_EVENT_TYPE]
+        duplicates = set()
+        if self.signal_buckets is not None:
+            if signals:
+                # Bucket dizilerinde unique index yok; tekrarlar ingest_dedup ile ayıklanır
+                duplicates = self.signal_buckets.claim(signals)
+                signals = [d for d in signals if d['event_id'] not in duplicates]
+            if signals:
+                self.signal_buckets.write(signals)
+            to_insert = others
+            sources = others
+        else:
+            to_insert = [encode_compact(d) if d.get('event_type') == SIGNAL_EVENT_TYPE else d for d in docs]
+            sources = docs
+        if to_insert:
+            duplicates |= self._insert(to_insert, sources)
+            for source, inserted in zip(sources, to_insert):
+                source['_id'] = inserted['_id']
+        return duplicates
+
+    def _reserve_versions(self, docs, expected_version=None):
+        """
+        Dokümanlara aggregate başına artan version atar (AGGREGATE_VERSIONING). Her aggregate için
+        sayaçtan tek find_one_and_update ile batch'teki event sayısı kadar versiyon ayrılır.
+        """
+        if not settings.AGGREGATE_VERSIONING:
+            self._check_versioning(expected_version)
+            return
+        counts = self._version_counts(docs)
+        self._check_expected_version(counts, expected_version)
+        versions = self.db[self.versions_collection_name]
+        heads = {}
+        for aggregate_id, count in counts.items():
+            try:
+                heads[aggregate_id] = versions.find_one_and_update(
+                    **self._reserve_versions_args(aggregate_id, count, expected_version)
+                )
+            except DuplicateKeyError:
+                # expected_version=0 iken sayaç zaten var: aggregate'e başka bir yazıcı event eklemiş
+                heads[aggregate_id] = None
+        self._assign_versions(docs, counts, heads, expected_version)
+
+    def _write_versioned(self, docs, expected_version=None):
+        """
+        Dokümanlara versiyon atayıp yazar ve yazılanları döner. Bu process'in daha önce yazdığı idempotent
+        event_id'ler versiyon ayrılmadan atlanır; veritabanında yakalanan tekrarlar ayrılan versiyonda boşluk
+        bırakır (versiyonlar artan ama ardışık olmayabilir).
+        """
+        recent = get_recent_event_ids()
+        docs, _ = recent.split(docs)
+        if not docs:
+            return []
+        self._reserve_versions(docs, expected_version)
+        try:
+            duplicates = self._write(docs)
+        except DuplicateKeyError as exc:
+            if is_version_conflict(exc.details or {}):
+                raise ConcurrencyError(str(exc)) from exc
+            raise
+        except BulkWriteError as exc:
+            if any(is_version_conflict(error) for error in exc.details.get('writeErrors', [])):
+                raise ConcurrencyError(str(exc)) from exc
+            raise
+        recent.remember((doc['event_id'] for doc in docs), len(duplicates))
+        if duplicates:
+            return [doc for doc in docs if doc['event_id'] not in duplicates]
+        return docs
+
+    def append(self, event: Event, expected_version=None):
         """
         Herhangi bir Domain Event'i (Sinyal, Ev Kaydı, Analiz, Öneri) veritabanına kaydeder.
+        expected_version verilirse evin son versiyonu bu değilse ConcurrencyError fırlatılır.
+        Aynı event_id daha önce yazılmışsa (tekrar gönderim) hiçbir şey yazılmaz ve False döner.
         """
-        event_data = event.to_dict()
-        self.collection.insert_one(event_data)
+        written = self._write_versioned([event.to_dict()], expected_version)
+        if written:
+            self._publish(written)
+        return bool(written)
+
+    def append_many(self, events, expected_version=None):
+        """
+        Birden fazla Domain Event'i tek bir insert_many çağrısıyla kaydeder.
+        ordered=False kullanıldığı için bir dokümandaki hata diğerlerinin yazılmasını engellemez.
+        expected_version sadece tüm eventler aynı eve aitse kullanılabilir.
+        Daha önce yazılmış event_id'ler atlanır; sadece yazılan dokümanlar yayınlanır ve döner.
+        """
+        docs = [event.to_dict() for event in events]
+        if not docs:
+            return []
+        written = self._write_versioned(docs, expected_version)
+        if written:
+            self._publish(written)
+        return written
 
     def get_registered_houses(self):
         """
-        Sisteme kayıtlı tüm evleri (HouseRegistered eventlerini) getirir.
+        Sisteme kayıtlı tüm evleri houses okuma modelinden getirir.
         """
-        cursor = self.collection.find({"event_type": "HouseRegistered"})
-        houses = []
-        for doc in cursor:
-            house_data = doc.get('payload', {})
-            houses.append(house_data)
-        return houses
+        cursor = self._registered_houses_cursor()
+        return [doc.get('payload', {}) for doc in cursor]
+
+    def get_registry_version(self):
+        """
+        Ev listesinin versiyonunu döner; her HouseRegistered eventinde artar.
+        """
+        return HouseRegistryProjection().get_version(self.db)
 
     def get_recent_signals(self, limit=50, house_id=None, cursor=None):
         """
         Son gelen Wifi sinyallerini (WifiSignalCaptured) getirir.
         Cursor Pagination destekler.
         """
-        query = {"event_type": "WifiSignalCaptured"}
-        
-        if house_id:
-            query["aggregate_id"] = house_id
+        if self.signal_buckets is not None:
+            return self.signal_buckets.recent(limit=limit, house_id=house_id, cursor=cursor)
 
-        if cursor:
-            try:
-                query["_id"] = {"$lt": ObjectId(cursor)}
-            except:
-                pass 
-
-        cursor_result = self.collection.find(query)\
-            .sort("_id", -1)\
-            .limit(int(limit))
+        cursor_result = self._recent_signals_cursor(limit, house_id, cursor)
         
-        events = list(cursor_result)
+        events = [decode_signal(doc) for doc in cursor_result]
         for event in events:
             event['_id'] = str(event['_id'])
             
         return events
 
+    def get_signals_after(self, after_id=None, limit=10000, before_id=None):
+        """
+        _id'si after_id'den büyük (before_id verilirse ondan küçük) sinyalleri eklenme sırasıyla, analiz için
+        gereken alanlarla getirir. Checkpoint'li okuyucular before_id olarak signal_high_water() kullanır.
+        """
+        if self.signal_buckets is not None:
+            fields = {k.split('.', 1)[1] for k in self.ANALYSIS_FIELDS if k.startswith('payload.')}
+            return self.signal_buckets.after(after_id, limit=limit, fields=fields, before_id=before_id)
+        return [decode_signal(doc) for doc in self._signals_after_cursor(after_id, limit, before_id)]
+
+    def find_signals(self, house_id=None, since=None, until=None, room=None, band=None, device_id=None,
+                     order='desc', cursor=None, limit=50, fields=None):
+        """
+        Sinyalleri filtreleyip _id sırasıyla (keyset) düz kayıtlar olarak döner. Her kayıtta cursor için
+        mongo_id bulunur. document formatında alan seçimi ve düzleştirme aggregation $project ile
+        Mongo'da yapılır; compact/bucketed formatlarda kayıtlar decode edilip Python'da düzleştirilir.
+        """
+        return list(self.iter_signals(
+            house_id, since, until, room, band, device_id, order, cursor, limit, fields, batch_size=limit
+        ))
+
+    def iter_signals(self, house_id=None, since=None, until=None, room=None, band=None, device_id=None,
+                     order='desc', cursor=None, limit=None, fields=None, batch_size=5000):
+        """
+        find_signals ile aynı filtreler; kayıtları cursor'dan batch_size'lık parçalarla okuyarak tek tek
+        üretir (export). limit verilmezse tüm eşleşen kayıtlar döner; bellek kullanımı sabittir.
+        """
+        house_id, id_range, match = self._signal_filter(
+            house_id, since, until, room, band, device_id, order, cursor
+        )
+        fields = None if fields is None else set(fields) | {"mongo_id"}
+        batch_size = max(1, int(batch_size or 5000))
+
+        if self.signal_buckets is not None:
+            if limit is not None:
+                docs = self.signal_buckets.query(house_id, id_range, match, descending=order == 'desc', limit=limit)
+            else:
+                docs = self.signal_buckets.iter_query(house_id, id_range, match, descending=order == 'desc')
+            for doc in docs:
+                yield flatten_signal(doc, fields)
+            return
+
+        query = self._signal_query(house_id, id_range, match)
+        if self.signal_format == 'compact':
+            projection = None
+            if fields is not None:
+                projection = {SIGNAL_LIST_FIELDS[name][0]: 1 for name in fields}
+                projection.update({"aggregate_id": 1, "enc": 1})
+            cursor_result = self._find_signals_cursor(query, order, limit, projection).batch_size(batch_size)
+            for doc in cursor_result:
+                yield flatten_signal(decode_signal(doc), fields)
+            return
+        yield from routed(self.collection, 'find_signals').aggregate(
+            self._find_signals_pipeline(query, order, limit, fields), batchSize=batch_size
+        )
+
     def get_latest_recommendation(self, house_id):
         """
         Belirli bir ev için oluşturulmuş EN SON öneri raporunu (PerformanceRecommendationGenerated) getirir.
+        house_recommendation_latest okuma modelinden tek doküman okur.
         """
-        doc = self.collection.find_one(
-            {
-                "event_type": "PerformanceRecommendationGenerated",
-                "aggregate_id": house_id
-            },
-            sort=[("timestamp", -1)] 
-        )
-        
-        if doc:
-            payload = doc.get('payload', {})
-            payload['generated_at'] = doc.get('timestamp')
-            return payload
-        return None
+        return self._recommendation_payload(next(self._latest_recommendation_cursor(house_id), None))
 
     def get_house_room_metrics(self, house_id):
         """
         Bir evin tüm odaları için hesaplanmış en son performans metriklerini (RoomPerformanceCalculated) getirir.
+        house_room_metrics_latest okuma modelinden oda başına bir doküman okur. Her odaya son
+        ROOM_PERCENTILE_WINDOW_HOURS saatin saatlik rollup sketch'lerinden gecikme ve RSSI p50/p90/p99'u eklenir.
         """
-        cursor = self.collection.find({
-            "event_type": "RoomPerformanceCalculated",
-            "aggregate_id": house_id
-        }).sort("timestamp", -1)
-        
-        rooms_data = {}
-        for doc in cursor:
-            payload = doc.get('payload', {})
-            room_name = payload.get('room_name')
-            
-            if room_name and room_name not in rooms_data:
-                rooms_data[room_name] = payload
-        
-        return list(rooms_data.values())
\ No newline at end of file
+        rooms_metrics = [doc.get('payload', {}) for doc in self._room_metrics_cursor(house_id)]
+        percentiles = room_percentiles(self._room_rollups_cursor(house_id, self._percentile_window_start()))
+        return self._attach_percentiles(rooms_metrics, percentiles)
+
+    def get_house_dashboard(self, house_id):
+        """
+        Ev sayfasının tüm verisini tek yanıtta döner: kayıt bilgisi, oda metrikleri (yüzdeliklerle), son öneri,
+        son HOUSE_DASHBOARD_SIGNALS sinyal ve pencere içi oda bazlı sinyal özeti. Beş sorgu paralel çalışır;
+        MONGO_CAUSAL_CONSISTENCY açıkken istek oturumu eşzamanlı kullanılamayacağı için sırayla çalışır.
+        """
+        since = self._percentile_window_start()
+        parts = (
+            lambda: next(self._house_cursor(house_id), None),
+            lambda: [doc.get('payload', {}) for doc in self._room_metrics_cursor(house_id)],
+            lambda: list(self._room_rollups_cursor(house_id, since, ROLLUP_METRICS)),
+            lambda: next(self._latest_recommendation_cursor(house_id), None),
+            lambda: self.find_signals(
+                house_id=house_id, limit=settings.HOUSE_DASHBOARD_SIGNALS, fields=self.DASHBOARD_SIGNAL_FIELDS
+            ),
+        )
+        if settings.MONGO_CAUSAL_CONSISTENCY:
+            results = [part() for part in parts]
+        else:
+            results = list(get_query_executor().map(lambda part: part(), parts))
+        return self._house_dashboard(house_id, *results)
+
+    def get_fleet_summary(self, worst=10):
+        """
+        Tüm evlerin özetini döner: son öneri önem derecesi sayıları, oda skoru histogramları, ev tipi başına
+        ortalamalar (fleet_summary sayaçlarından) ve overall_rating'i en düşük worst oda.
+        """
+        summary = summarize_fleet(self._fleet_summary_cursor())
+        # limit(0) limitsiz demektir; worst=0 sorgu yapmaz
+        summary["worst_rooms"] = [doc.get('payload', {}) for doc in self._worst_rooms_cursor(worst)] if worst else []
+        return summary
+
+    def get_signal_timeseries(self, house_id, resolution, since, until, room=None, band=None):
+        """
+        Bir evin sinyal rollup'larını (min/max/avg, p50/p90/p95/p99) verilen çözünürlük ve zaman aralığında getirir.
+        """
+        cursor = self._timeseries_cursor(house_id, resolution, since, until, room, band)
+        return [summarize_rollup(doc) for doc in cursor]
+
+    def load_aggregate(self, house_id, snapshot_every=None):
+        """
+        Evin durumunu (HouseAggregate) en son snapshot'tan kurar ve sadece snapshot'tan sonraki eventleri
+        (version > snapshot.version) oynatır; snapshot yoksa evin tüm geçmişi oynatılır.
+        snapshot_every'den (varsayılan AGGREGATE_SNAPSHOT_EVERY) fazla event oynatıldıysa snapshot ilerletilir.
+        """
+        if not settings.AGGREGATE_VERSIONING:
+            # Versiyonsuz eventler snapshot sonrası sorgusuna girmez; her zaman tam replay
+            aggregate = HouseAggregate(house_id)
+            for doc in self._iter_aggregate_events(house_id):
+                aggregate.apply(doc)
+            return aggregate
+
+        snapshot = self.snapshots.get(house_id)
+        aggregate = self.snapshots.restore(house_id, snapshot)
+        after_version = aggregate.version if self.snapshots.has_state(snapshot) else None
+        now = datetime.utcnow()
+        settled_version = self.snapshots.settled_version(snapshot, now)
+        # Settle süresini dolduran pending versiyona kadar olan eventler ayrıca bir sonraki snapshot'a uygulanır
+        candidate = self.snapshots.restore(house_id, snapshot) if settled_version is not None else None
+
+        replayed = 0
+        for doc in self._iter_aggregate_events(house_id, after_version):
+            aggregate.apply(doc)
+            replayed += 1
+            if candidate is not None and doc.get('version', 0) <= settled_version:
+                candidate.apply(doc)
+
+        if snapshot_every is None:
+            snapshot_every = settings.AGGREGATE_SNAPSHOT_EVERY
+        if replayed >= snapshot_every and (candidate is not None or snapshot is None or 'pending_at' not in snapshot):
+            self.snapshots.save(house_id, candidate, settled_version, aggregate.version, now)
+        return aggregate
+
+    def _iter_aggregate_events(self, house_id, after_version=None):
+        for doc in self._aggregate_events_cursor(house_id, after_version):
+            yield decode_signal(doc)
+        if self.signal_buckets is not None:
+            yield from self.signal_buckets.iter_aggregate(house_id, after_version)
+
+    def iter_event_batches(self, event_types, batch_size=1000, before_id=None):
+        """
+        Verilen tipteki eventleri _id sırasıyla batch'ler halinde döner (projeksiyon rebuild için).
+        Bucketed formatta sinyaller event_store'daki diğer eventlerden sonra bucket sırasıyla gelir.
+        before_id verilirse sadece _id'si ondan küçük eventler döner.
+        """
+        event_types = set(event_types)
+        if self.signal_buckets is not None and SIGNAL_EVENT_TYPE in event_types:
+            event_types.discard(SIGNAL_EVENT_TYPE)
+            if event_types:
+                yield from self.iter_event_batches(event_types, batch_size, before_id)
+            yield from self.signal_buckets.iter_batches(batch_size, before_id)
+            return
+
+        batch = []
+        for doc in self._events_cursor(event_types, batch_size=batch_size, before_id=before_id):
+            batch.append(decode_signal(doc))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def query_plans(self, house_id="__explain__"):
+        """
+        Store'un kullandığı tüm sorgu şekilleri için explain() çıktısını döner.
+        """
+        shapes = {
+            "get_registered_houses": self._registered_houses_cursor(),
+            "get_recent_signals": self._recent_signals_cursor(),
+            "get_recent_signals(house_id)": self._recent_signals_cursor(house_id=house_id),
+            "get_recent_signals(house_id, cursor)": self._recent_signals_cursor(
+                house_id=house_id, cursor=str(ObjectId())
+            ),
+            "get_signals_after": self._signals_after_cursor(ObjectId()),
+            "find_signals(house_id, since, until, room)": self._find_signals_cursor(self._signal_query(
+                *self._signal_filter(house_id, datetime(2000, 1, 1), datetime(2000, 1, 2), room="__explain__")
+            )),
+            "find_signals(order=asc, cursor)": self._find_signals_cursor(
+                self._signal_query(*self._signal_filter(order='asc', cursor=ObjectId())), order='asc'
+            ),
+            "get_latest_recommendation": self._latest_recommendation_cursor(house_id),
+            "get_house_dashboard(house)": self._house_cursor(house_id),
+            "get_house_room_metrics": self._room_metrics_cursor(house_id),
+            "get_house_room_metrics(percentiles)": self._room_rollups_cursor(house_id, datetime(2000, 1, 1)),
+            "get_fleet_summary": self._fleet_summary_cursor(),
+            "get_fleet_summary(worst_rooms)": self._worst_rooms_cursor(),
+            "get_signal_timeseries": self._timeseries_cursor(
+                house_id, '1h', datetime(2000, 1, 1), datetime(2000, 1, 2)
+            ),
+            "load_aggregate": self._aggregate_events_cursor(house_id),
+            "load_aggregate(after_version)": self._aggregate_events_cursor(house_id, after_version=0),
+            "iter_event_batches": self._events_cursor(
+                ["RoomPerformanceCalculated", "PerformanceRecommendationGenerated", "HouseRegistered", "WifiSignalCaptured"]
+            ),
+        }
+        if self.signal_buckets is not None:
+            shapes.update(self.signal_buckets.query_shapes())
+        return {name: cursor.explain() for name, cursor in shapes.items()}
+
+    def collection_scans(self):
+        """
+        COLLSCAN'e düşen sorgu şekillerini {sorgu_adi: [plan_yolu, ...]} olarak döner.
+        """
+        scans = {}
+        for name, plan in self.query_plans().items():
+            paths = find_collection_scans(plan)
+            if paths:
+                scans[name] = paths
+        return scans
+
+
+_shared_store = None
+_query_executor = None
+_query_executor_lock = threading.Lock()
+
+
+def get_query_executor():
+    """
+    Bir isteğin bağımsız sorgularını paralel çalıştıran process genelindeki thread havuzu.
+    """
+    global _query_executor
+    if _query_executor is None:
+        with _query_executor_lock:
+            if _query_executor is None:
+                _query_executor = ThreadPoolExecutor(
+                    max_workers=settings.HOUSE_DASHBOARD_QUERY_WORKERS, thread_name_prefix='store-query'
+                )
+    return _query_executor
+
+
+def signal_high_water():
+    """
+    Checkpoint'li sinyal okuyucularının (analiz, degradation detector) okuyabileceği _id üst sınırı (hariç).
+    _id'ler yazıcı process'lerde üretilir ve commit sırasıyla artmaz; geç commit edilen daha küçük _id'li bir
+    sinyal checkpoint'in gerisinde kalıp atlanmasın diye son SIGNAL_CHECKPOINT_LAG_SECONDS okunmaz.
+    """
+    # Sınır gelecekte olamaz: checkpoint henüz yazılmamış _id'lerin ilerisine geçerdi
+    lag = max(0, settings.SIGNAL_CHECKPOINT_LAG_SECONDS)
+    return ObjectId.from_datetime(datetime.utcnow() - timedelta(seconds=lag))
+
+
+def get_event_store():
+    """
+    Process genelinde paylaşılan MongoEventStore'u döner. Store durumsuzdur (koleksiyon referansları ve
+    ayarlar), istek başına yeniden kurulması gerekmez. MongoDBClient yenilendiyse (fork sonrası reset)
+    veya SIGNAL_STORAGE_FORMAT değiştiyse (testlerde override_settings) yeniden oluşturulur.
+    """
+    global _shared_store
+    store = _shared_store
+    if store is None or store.db.client is not MongoDBClient.get_client() \
+            or store.signal_format != settings.SIGNAL_STORAGE_FORMAT:
+        store = _shared_store = MongoEventStore()
+    return store
+
+
+def _reset_after_fork():
+    # Havuzun thread'leri fork'ta çocuğa geçmez; çocuk ilk kullanımda yenisini kurar
+    global _query_executor, _query_executor_lock
+    _query_executor = None
+    _query_executor_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
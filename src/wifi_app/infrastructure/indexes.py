@@ -0,0 +1,105 @@
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+# event_store koleksiyonundaki sorgu şekilleri için gerekli indexler.
+# Yeni bir sorgu eklendiğinde buradaki listeye karşılık gelen index de eklenmeli.
+EVENT_STORE_INDEXES = [
+    IndexModel([("event_id", ASCENDING)], unique=True, name="event_id_unique"),
+    # get_recent_signals (house_id olmadan) ve get_registered_houses
+    IndexModel([("event_type", ASCENDING), ("_id", DESCENDING)], name="event_type_id"),
+    # get_recent_signals (house_id ile)
+    IndexModel(
+        [("event_type", ASCENDING), ("aggregate_id", ASCENDING), ("_id", DESCENDING)],
+        name="event_type_aggregate_id"
+    ),
+    # Aggregate başına artan versiyon: aynı versiyonu yazmaya çalışan ikinci yazıcı duplicate key alır
+    # (ConcurrencyError). load_aggregate snapshot sonrası eventleri bu index'ten okur.
+    # Versiyonlama öncesi yazılmış eventlerde version alanı yoktur.
+    IndexModel(
+        [("aggregate_id", ASCENDING), ("version", ASCENDING)], unique=True, name="aggregate_version_unique",
+        partialFilterExpression={"version": {"$exists": True}}
+    ),
+]
+
+# Okuma modeli (projeksiyon) koleksiyonlarının indexleri
+READ_MODEL_INDEXES = {
+    # get_house_room_metrics; unique index aynı odanın iki kez upsert edilmesini engeller
+    'house_room_metrics_latest': [
+        IndexModel([("house_id", ASCENDING), ("room_name", ASCENDING)], unique=True, name="house_room_unique"),
+        # get_fleet_summary: en kötü N oda
+        IndexModel([("payload.overall_rating", ASCENDING)], name="overall_rating"),
+    ],
+    # get_signal_timeseries; bucket upsert'lerinin tekilliği
+    'signal_rollups': [
+        IndexModel(
+            [("house_id", ASCENDING), ("resolution", ASCENDING), ("bucket", ASCENDING),
+             ("room", ASCENDING), ("band", ASCENDING)],
+            unique=True, name="rollup_bucket_unique"
+        ),
+        # Dakikalık bucket'ların saklama süresi (expires_at sadece 1m bucket'larda set edilir)
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0, name="rollup_expiry"),
+    ],
+    # SIGNAL_STORAGE_FORMAT=bucketed: reading_id'li okumaların tekilleştirme kayıtları
+    'ingest_dedup': [
+        IndexModel([("expires_at", ASCENDING)], expireAfterSeconds=0, name="dedup_expiry"),
+    ],
+    # SIGNAL_STORAGE_FORMAT=bucketed: ev × pencere başına sinyal bucket'ları
+    'signal_buckets': [
+        # bucket upsert filtresi (house_id, start, count)
+        IndexModel([("house_id", ASCENDING), ("start", ASCENDING)], name="house_window"),
+        # get_recent_signals (house_id ile / olmadan)
+        IndexModel([("house_id", ASCENDING), ("max_id", DESCENDING)], name="house_max_id"),
+        IndexModel([("max_id", DESCENDING)], name="max_id"),
+        # find_signals (order=asc, house_id ile)
+        IndexModel([("house_id", ASCENDING), ("min_id", ASCENDING)], name="house_min_id"),
+        # get_signals_after
+        IndexModel([("min_id", ASCENDING)], name="min_id"),
+        # load_aggregate (snapshot sonrası okumalar)
+        IndexModel([("house_id", ASCENDING), ("max_version", ASCENDING)], name="house_max_version"),
+    ],
+    # Degradation detector: ev × oda × BSSID başına akış istatistikleri
+    'degradation_state': [
+        IndexModel(
+            [("house_id", ASCENDING), ("room", ASCENDING), ("bssid", ASCENDING)],
+            unique=True, name="house_room_bssid_unique"
+        ),
+    ],
+    # Sunucu tarafı analiz: ev × oda × zaman bucket'ı başına toplamlar
+    'analysis_room_windows': [
+        IndexModel(
+            [("house_id", ASCENDING), ("room", ASCENDING), ("bucket", ASCENDING)],
+            unique=True, name="house_room_bucket_unique"
+        ),
+        # Pencereden çıkan bucket'ların silinmesi
+        IndexModel([("bucket", ASCENDING)], name="bucket"),
+    ],
+}
+
+
+def ensure_indexes(db):
+    """
+    Tüm koleksiyonların indexlerini oluşturur. create_indexes idempotent olduğu için tekrar çağrılabilir.
+    """
+    names = db['event_store'].create_indexes(EVENT_STORE_INDEXES)
+    for collection_name, models in READ_MODEL_INDEXES.items():
+        names += db[collection_name].create_indexes(models)
+    return names
+
+
+def find_collection_scans(plan):
+    """
+    explain() çıktısındaki plan ağacını dolaşır ve COLLSCAN aşamalarının yollarını döner.
+    """
+    scans = []
+
+    def walk(node, path):
+        if isinstance(node, dict):
+            if node.get('stage') == 'COLLSCAN':
+                scans.append(path or 'root')
+            for key, value in node.items():
+                walk(value, f"{path}.{key}" if path else key)
+        elif isinstance(node, list):
+            for i, value in enumerate(node):
+                walk(value, f"{path}[{i}]")
+
+    walk(plan.get('queryPlanner', {}).get('winningPlan', {}), '')
+    return scans
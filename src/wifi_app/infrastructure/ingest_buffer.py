@@ -0,0 +1,193 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from django.conf import settings
+from .event_store import get_event_store
+from .metrics import register_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class BufferFull(Exception):
+    """
+    Ingest buffer dolu; istemci Retry-After süresi sonra tekrar denemeli.
+    """
+
+
+class FlushTicket:
+    """
+    ack-after-flush modunda isteğin, event'i içeren batch yazılana kadar beklemesini sağlar.
+    """
+
+    def __init__(self):
+        self._done = threading.Event()
+        self.error = None
+
+    def resolve(self, error=None):
+        self.error = error
+        self._done.set()
+
+    def wait(self, timeout):
+        return self._done.wait(timeout)
+
+
+class IngestBuffer:
+    """
+    Write-behind ingest buffer. Eventler sınırlı bir kuyruğa alınır ve arka plandaki yazıcı thread
+    tarafından flush_events adet birikince veya flush_interval_ms dolunca tek insert_many ile yazılır.
+    Kuyruk doluysa submit BufferFull fırlatır; gecikme birikmek yerine istemci geri itilir.
+    """
+
+    def __init__(self, store_factory, max_size, flush_events, flush_interval_ms):
+        self.store_factory = store_factory
+        self.flush_events = flush_events
+        self.flush_interval = flush_interval_ms / 1000
+        self._queue = queue.Queue(maxsize=max_size)
+        # Kuyruk doluyken durdurma işareti (None) eklenemezse yazıcı bu bayrakla kuyruk boşalınca durur
+        self._closing = threading.Event()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "flushed_events": 0,
+            "flush_count": 0,
+            "failed_events": 0,
+            "rejected_events": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
+
+    def submit(self, event, wait_for_flush=False):
+        """
+        Event'i kuyruğa ekler. wait_for_flush=True ise beklenecek FlushTicket döner.
+        """
+        self._ensure_writer()
+        ticket = FlushTicket() if wait_for_flush else None
+        try:
+            self._queue.put_nowait((event, ticket))
+        except queue.Full:
+            with self._stats_lock:
+                self._stats["rejected_events"] += 1
+            raise BufferFull()
+        return ticket
+
+    def _ensure_writer(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="ingest-buffer-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.flush_events:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._flush(batch)
+                    return
+                batch.append(item)
+            self._flush(batch)
+            if self._closing.is_set() and self._queue.empty():
+                return
+
+    def _flush(self, batch):
+        started = time.perf_counter()
+        error = None
+        try:
+            self.store_factory().append_many([event for event, _ in batch])
+        except Exception as exc:
+            error = exc
+            logger.exception("Ingest buffer flush failed for %d event(s)", len(batch))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        with self._stats_lock:
+            stats = self._stats
+            stats["flush_count"] += 1
+            stats["last_flush_ms"] = round(elapsed_ms, 3)
+            stats["max_flush_ms"] = round(max(stats["max_flush_ms"], elapsed_ms), 3)
+            stats["total_flush_ms"] += elapsed_ms
+            if error is None:
+                stats["flushed_events"] += len(batch)
+            else:
+                stats["failed_events"] += len(batch)
+
+        for _, ticket in batch:
+            if ticket is not None:
+                ticket.resolve(error)
+
+    def close(self, timeout=5):
+        """
+        Kuyruktaki eventleri yazıp yazıcı thread'i durdurur (process kapanırken). En fazla timeout saniye
+        bekler; dolu kuyruğa durdurma işareti eklenemezse de yazıcı kuyruk boşalınca kendiliğinden durur.
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+        deadline = time.monotonic() + timeout
+        self._closing.set()
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(max(0, deadline - time.monotonic()))
+        if self._thread.is_alive():
+            logger.warning("Ingest buffer closed with %d event(s) still queued", self._queue.qsize())
+
+    def metrics(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total_flush_ms = stats.pop("total_flush_ms")
+        stats["avg_flush_ms"] = round(total_flush_ms / stats["flush_count"], 3) if stats["flush_count"] else 0.0
+        stats["queue_depth"] = self._queue.qsize()
+        stats["capacity"] = self._queue.maxsize
+        stats["durability"] = settings.INGEST_BUFFER_DURABILITY
+        return stats
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_ingest_buffer():
+    """
+    Process genelinde paylaşılan ingest buffer'ı döner (ilk çağrıda oluşturulur).
+    """
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = IngestBuffer(
+                    store_factory=get_event_store,
+                    max_size=settings.INGEST_BUFFER_MAX_SIZE,
+                    flush_events=settings.INGEST_BUFFER_FLUSH_EVENTS,
+                    flush_interval_ms=settings.INGEST_BUFFER_FLUSH_INTERVAL_MS
+                )
+                atexit.register(_buffer.close)
+                register_metrics('ingest_buffer', _buffer.metrics)
+    return _buffer
+
+
+def _reset_after_fork():
+    # Yazıcı thread fork'ta çocuğa geçmez; ebeveynin kuyruğundaki eventleri ebeveyn yazar, çocuk boş bir
+    # buffer ile başlar (aynı eventler iki kez yazılmaz)
+    global _buffer, _buffer_lock
+    _buffer = None
+    _buffer_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,148 @@
+import asyncio
+import logging
+import threading
+import time
+from django.conf import settings
+from pymongo.errors import PyMongoError
+from .mongo_client import MongoDBClient
+from .signal_codec import decode_signal
+
+logger = logging.getLogger(__name__)
+
+
+class LiveSubscription:
+    """
+    Tek bir canlı akış istemcisinin sınırlı kuyruğu. Kuyruk dolduğunda en eski kayıt atılır ve
+    atılan kayıt sayısı tutulur; yavaş bir istemci diğerlerini veya yayıncıyı bekletmez.
+    """
+
+    def __init__(self, loop, house_id=None, maxsize=256):
+        self.loop = loop
+        self.house_id = house_id
+        self.queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, doc):
+        # Sadece subscription'ın event loop'u içinden çağrılır
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(doc)
+
+    def take_dropped(self):
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class LiveSignalBroker:
+    """
+    Yeni WifiSignalCaptured eventlerini bağlı canlı akış istemcilerine dağıtan process içi pub/sub.
+    Kaynak LIVE_FEED_SOURCE ile seçilir:
+      - inprocess: MongoEventStore.append subscriber'ı (sadece bu process'in yazdığı eventler)
+      - change_stream: event_store change stream'i (replica set gerekir, tüm process'lerin eventleri)
+      - auto: sunucu replica set ise change_stream, değilse inprocess
+    SIGNAL_STORAGE_FORMAT=bucketed iken sinyaller event_store'a yazılmadığı için her zaman inprocess kullanılır.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = set()
+        self._source = None
+        self._change_stream = None
+
+    @property
+    def source(self):
+        if self._source is None:
+            source = settings.LIVE_FEED_SOURCE
+            if settings.SIGNAL_STORAGE_FORMAT == 'bucketed':
+                source = 'inprocess'
+            elif source == 'auto':
+                source = 'change_stream' if self._is_replica_set() else 'inprocess'
+            self._source = source
+        return self._source
+
+    @staticmethod
+    def _is_replica_set():
+        try:
+            return bool(MongoDBClient.get_client().admin.command('hello').get('setName'))
+        except PyMongoError:
+            return False
+
+    def subscribe(self, house_id=None):
+        subscription = LiveSubscription(
+            asyncio.get_running_loop(), house_id=house_id, maxsize=settings.LIVE_FEED_QUEUE_SIZE
+        )
+        with self._lock:
+            self._subscriptions.add(subscription)
+        if self.source == 'change_stream':
+            self._ensure_change_stream()
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, docs):
+        """
+        Event dokümanlarını ilgili istemcilerin kuyruklarına bırakır. Herhangi bir thread'den çağrılabilir.
+        """
+        if not self._subscriptions:
+            return
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            matching = [
+                doc for doc in docs
+                if subscription.house_id is None or doc.get('aggregate_id') == subscription.house_id
+            ]
+            for doc in matching:
+                try:
+                    subscription.loop.call_soon_threadsafe(subscription.offer, doc)
+                except RuntimeError:
+                    # İstemcinin event loop'u kapanmış
+                    self.unsubscribe(subscription)
+                    break
+
+    def publish_appended(self, db, docs):
+        """
+        MongoEventStore subscriber'ı (inprocess kaynak).
+        """
+        if not self._subscriptions or self.source != 'inprocess':
+            return
+        signals = [doc for doc in docs if doc.get('event_type') == 'WifiSignalCaptured']
+        if signals:
+            self.publish(signals)
+
+    def _ensure_change_stream(self):
+        with self._lock:
+            if self._change_stream is None or not self._change_stream.is_alive():
+                self._change_stream = ChangeStreamFeed(self)
+                self._change_stream.start()
+
+
+class ChangeStreamFeed(threading.Thread):
+    """
+    event_store'a eklenen sinyalleri change stream ile izleyip broker'a aktarır.
+    Bağlantı koparsa son resume token'dan devam eder.
+    """
+    PIPELINE = [{"$match": {"operationType": "insert", "fullDocument.event_type": "WifiSignalCaptured"}}]
+
+    def __init__(self, broker):
+        super().__init__(name="live-feed-change-stream", daemon=True)
+        self.broker = broker
+        self.resume_token = None
+
+    def run(self):
+        collection = MongoDBClient.get_db()['event_store']
+        while True:
+            try:
+                with collection.watch(self.PIPELINE, resume_after=self.resume_token) as stream:
+                    for change in stream:
+                        self.resume_token = change['_id']
+                        self.broker.publish([decode_signal(change['fullDocument'])])
+            except PyMongoError:
+                logger.exception("Live feed change stream interrupted, retrying")
+                time.sleep(1)
+
+
+live_signal_broker = LiveSignalBroker()
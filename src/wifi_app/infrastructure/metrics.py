@@ -0,0 +1,18 @@
+import threading
+
+_lock = threading.Lock()
+_providers = {}
+
+
+def register_metrics(name, provider):
+    """
+    /api/metrics/ çıktısına eklenecek bir metrik kaynağı kaydeder. provider() dict döner.
+    """
+    with _lock:
+        _providers[name] = provider
+
+
+def metrics_snapshot():
+    with _lock:
+        providers = dict(_providers)
+    return {name: provider() for name, provider in providers.items()}
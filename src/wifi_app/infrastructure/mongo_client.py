@@ -1,16 +1,160 @@
+import os
+import threading
 from pymongo import MongoClient
+from pymongo.monitoring import ConnectionPoolListener
 from django.conf import settings
+from .metrics import register_metrics
+
+
+def client_options():
+    """
+    settings'teki havuz, zaman aşımı, read preference ve write concern ayarlarından MongoClient
+    seçenekleri. Sync ve async istemciler aynı seçenekleri kullanır; URI'deki aynı isimli seçenekleri ezer.
+    0 verilen zaman aşımları sınırsızdır (pymongo varsayılanı).
+    """
+    options = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": settings.MONGO_MAX_IDLE_TIME_MS or None,
+        "waitQueueTimeoutMS": settings.MONGO_WAIT_QUEUE_TIMEOUT_MS or None,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": settings.MONGO_CONNECT_TIMEOUT_MS or None,
+        "socketTimeoutMS": settings.MONGO_SOCKET_TIMEOUT_MS or None,
+        "readPreference": settings.MONGO_READ_PREFERENCE,
+        "appname": settings.MONGO_APP_NAME,
+    }
+    w = settings.MONGO_WRITE_CONCERN
+    if w:
+        options["w"] = int(w) if w.isdigit() else w
+    if settings.MONGO_WRITE_CONCERN_JOURNAL:
+        options["journal"] = settings.MONGO_WRITE_CONCERN_JOURNAL == "True"
+    return options
+
+
+class PoolMetrics(ConnectionPoolListener):
+    """
+    Bağlantı havuzu olaylarından metrik toplar: açık ve kullanımdaki (checked out) bağlantılar,
+    bağlantı bekleyen istekler, bekleme süreleri ve zaman aşımına uğrayan checkout'lar.
+    /api/metrics/ çıktısına eklenir.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {
+            "open_connections": 0,
+            "checked_out": 0,
+            "max_checked_out": 0,
+            "waiting": 0,
+            "max_waiting": 0,
+            "checkouts": 0,
+            "checkout_failures": 0,
+            "checkout_timeouts": 0,
+            "pool_clears": 0,
+            "max_wait_ms": 0.0,
+            "total_wait_ms": 0.0,
+        }
+
+    def _update(self, **deltas):
+        with self._lock:
+            stats = self._stats
+            for name, delta in deltas.items():
+                stats[name] += delta
+            stats["max_checked_out"] = max(stats["max_checked_out"], stats["checked_out"])
+            stats["max_waiting"] = max(stats["max_waiting"], stats["waiting"])
+
+    def connection_check_out_started(self, event):
+        self._update(waiting=1)
+
+    def connection_checked_out(self, event):
+        # duration: checkout'un başlamasından bağlantının alınmasına kadar geçen süre (saniye)
+        wait_ms = (getattr(event, 'duration', None) or 0.0) * 1000
+        with self._lock:
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+        self._update(waiting=-1, checked_out=1, checkouts=1, total_wait_ms=wait_ms)
+
+    def connection_check_out_failed(self, event):
+        timeouts = 1 if event.reason == 'timeout' else 0
+        self._update(waiting=-1, checkout_failures=1, checkout_timeouts=timeouts)
+
+    def connection_checked_in(self, event):
+        self._update(checked_out=-1)
+
+    def connection_created(self, event):
+        self._update(open_connections=1)
+
+    def connection_closed(self, event):
+        self._update(open_connections=-1)
+
+    def pool_cleared(self, event):
+        self._update(pool_clears=1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+    def snapshot(self):
+        with self._lock:
+            stats = dict(self._stats)
+        total_wait_ms = stats.pop("total_wait_ms")
+        stats["avg_wait_ms"] = round(total_wait_ms / stats["checkouts"], 3) if stats["checkouts"] else 0.0
+        stats["max_wait_ms"] = round(stats["max_wait_ms"], 3)
+        stats["max_pool_size"] = settings.MONGO_MAX_POOL_SIZE
+        return stats
+
 
 class MongoDBClient:
+    """
+    Process başına tek MongoClient. İlk kullanımda settings'teki havuz/zaman aşımı seçenekleriyle kurulur.
+    MongoClient fork güvenli değildir: gunicorn preload veya multiprocessing ile fork edilen çocuk process
+    ebeveynin istemcisini bırakır ve ilk kullanımda kendi bağlantı havuzunu açar.
+    """
     _client = None
+    _pool_metrics = None
+    _lock = threading.Lock()
+    metrics_name = 'mongo_pool'
 
     @classmethod
     def get_client(cls):
         if cls._client is None:
-            cls._client = MongoClient(settings.MONGO_URI)
+            with cls._lock:
+                if cls._client is None:
+                    cls._pool_metrics = PoolMetrics()
+                    register_metrics(cls.metrics_name, cls._pool_metrics.snapshot)
+                    cls._client = cls.create_client([cls._pool_metrics])
         return cls._client
 
+    @classmethod
+    def create_client(cls, event_listeners):
+        return MongoClient(settings.MONGO_URI, event_listeners=event_listeners, **client_options())
+
     @classmethod
     def get_db(cls):
         client = cls.get_client()
-        return client[settings.MONGO_DB_NAME]
\ No newline at end of file
+        return client[settings.MONGO_DB_NAME]
+
+    @classmethod
+    def reset(cls):
+        """
+        İstemciyi kapatmadan bırakır (fork sonrası çocukta ebeveynin soketleri kapatılmamalı);
+        sonraki get_client yeni bir istemci ve havuz kurar.
+        """
+        cls._client = None
+        cls._lock = threading.Lock()
+
+
+def _reset_after_fork():
+    from .async_mongo_client import AsyncMongoDBClient
+
+    MongoDBClient.reset()
+    AsyncMongoDBClient.reset()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,47 @@
+import logging
+from .base import Projection
+from .read_models import LatestRoomMetricsProjection, LatestRecommendationProjection, HouseRegistryProjection
+from .rollups import SignalRollupProjection
+from .fleet import FleetSummaryProjection
+
+logger = logging.getLogger(__name__)
+
+
+PROJECTIONS = [
+    LatestRoomMetricsProjection(),
+    LatestRecommendationProjection(),
+    HouseRegistryProjection(),
+    SignalRollupProjection(),
+    FleetSummaryProjection(),
+]
+
+
+def get_projections(names=None):
+    if not names:
+        return list(PROJECTIONS)
+    by_name = {p.name: p for p in PROJECTIONS}
+    unknown = [n for n in names if n not in by_name]
+    if unknown:
+        raise KeyError(f"Unknown projection(s): {', '.join(unknown)}")
+    return [by_name[n] for n in names]
+
+
+def dispatch(db, docs, projections=None, guard=None):
+    """
+    Eklenen eventleri ilgilendikleri projeksiyonlara dağıtır.
+    """
+    for projection in projections or PROJECTIONS:
+        relevant = [d for d in docs if d.get('event_type') in projection.event_types]
+        if relevant:
+            projection.apply(db, relevant, guard)
+
+
+def project_appended_events(db, docs):
+    """
+    MongoEventStore subscriber'ı. Projeksiyon hatası event yazımını geri almaz;
+    okuma modeli rebuild_projections ile event_store'dan yeniden kurulabilir.
+    """
+    try:
+        dispatch(db, docs)
+    except Exception:
+        logger.exception("Projection update failed for %d event(s)", len(docs))
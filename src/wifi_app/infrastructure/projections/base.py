@@ -0,0 +1,53 @@
+from pymongo.errors import BulkWriteError
+
+DUPLICATE_KEY_ERROR = 11000
+
+
+def guarded(query, update, guard):
+    """
+    Upsert'e replay guard'ı ekler: guard = (alan, sıra). Doküman bu alanda sıra veya daha büyüğünü
+    taşıyorsa (aynı batch daha önce uygulanmış) filtre eşleşmez, upsert unique index'e takılır ve
+    duplicate key yok sayılır. Böylece $inc kullanan projeksiyonlar da yarıda kalan bir replay'de
+    aynı batch'i iki kez saymaz.
+    """
+    if guard is None:
+        return query, update
+    field, sequence = guard
+    query = {**query, field: {"$not": {"$gte": sequence}}}
+    update = {**update, "$set": {**update.get("$set", {}), field: sequence}}
+    return query, update
+
+
+class Projection:
+    """
+    Event Store'a eklenen eventlerden okuma modeli (read model) üreten projeksiyonların temel sınıfı.
+    Alt sınıflar event_types ve build_operations'ı tanımlar.
+    """
+    name = None
+    collection_name = None
+    event_types = ()
+
+    def collection(self, db):
+        return db[self.collection_name]
+
+    def build_operations(self, docs, guard=None):
+        raise NotImplementedError
+
+    def apply(self, db, docs, guard=None):
+        """
+        Event dokümanlarını tek bir bulk_write ile okuma modeline yansıtır.
+        guard verilirse her upsert'e replay guard'ı eklenir (bkz. guarded).
+        """
+        operations = self.build_operations(docs, guard)
+        if not operations:
+            return
+        try:
+            self.collection(db).bulk_write(operations, ordered=False)
+        except BulkWriteError as exc:
+            # Duplicate key: okuma modelinde daha yeni bir kayıt var, bu event'in yazılmasına gerek yok
+            errors = [e for e in exc.details.get('writeErrors', []) if e.get('code') != DUPLICATE_KEY_ERROR]
+            if errors:
+                raise
+
+    def reset(self, db):
+        self.collection(db).delete_many({})
@@ -0,0 +1,193 @@
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from .base import Projection
+
+# Filo özetinde dağılımı/ortalaması tutulan oda skorları ve ölçümleri
+FLEET_SCORES = ('gaming_score', 'streaming_score', 'video_call_score', 'overall_rating')
+FLEET_AVERAGES = FLEET_SCORES + ('avg_signal_dbm', 'avg_speed_mbps', 'avg_latency_ms', 'packet_loss_avg')
+# Skor histogramı bin genişliği (0-100 skorlar; 100 son bine düşer)
+SCORE_BIN_WIDTH = 10
+SCORE_BINS = tuple(str(b) for b in range(0, 100, SCORE_BIN_WIDTH))
+# Henüz HouseRegistered'ı işlenmemiş evlerin ev tipi
+UNKNOWN_HOUSE_TYPE = 'unknown'
+
+SCORES_ID = 'scores'
+
+
+def score_bin(score):
+    return str(min(int(score) // SCORE_BIN_WIDTH * SCORE_BIN_WIDTH, 100 - SCORE_BIN_WIDTH))
+
+
+class FleetSummaryProjection(Projection):
+    """
+    Tüm filonun dağılımlarını sayaç dokümanlarında artımlı olarak tutar (fleet_summary):
+    ev başına son öneri önem derecesi sayıları, oda skorlarının histogramları ve ev tipi başına
+    ev/oda sayıları ile skor toplamları. Özet isteği evlerin eventlerini taramaz, birkaç küçük sayaç
+    dokümanı okur.
+
+    Sayaçlar durum geçişlerinden türetilir: ev (fleet_house_state) ve oda (fleet_room_state) başına son
+    durum find_one_and_update ile atomik olarak değiştirilir, dönen önceki durumla yeni durumun farkı
+    $inc edilir. Daha eski bir event filtreye takılır (upsert duplicate key verir) ve atlanır; aynı eventin
+    tekrar uygulanması sıfır fark üretir, bu yüzden replay guard'ı gerekmez. Durum yazılıp sayaç
+    güncellenmeden process ölürse fark kaybolur; sayaçlar rebuild_projections --only fleet ile yeniden kurulur.
+    """
+    name = 'fleet'
+    collection_name = 'fleet_summary'
+    event_types = ('HouseRegistered', 'RoomPerformanceCalculated', 'PerformanceRecommendationGenerated')
+    houses_collection_name = 'fleet_house_state'
+    rooms_collection_name = 'fleet_room_state'
+
+    def apply(self, db, docs, guard=None):
+        # Batch içinde aynı ev/oda için sadece en yeni event durum değiştirir; ara geçişlerin farkı sıfırlanır
+        latest = {}
+        for doc in docs:
+            payload = doc.get('payload', {})
+            house_id = doc.get('aggregate_id') or payload.get('house_id')
+            key = (doc.get('event_type'), house_id, payload.get('room_name'))
+            current = latest.get(key)
+            if current is None or str(current.get('timestamp')) <= str(doc.get('timestamp')):
+                latest[key] = doc
+
+        for (event_type, house_id, room_name), doc in latest.items():
+            payload = doc.get('payload', {})
+            if event_type == 'HouseRegistered':
+                self._register_house(db, house_id, payload.get('house_type'), doc.get('timestamp'))
+            elif event_type == 'PerformanceRecommendationGenerated':
+                self._set_severity(db, house_id, payload.get('global_severity'), doc.get('timestamp'))
+            elif room_name:
+                self._set_room(db, house_id, room_name, payload, doc.get('timestamp'))
+
+    def _transition(self, collection, query, update):
+        try:
+            return True, collection.find_one_and_update(
+                query, update, upsert=True, return_document=ReturnDocument.BEFORE
+            )
+        except DuplicateKeyError:
+            # Durumda daha yeni bir event var
+            return False, None
+
+    @staticmethod
+    def _newer(field, timestamp):
+        return {"$or": [{field: {"$exists": False}}, {field: {"$lte": timestamp}}]}
+
+    def _inc_type(self, db, house_type, inc):
+        inc = {k: v for k, v in inc.items() if v}
+        if inc:
+            self.collection(db).update_one({"_id": {"house_type": house_type}}, {"$inc": inc}, upsert=True)
+
+    def _register_house(self, db, house_id, house_type, timestamp):
+        house_type = house_type or UNKNOWN_HOUSE_TYPE
+        changed, before = self._transition(
+            db[self.houses_collection_name],
+            {"_id": house_id, **self._newer("registered_at", timestamp)},
+            {"$set": {"house_type": house_type, "registered_at": timestamp}}
+        )
+        if not changed:
+            return
+        if before is None:
+            self._inc_type(db, house_type, {"houses": 1})
+            return
+        old_type = before.get('house_type') or UNKNOWN_HOUSE_TYPE
+        if old_type == house_type:
+            return
+        # Evin o ana kadarki oda katkıları eski tipten yeni tipe taşınır
+        sums = before.get('sums', {})
+        moved = {"houses": 1, "rooms": before.get('rooms', 0)}
+        moved.update({f"sums.{m}": sums.get(m, 0) for m in FLEET_AVERAGES})
+        self._inc_type(db, old_type, {k: -v for k, v in moved.items()})
+        self._inc_type(db, house_type, moved)
+
+    def _set_severity(self, db, house_id, severity, timestamp):
+        changed, before = self._transition(
+            db[self.houses_collection_name],
+            {"_id": house_id, **self._newer("recommended_at", timestamp)},
+            {"$set": {"severity": severity, "recommended_at": timestamp}}
+        )
+        if not changed:
+            return
+        if before is None:
+            self._inc_type(db, UNKNOWN_HOUSE_TYPE, {"houses": 1})
+        old = before.get('severity') if before else None
+        if old == severity:
+            return
+        summary = self.collection(db)
+        if old is not None:
+            summary.update_one({"_id": {"severity": old}}, {"$inc": {"houses": -1}}, upsert=True)
+        if severity is not None:
+            summary.update_one({"_id": {"severity": severity}}, {"$inc": {"houses": 1}}, upsert=True)
+
+    def _set_room(self, db, house_id, room_name, payload, timestamp):
+        values = {m: payload.get(m) or 0 for m in FLEET_AVERAGES}
+        changed, before = self._transition(
+            db[self.rooms_collection_name],
+            {"_id": {"house_id": house_id, "room_name": room_name}, **self._newer("timestamp", timestamp)},
+            {"$set": {"timestamp": timestamp, "values": values}}
+        )
+        if not changed:
+            return
+        old = before.get('values', {}) if before else {}
+
+        histogram = {}
+        for metric in FLEET_SCORES:
+            if metric in old:
+                key = f"{metric}.{score_bin(old[metric])}"
+                histogram[key] = histogram.get(key, 0) - 1
+            key = f"{metric}.{score_bin(values[metric])}"
+            histogram[key] = histogram.get(key, 0) + 1
+        histogram = {k: v for k, v in histogram.items() if v}
+        if histogram:
+            self.collection(db).update_one({"_id": SCORES_ID}, {"$inc": histogram}, upsert=True)
+
+        delta = {f"sums.{m}": values[m] - old.get(m, 0) for m in FLEET_AVERAGES}
+        delta["rooms"] = 0 if before else 1
+        delta = {k: v for k, v in delta.items() if v}
+        if not delta:
+            return
+        # Ev durumu da aynı farkla atomik güncellenir; fark, evin o anki tipine yazılır
+        house = db[self.houses_collection_name].find_one_and_update(
+            {"_id": house_id}, {"$inc": delta}, upsert=True, return_document=ReturnDocument.BEFORE
+        )
+        if house is None:
+            delta["houses"] = 1
+        self._inc_type(db, (house or {}).get('house_type') or UNKNOWN_HOUSE_TYPE, delta)
+
+    def reset(self, db):
+        super().reset(db)
+        db[self.houses_collection_name].delete_many({})
+        db[self.rooms_collection_name].delete_many({})
+
+
+def summarize_fleet(docs):
+    """
+    fleet_summary sayaç dokümanlarını API çıktısına çevirir: önem derecesi sayıları, skor histogramları
+    ve ev tipi başına ortalamalar.
+    """
+    severity = {}
+    histograms = {metric: {b: 0 for b in SCORE_BINS} for metric in FLEET_SCORES}
+    house_types = []
+    for doc in docs:
+        _id = doc['_id']
+        if _id == SCORES_ID:
+            for metric in FLEET_SCORES:
+                for b, count in doc.get(metric, {}).items():
+                    histograms[metric][b] = count
+        elif 'severity' in _id:
+            if doc.get('houses'):
+                severity[_id['severity']] = doc['houses']
+        elif doc.get('houses') or doc.get('rooms'):
+            rooms = doc.get('rooms', 0)
+            sums = doc.get('sums', {})
+            house_types.append({
+                "house_type": _id['house_type'],
+                "houses": doc.get('houses', 0),
+                "rooms": rooms,
+                **{m: round(sums.get(m, 0) / rooms, 2) if rooms else None for m in FLEET_AVERAGES},
+            })
+    house_types.sort(key=lambda item: item['house_type'])
+    return {
+        "houses": sum(item['houses'] for item in house_types),
+        "rooms": sum(item['rooms'] for item in house_types),
+        "severity": severity,
+        "score_histograms": histograms,
+        "house_types": house_types,
+    }
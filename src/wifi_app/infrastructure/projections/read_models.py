@@ -0,0 +1,107 @@
+from pymongo import UpdateOne
+from .base import Projection, guarded
+
+
+class LatestRoomMetricsProjection(Projection):
+    """
+    Her ev/oda için en son RoomPerformanceCalculated payload'unu tutar.
+    """
+    name = 'room_metrics'
+    collection_name = 'house_room_metrics_latest'
+    event_types = ('RoomPerformanceCalculated',)
+
+    def build_operations(self, docs, guard=None):
+        operations = []
+        for doc in docs:
+            payload = doc.get('payload', {})
+            room_name = payload.get('room_name')
+            if not room_name:
+                continue
+            # Sadece daha eski (veya aynı) kaydın üzerine yazılır; daha yeni kayıt varsa
+            # upsert unique index'e takılır ve duplicate key hatası yok sayılır.
+            operations.append(UpdateOne(
+                *guarded(
+                    {
+                        "house_id": doc.get('aggregate_id'),
+                        "room_name": room_name,
+                        "timestamp": {"$lte": doc.get('timestamp')}
+                    },
+                    {"$set": {
+                        "event_id": doc.get('event_id'),
+                        "timestamp": doc.get('timestamp'),
+                        "payload": payload
+                    }},
+                    guard
+                ),
+                upsert=True
+            ))
+        return operations
+
+
+class LatestRecommendationProjection(Projection):
+    """
+    Her ev için en son PerformanceRecommendationGenerated payload'unu tutar (_id = house_id).
+    """
+    name = 'recommendations'
+    collection_name = 'house_recommendation_latest'
+    event_types = ('PerformanceRecommendationGenerated',)
+
+    def build_operations(self, docs, guard=None):
+        operations = []
+        for doc in docs:
+            operations.append(UpdateOne(
+                *guarded(
+                    {"_id": doc.get('aggregate_id'), "timestamp": {"$lte": doc.get('timestamp')}},
+                    {"$set": {
+                        "event_id": doc.get('event_id'),
+                        "timestamp": doc.get('timestamp'),
+                        "payload": doc.get('payload', {})
+                    }},
+                    guard
+                ),
+                upsert=True
+            ))
+        return operations
+
+
+class HouseRegistryProjection(Projection):
+    """
+    Kayıtlı evlerin listesini tutar (_id = house_id). Her değişiklikte registry versiyonu artırılır;
+    ev listesi önbellekleri ve ETag'ler bu versiyona göre geçersiz kılınır.
+    """
+    name = 'houses'
+    collection_name = 'houses'
+    event_types = ('HouseRegistered',)
+    versions_collection = 'projection_versions'
+
+    def build_operations(self, docs, guard=None):
+        operations = []
+        for doc in docs:
+            operations.append(UpdateOne(
+                *guarded(
+                    {"_id": doc.get('aggregate_id'), "timestamp": {"$lte": doc.get('timestamp')}},
+                    {"$set": {
+                        "event_id": doc.get('event_id'),
+                        "timestamp": doc.get('timestamp'),
+                        "payload": doc.get('payload', {})
+                    }},
+                    guard
+                ),
+                upsert=True
+            ))
+        return operations
+
+    def apply(self, db, docs, guard=None):
+        super().apply(db, docs, guard)
+        self.bump_version(db)
+
+    def reset(self, db):
+        super().reset(db)
+        self.bump_version(db)
+
+    def bump_version(self, db):
+        db[self.versions_collection].update_one({"_id": self.name}, {"$inc": {"version": 1}}, upsert=True)
+
+    def get_version(self, db):
+        doc = db[self.versions_collection].find_one({"_id": self.name})
+        return doc.get('version', 0) if doc else 0
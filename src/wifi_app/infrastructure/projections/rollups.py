@@ -0,0 +1,221 @@
+from datetime import datetime, timedelta
+from django.conf import settings
+from pymongo import UpdateOne
+from ...domain.sketches import DDSketch, sketch_key
+from .base import Projection, guarded
+
+# Çözünürlük -> bucket genişliği
+RESOLUTIONS = {
+    '1m': timedelta(minutes=1),
+    '1h': timedelta(hours=1),
+    '1d': timedelta(days=1),
+}
+
+# Rollup tutulan metrikler
+ROLLUP_METRICS = ('rssi', 'link_speed_mbps', 'latency_ms', 'packet_loss_rate')
+
+# API çıktısındaki yüzdelikler
+PERCENTILES = {'p50': 0.5, 'p90': 0.9, 'p95': 0.95, 'p99': 0.99}
+
+
+def parse_timestamp(value):
+    if isinstance(value, datetime):
+        return value.replace(tzinfo=None)
+    return datetime.fromisoformat(value).replace(tzinfo=None)
+
+
+def bucket_start(ts, resolution):
+    if resolution == '1m':
+        return ts.replace(second=0, microsecond=0)
+    if resolution == '1h':
+        return ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class SignalRollupProjection(Projection):
+    """
+    WifiSignalCaptured eventlerini ev × oda × band bazında 1m/1h/1d bucket'larına toplar.
+    Her bucket min/max/toplam/adet ve yüzdelikler için DDSketch bin'leri ({metrik}.sketch.{anahtar}) tutar;
+    tüm alanlar $inc/$min/$max ile artımlı güncellenir. Sketch'ler bucket'lar, odalar ve evler arasında
+    toplanarak birleştirilebilir.
+    """
+    name = 'rollups'
+    collection_name = 'signal_rollups'
+    event_types = ('WifiSignalCaptured',)
+
+    def build_operations(self, docs, guard=None):
+        # Aynı bucket'a düşen sinyaller önce bellekte birleştirilir, bucket başına tek upsert yapılır
+        buckets = {}
+        for doc in docs:
+            payload = doc.get('payload', {})
+            ts = parse_timestamp(doc.get('timestamp'))
+            house_id = doc.get('aggregate_id') or payload.get('house_id')
+            # Sketch anahtarı çözünürlükten bağımsız; her değer için bir kez hesaplanır
+            values = [
+                (metric, value, sketch_key(value))
+                for metric in ROLLUP_METRICS if (value := payload.get(metric)) is not None
+            ]
+            for resolution in RESOLUTIONS:
+                key = (house_id, payload.get('room'), payload.get('band'), resolution, bucket_start(ts, resolution))
+                acc = buckets.get(key)
+                if acc is None:
+                    acc = buckets[key] = {"count": 0, "metrics": {m: None for m in ROLLUP_METRICS}}
+                acc["count"] += 1
+                for metric, value, key in values:
+                    stats = acc["metrics"][metric]
+                    if stats is None:
+                        stats = acc["metrics"][metric] = {"sum": 0, "min": value, "max": value, "sketch": {}}
+                    stats["sum"] += value
+                    if value < stats["min"]:
+                        stats["min"] = value
+                    elif value > stats["max"]:
+                        stats["max"] = value
+                    stats["sketch"][key] = stats["sketch"].get(key, 0) + 1
+
+        retention = timedelta(days=settings.ROLLUP_MINUTE_RETENTION_DAYS)
+        operations = []
+        for (house_id, room, band, resolution, start), acc in buckets.items():
+            inc = {"count": acc["count"]}
+            mins = {}
+            maxs = {}
+            for metric, stats in acc["metrics"].items():
+                if stats is None:
+                    continue
+                inc[f"{metric}.sum"] = stats["sum"]
+                mins[f"{metric}.min"] = stats["min"]
+                maxs[f"{metric}.max"] = stats["max"]
+                for key, count in stats["sketch"].items():
+                    inc[f"{metric}.sketch.{key}"] = count
+            update = {"$inc": inc}
+            if mins:
+                update["$min"] = mins
+                update["$max"] = maxs
+            if resolution == '1m':
+                # Dakikalık bucket'lar TTL index ile silinir
+                update["$set"] = {"expires_at": start + retention}
+            operations.append(UpdateOne(
+                *guarded(
+                    {"house_id": house_id, "resolution": resolution, "bucket": start, "room": room, "band": band},
+                    update,
+                    guard
+                ),
+                upsert=True
+            ))
+        return operations
+
+
+def _clamp(value, lower, upper):
+    if lower is not None:
+        value = max(value, lower)
+    if upper is not None:
+        value = min(value, upper)
+    return round(value, 2)
+
+
+def rollup_percentiles(stats):
+    """
+    Rollup metriğinin (veya birleştirilmiş sketch'in) yüzdelikleri: {"p50", "p90", "p95", "p99"}.
+    """
+    lower, upper = stats.get('min'), stats.get('max')
+    values = DDSketch(stats.get('sketch', {})).quantiles(PERCENTILES.values())
+    return {
+        name: _clamp(value, lower, upper) if value is not None else None
+        for name, value in zip(PERCENTILES, values)
+    }
+
+
+def merge_rollups(docs, group_by=None, metrics=None):
+    """
+    Rollup dokümanlarını (bucket'lar, bantlar, odalar veya evler) birleştirir:
+    {grup: {"count", metrik: {"sum", "min", "max", "sketch"}}}. group_by dokümandan grup anahtarını
+    üreten fonksiyondur; verilmezse tek grup (None) döner.
+    """
+    metrics = metrics or ROLLUP_METRICS
+    groups = {}
+    for doc in docs:
+        key = group_by(doc) if group_by else None
+        acc = groups.get(key)
+        if acc is None:
+            acc = groups[key] = {"count": 0}
+        acc["count"] += doc.get('count', 0)
+        for metric in metrics:
+            stats = doc.get(metric)
+            if not stats or 'sketch' not in stats:
+                continue
+            merged = acc.get(metric)
+            if merged is None:
+                acc[metric] = {
+                    "sum": stats.get('sum', 0), "min": stats.get('min'), "max": stats.get('max'),
+                    "sketch": DDSketch(stats['sketch']),
+                }
+                continue
+            merged["sum"] += stats.get('sum', 0)
+            merged["min"] = min(merged["min"], stats.get('min'))
+            merged["max"] = max(merged["max"], stats.get('max'))
+            merged["sketch"].merge(stats['sketch'])
+    return groups
+
+
+def summarize_merged(acc, metrics=None):
+    """
+    merge_rollups çıktısındaki bir grubu API çıktısına çevirir: her metrik için min/max/avg ve yüzdelikler.
+    """
+    item = {"count": acc["count"]}
+    for metric in metrics or ROLLUP_METRICS:
+        stats = acc.get(metric)
+        count = stats["sketch"].count if stats else 0
+        if not count:
+            item[metric] = None
+            continue
+        item[metric] = {
+            "min": stats["min"],
+            "max": stats["max"],
+            "avg": round(stats["sum"] / count, 2),
+            **rollup_percentiles({"min": stats["min"], "max": stats["max"], "sketch": stats["sketch"].bins}),
+        }
+    return item
+
+
+def summarize_rollup(doc):
+    """
+    Rollup dokümanını API çıktısına çevirir: her metrik için min/max/avg ve p50/p90/p95/p99.
+    """
+    count = doc.get('count', 0)
+    item = {
+        "bucket": doc.get('bucket'),
+        "room": doc.get('room'),
+        "band": doc.get('band'),
+        "count": count,
+    }
+    for metric in ROLLUP_METRICS:
+        stats = doc.get(metric)
+        if not stats or not count:
+            item[metric] = None
+            continue
+        item[metric] = {
+            "min": stats.get('min'),
+            "max": stats.get('max'),
+            "avg": round(stats.get('sum', 0) / count, 2),
+            **rollup_percentiles(stats),
+        }
+    return item
+
+
+# Oda metriklerine eklenen kuyruk yüzdelikleri (ortalamaların gizlediği gecikme ve sinyal kuyrukları)
+ROOM_PERCENTILE_METRICS = ('latency_ms', 'rssi')
+ROOM_PERCENTILES = ('p50', 'p90', 'p99')
+
+
+def room_percentiles(docs):
+    """
+    Bir evin rollup dokümanlarını oda bazında (bantlar ve bucket'lar birleştirilerek) yüzdeliklere çevirir:
+    {oda: {"latency_ms": {"p50", "p90", "p99"}, "rssi": {...}}}
+    """
+    rooms = {}
+    for room, acc in merge_rollups(docs, lambda doc: doc.get('room'), ROOM_PERCENTILE_METRICS).items():
+        summary = summarize_merged(acc, ROOM_PERCENTILE_METRICS)
+        rooms[room] = {
+            metric: {name: summary[metric][name] for name in ROOM_PERCENTILES} if summary[metric] else None
+            for metric in ROOM_PERCENTILE_METRICS
+        }
+    return rooms
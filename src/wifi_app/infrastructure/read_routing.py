@@ -0,0 +1,148 @@
+import base64
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+import bson
+from bson import Timestamp
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+
+# MONGO_READ_ROUTES ile yönlendirilebilen okuma sorguları (store'un public metod adları).
+# load_aggregate, get_signals_after ve replay/analiz taramaları her zaman yazma yolundan (primary) okur.
+ROUTED_QUERIES = (
+    'get_registered_houses',
+    'get_recent_signals',
+    'find_signals',
+    'get_latest_recommendation',
+    'get_house_room_metrics',
+    'get_fleet_summary',
+    'get_signal_timeseries',
+)
+# Tüm yönlendirilebilen sorgulara uygulanan varsayılan rota
+DEFAULT_ROUTE = '*'
+
+READ_PREFERENCES = {
+    'primary': Primary,
+    'primaryPreferred': PrimaryPreferred,
+    'secondary': Secondary,
+    'secondaryPreferred': SecondaryPreferred,
+    'nearest': Nearest,
+}
+# MongoDB'nin kabul ettiği en küçük maxStalenessSeconds
+MIN_MAX_STALENESS_SECONDS = 90
+
+CAUSAL_TOKEN_HEADER = 'X-Causal-Token'
+
+
+def parse_read_route(spec):
+    """
+    "mod[:maxStalenessSeconds]" ifadesini pymongo read preference nesnesine çevirir.
+    """
+    mode, _, staleness = spec.partition(':')
+    if mode not in READ_PREFERENCES:
+        raise ImproperlyConfigured(f"Unknown read preference {mode!r} in MONGO_READ_ROUTES.")
+    if not staleness:
+        return READ_PREFERENCES[mode]()
+    if mode == 'primary':
+        raise ImproperlyConfigured("maxStalenessSeconds cannot be combined with the primary read preference.")
+    max_staleness = int(staleness)
+    if max_staleness < MIN_MAX_STALENESS_SECONDS:
+        raise ImproperlyConfigured(f"maxStalenessSeconds must be at least {MIN_MAX_STALENESS_SECONDS}.")
+    return READ_PREFERENCES[mode](max_staleness=max_staleness)
+
+
+@lru_cache(maxsize=8)
+def parse_read_routes(spec):
+    """
+    MONGO_READ_ROUTES değerini {sorgu_adi: read preference} sözlüğüne çevirir.
+    Ör: "*=secondaryPreferred:120,get_recent_signals=nearest" (virgülle ayrılmış sorgu=mod[:saniye]).
+    """
+    routes = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, route = item.partition('=')
+        name = name.strip()
+        if name != DEFAULT_ROUTE and name not in ROUTED_QUERIES:
+            raise ImproperlyConfigured(f"Unknown query {name!r} in MONGO_READ_ROUTES.")
+        routes[name] = parse_read_route(route.strip())
+    default = routes.pop(DEFAULT_ROUTE, None)
+    return {name: routes.get(name, default) for name in ROUTED_QUERIES}
+
+
+def read_preference(query):
+    """
+    Sorgunun read preference'ı; rota tanımlı değilse None (istemcinin varsayılanı, MONGO_READ_PREFERENCE).
+    """
+    return parse_read_routes(settings.MONGO_READ_ROUTES).get(query)
+
+
+def routed(collection, query):
+    """
+    Okuma yolu: koleksiyonu sorgunun read preference'ı ile döner. Yazmalar her zaman store'un kendi
+    koleksiyon referanslarıyla (primary) yapılır.
+    """
+    preference = read_preference(query)
+    if preference is None:
+        return collection
+    return collection.with_options(read_preference=preference)
+
+
+def encode_causal_token(*sessions):
+    """
+    Oturumların gördüğü en yeni operation time ve cluster time'ı istemciye dönülecek bir token'a çevirir.
+    Sunucu operation time dönmüyorsa (standalone mongod) None.
+    """
+    operation_time = max((s.operation_time for s in sessions if s.operation_time is not None), default=None)
+    if operation_time is None:
+        return None
+    doc = {"op": operation_time}
+    cluster_times = [s.cluster_time for s in sessions if s.cluster_time is not None]
+    if cluster_times:
+        doc["ct"] = max(cluster_times, key=lambda ct: ct['clusterTime'])
+    return base64.urlsafe_b64encode(bson.encode(doc)).decode('ascii')
+
+
+def decode_causal_token(token):
+    """
+    encode_causal_token'ın tersi: (operation_time, cluster_time). Geçersiz token'da ValueError.
+    """
+    try:
+        doc = bson.decode(base64.urlsafe_b64decode(token.encode('ascii')))
+    except Exception as exc:
+        raise ValueError("Invalid causal token.") from exc
+    operation_time, cluster_time = doc.get('op'), doc.get('ct')
+    if not isinstance(operation_time, Timestamp) or (
+            cluster_time is not None and not isinstance(cluster_time.get('clusterTime'), Timestamp)):
+        raise ValueError("Invalid causal token.")
+    return operation_time, cluster_time
+
+
+def _advance(session, token):
+    if token:
+        operation_time, cluster_time = decode_causal_token(token)
+        if cluster_time is not None:
+            session.advance_cluster_time(cluster_time)
+        session.advance_operation_time(operation_time)
+
+
+@contextmanager
+def causal_session(client, token=None):
+    """
+    Blok içindeki tüm işlemlere örtük olarak geçirilen (bind) causal consistency oturumu açar.
+    token verilirse oturum o noktadan başlar: secondary'ye giden okumalar token'daki yazmayı görene kadar bekler
+    (read-your-writes).
+    """
+    session = client.start_session(causal_consistency=True)
+    with session.bind():
+        _advance(session, token)
+        yield session
+
+
+@asynccontextmanager
+async def async_causal_session(client, token=None):
+    """
+    causal_session'ın AsyncMongoClient karşılığı.
+    """
+    session = client.start_session(causal_consistency=True)
+    async with session.bind():
+        _advance(session, token)
+        yield session
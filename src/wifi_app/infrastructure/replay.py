@@ -0,0 +1,297 @@
+import time
+import zlib
+from datetime import datetime
+from bson import ObjectId
+from .event_store import MongoEventStore
+from .indexes import ensure_indexes
+from .mongo_client import MongoDBClient
+from .projections import get_projections, dispatch
+from .signal_codec import SIGNAL_EVENT_TYPE, decode_signal, unpack_bucket
+
+RUN_ID = 'current'
+
+
+def house_partition(house_id, partitions):
+    # Python hash() process başına rastgele; tüm worker'larda aynı sonucu veren crc32 kullanılır
+    return zlib.crc32(str(house_id).encode('utf-8')) % partitions
+
+
+class ReplayRun:
+    """
+    Paralel replay'in planı ve partition checkpoint'leri. Plan (mod, partition'lar, üst _id sınırı)
+    replay_runs koleksiyonunda, her partition'ın ilerlemesi replay_checkpoints'te tutulur; yarıda kalan
+    bir replay aynı planla kaldığı yerden devam eder. Hash modunda evlerin partition'ları replay_houses'ta
+    ev başına bir doküman olarak tutulur (plan dokümanı ev sayısıyla büyüyüp 16 MB sınırına takılmaz).
+
+    Replay, başladığı andaki üst _id sınırına (upper_id) kadar olan eventleri oynatır; sonra gelen eventleri
+    canlı projeksiyonlar zaten işler, böylece replay sırasında ingest durdurulmak zorunda değildir.
+    """
+    runs_collection_name = 'replay_runs'
+    checkpoints_collection_name = 'replay_checkpoints'
+    houses_collection_name = 'replay_houses'
+    houses_batch_size = 10000
+
+    def __init__(self, db):
+        self.runs = db[self.runs_collection_name]
+        self.checkpoints = db[self.checkpoints_collection_name]
+        self.houses = db[self.houses_collection_name]
+
+    def load(self):
+        return self.runs.find_one({"_id": RUN_ID})
+
+    def start(self, store, projection_names, mode, partitions, signal_format):
+        """
+        Okuma modellerini temizler ve yeni bir replay planı yazar.
+        """
+        projections = get_projections(projection_names)
+        for projection in projections:
+            projection.reset(store.db)
+        ensure_indexes(store.db)
+
+        upper_id = ObjectId()
+        self.checkpoints.delete_many({})
+        self.houses.delete_many({})
+        if mode == 'hash':
+            # Ev listesi bir kez okunup partition'lara dağıtılır; worker'lar store'u ayrı ayrı taramaz
+            event_types = {t for p in projections for t in p.event_types}
+            self.save_houses(self.house_ids(store, event_types), partitions)
+            specs = [{"index": i, "mode": mode, "partitions": partitions} for i in range(partitions)]
+        else:
+            specs = [
+                {"index": i, "mode": mode, "lower": lower, "upper": upper}
+                for i, (lower, upper) in enumerate(self.id_ranges(store, partitions, upper_id))
+            ]
+        run = {
+            "_id": RUN_ID,
+            "projections": [p.name for p in projections],
+            "mode": mode,
+            "upper_id": upper_id,
+            "signal_format": signal_format,
+            "partitions": specs,
+            "started_at": datetime.utcnow(),
+            "finished_at": None,
+        }
+        self.runs.replace_one({"_id": RUN_ID}, run, upsert=True)
+        return run
+
+    @staticmethod
+    def house_ids(store, event_types):
+        """
+        Verilen event tiplerinden en az birine sahip evler (bucketed formatta sinyal bucket'ları dahil).
+        distinct yerine $group cursor'ı okunur; sonuç tek bir 16 MB'lık yanıta sığmak zorunda değildir.
+        """
+        read_buckets = store.signal_buckets is not None and SIGNAL_EVENT_TYPE in event_types
+        store_types = set(event_types) - {SIGNAL_EVENT_TYPE} if read_buckets else set(event_types)
+        houses = set()
+        if store_types:
+            houses.update(doc['_id'] for doc in store.collection.aggregate([
+                {"$match": {"event_type": {"$in": list(store_types)}}},
+                {"$group": {"_id": "$aggregate_id"}},
+            ], allowDiskUse=True))
+        if read_buckets:
+            houses.update(doc['_id'] for doc in store.signal_buckets.collection.aggregate(
+                [{"$group": {"_id": "$house_id"}}], allowDiskUse=True
+            ))
+        houses.discard(None)
+        return houses
+
+    def save_houses(self, house_ids, partitions):
+        """
+        Evleri partition'larıyla birlikte batch'ler halinde replay_houses'a yazar.
+        """
+        self.houses.create_index([("partition", 1), ("house_id", 1)])
+        batch = []
+        for house_id in house_ids:
+            batch.append({"partition": house_partition(house_id, partitions), "house_id": house_id})
+            if len(batch) >= self.houses_batch_size:
+                self.houses.insert_many(batch, ordered=False)
+                batch = []
+        if batch:
+            self.houses.insert_many(batch, ordered=False)
+
+    def partition_houses(self, index, start=None):
+        """
+        Partition'ın evleri sıralı olarak, varsa start'tan (dahil) itibaren; cursor'dan okunur.
+        """
+        query = {"partition": index}
+        if start is not None:
+            query["house_id"] = {"$gte": start}
+        for doc in self.houses.find(query, {"_id": 0, "house_id": 1}).sort("house_id", 1):
+            yield doc['house_id']
+
+    @staticmethod
+    def id_ranges(store, partitions, upper_id):
+        """
+        [en eski _id, upper_id) aralığını ObjectId zaman damgasına göre eşit parçalara böler.
+        Yoğunluk zamana göre değişebildiği için worker sayısından fazla partition kullanılması önerilir.
+        """
+        oldest = [
+            doc['_id'] for doc in (
+                store.collection.find_one({}, {"_id": 1}, sort=[("_id", 1)]),
+                store.signal_buckets.collection.find_one({}, {"_id": 1}, sort=[("_id", 1)])
+                if store.signal_buckets is not None else None,
+            ) if doc is not None
+        ]
+        if not oldest:
+            return [(None, upper_id)]
+        start = min(oldest).generation_time.timestamp()
+        end = upper_id.generation_time.timestamp() + 1
+        step = (end - start) / partitions
+        bounds = [ObjectId.from_datetime(datetime.utcfromtimestamp(start + step * i)) for i in range(1, partitions)]
+        lowers = [None] + bounds
+        uppers = bounds + [upper_id]
+        return list(zip(lowers, uppers))
+
+    def finish(self):
+        self.runs.update_one({"_id": RUN_ID}, {"$set": {"finished_at": datetime.utcnow()}})
+
+    def checkpoint(self, index):
+        return self.checkpoints.find_one({"_id": index}) or {"_id": index, "sequence": 0, "events": 0}
+
+    def save_checkpoint(self, index, position, sequence, events, done=False):
+        self.checkpoints.update_one(
+            {"_id": index},
+            {"$set": {"position": position, "sequence": sequence, "events": events, "done": done}},
+            upsert=True
+        )
+
+
+class PartitionReader:
+    """
+    Bir partition'ın eventlerini deterministik sırayla batch'ler halinde okur. Her batch ile birlikte
+    kaldığı yeri (position) döner; aynı position'dan devam eden okuma aynı sonraki batch'leri üretir.
+    Bucketed formatta sinyal bucket'ları event_store'dan sonra, bucket sınırlarında bölünerek okunur.
+    """
+
+    def __init__(self, store, run, spec, event_types, batch_size):
+        self.store = store
+        self.spec = spec
+        self.upper_id = run['upper_id']
+        self.batch_size = batch_size
+        self.event_types = set(event_types)
+        self.store_types = self.event_types
+        self.read_buckets = store.signal_buckets is not None and SIGNAL_EVENT_TYPE in self.event_types
+        if self.read_buckets:
+            self.store_types = self.event_types - {SIGNAL_EVENT_TYPE}
+
+    def batches(self, position=None):
+        if self.spec['mode'] == 'hash':
+            yield from self._hash_batches(position or {})
+        else:
+            yield from self._range_batches(position or {})
+
+    def _id_range(self, last_id=None):
+        id_range = {"$lt": self.spec['upper']}
+        lower = self.spec.get('lower')
+        if last_id is not None:
+            id_range["$gt"] = last_id
+        elif lower is not None:
+            id_range["$gte"] = lower
+        return id_range
+
+    def _range_batches(self, position):
+        phase = position.get('phase', 'events')
+        if phase == 'events' and self.store_types:
+            query = {"event_type": {"$in": list(self.store_types)}, "_id": self._id_range(position.get('last_id'))}
+            for docs, last_id in self._event_batches(query):
+                yield docs, {"phase": "events", "last_id": last_id}
+            position = {}
+        if self.read_buckets:
+            last_id = position.get('last_id') if phase == 'buckets' else None
+            query = {"_id": self._id_range(last_id)}
+            for docs, last_id in self._bucket_batches(query):
+                yield docs, {"phase": "buckets", "last_id": last_id}
+
+    def _hash_batches(self, position):
+        resume_house = position.get('house')
+        for house_id in ReplayRun(self.store.db).partition_houses(self.spec['index'], resume_house):
+            house_position = position if house_id == resume_house else {}
+            phase = house_position.get('phase', 'events')
+            if phase == 'events' and self.store_types:
+                query = {
+                    "event_type": {"$in": list(self.store_types)},
+                    "aggregate_id": house_id,
+                    "_id": {"$lt": self.upper_id, **({"$gt": house_position['last_id']} if house_position else {})},
+                }
+                for docs, last_id in self._event_batches(query):
+                    yield docs, {"house": house_id, "phase": "events", "last_id": last_id}
+                house_position = {}
+            if self.read_buckets:
+                query = {"house_id": house_id}
+                if phase == 'buckets' and house_position:
+                    query["_id"] = {"$gt": house_position['last_id']}
+                for docs, last_id in self._bucket_batches(query):
+                    yield docs, {"house": house_id, "phase": "buckets", "last_id": last_id}
+
+    def _event_batches(self, query):
+        batch = []
+        cursor = self.store.collection.find(query).sort("_id", 1).batch_size(self.batch_size)
+        for doc in cursor:
+            batch.append(decode_signal(doc))
+            if len(batch) >= self.batch_size:
+                yield batch, batch[-1]['_id']
+                batch = []
+        if batch:
+            yield batch, batch[-1]['_id']
+
+    def _bucket_batches(self, query):
+        # Batch'ler sadece bucket sınırlarında kesilir; position son tamamlanan bucket'ın _id'sidir
+        batch = []
+        cursor = self.store.signal_buckets.collection.find(query).sort("_id", 1)\
+            .batch_size(max(1, self.batch_size // 100))
+        for bucket in cursor:
+            # Bucket'a replay başladıktan sonra eklenen okumaları canlı projeksiyonlar işler
+            batch.extend(doc for doc in unpack_bucket(bucket) if doc['_id'] < self.upper_id)
+            if len(batch) >= self.batch_size:
+                yield batch, bucket['_id']
+                batch = []
+            last_id = bucket['_id']
+        if batch:
+            yield batch, last_id
+
+
+def init_worker():
+    """
+    ProcessPoolExecutor worker başlangıcı: Django'yu kurar ve ana process'ten (fork) kalan
+    Mongo client'ını bırakır; her worker kendi bağlantı havuzunu açar.
+    """
+    import django
+    from django.apps import apps
+
+    if not apps.ready:
+        django.setup()
+    MongoDBClient.reset()
+
+
+def replay_partition(index, batch_size):
+    """
+    Tek bir partition'ı checkpoint'inden itibaren oynatır. Her batch projeksiyonlara (index, sıra) guard'ı ile
+    bulk upsert olarak uygulanır, ardından checkpoint yazılır. Checkpoint yazılmadan önce yarıda kalan
+    bir batch tekrar uygulandığında guard daha önce yazılmış upsert'leri atlar.
+    Dönüş: {"index", "events", "seconds"}
+    """
+    store = MongoEventStore()
+    replay_run = ReplayRun(store.db)
+    run = replay_run.load()
+    spec = run['partitions'][index]
+    projections = get_projections(run['projections'])
+    event_types = {t for p in projections for t in p.event_types}
+
+    checkpoint = replay_run.checkpoint(index)
+    if checkpoint.get('done'):
+        return {"index": index, "events": 0, "seconds": 0.0}
+    sequence = checkpoint['sequence']
+    events = checkpoint['events']
+    guard_field = f"_replay.p{index}"
+    position = checkpoint.get('position')
+
+    started = time.monotonic()
+    replayed = 0
+    reader = PartitionReader(store, run, spec, event_types, batch_size)
+    for docs, position in reader.batches(checkpoint.get('position')):
+        sequence += 1
+        dispatch(store.db, docs, projections, guard=(guard_field, sequence))
+        replayed += len(docs)
+        replay_run.save_checkpoint(index, position, sequence, events + replayed)
+    replay_run.save_checkpoint(index, position, sequence, events + replayed, done=True)
+    return {"index": index, "events": replayed, "seconds": time.monotonic() - started}
@@ -0,0 +1,291 @@
+from datetime import datetime, timedelta
+from bson import ObjectId
+from django.conf import settings
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from .read_routing import routed
+from .signal_codec import bucket_columns, unpack_bucket, encode_timestamp
+from ..domain.events import is_idempotent_event_id
+
+EPOCH = datetime(1970, 1, 1)
+
+
+class BucketedSignalStore:
+    """
+    WifiSignalCaptured okumalarını ev × zaman penceresi başına bir dokümanda paralel diziler olarak tutar
+    (Mongo time-series koleksiyonlarına benzer). Alan adları her okuma yerine bucket başına bir kez
+    saklanır; house_id tekrar edilmez. Her okumanın kendi ObjectId'si (ids) vardır, böylece _id tabanlı
+    cursor pagination ve analiz checkpoint'leri eski formatla aynı şekilde çalışır.
+    """
+    collection_name = 'signal_buckets'
+    # reading_id'li okumaların event_id'leri (_id); TTL index ile INGEST_DEDUP_TTL_HOURS sonra silinir
+    dedup_collection_name = 'ingest_dedup'
+
+    def __init__(self, db):
+        self.collection = db[self.collection_name]
+        self.dedup = db[self.dedup_collection_name]
+        self.dedup_ttl = timedelta(hours=settings.INGEST_DEDUP_TTL_HOURS)
+        self.span = timedelta(minutes=settings.SIGNAL_BUCKET_SPAN_MINUTES)
+        self.max_readings = settings.SIGNAL_BUCKET_MAX_READINGS
+
+    def window_start(self, ts):
+        windows = (ts - EPOCH) // self.span
+        return EPOCH + windows * self.span
+
+    def _chunks(self, docs):
+        """
+        Sinyal dokümanlarını ev/pencere bazında gruplayıp en fazla max_readings okumalık parçalara böler.
+        """
+        groups = {}
+        for doc in docs:
+            key = (doc.get('aggregate_id'), self.window_start(encode_timestamp(doc.get('timestamp'))))
+            groups.setdefault(key, []).append(doc)
+        for (house_id, start), group in groups.items():
+            for i in range(0, len(group), self.max_readings):
+                yield house_id, start, group[i:i + self.max_readings]
+
+    def build_operations(self, docs):
+        """
+        Sinyal dokümanlarını (_id atanmış) ev/pencere bazında gruplayıp bucket upsert'lerine çevirir.
+        Dolu bucket'a sığmayan okumalar aynı pencere için yeni bir bucket açar.
+        """
+        operations = []
+        for house_id, start, chunk in self._chunks(docs):
+            columns = bucket_columns(chunk)
+            maximums = {"max_id": max(columns["ids"]), "end": max(columns["ts"]), **self._max_version(columns)}
+            operations.append(UpdateOne(
+                {"house_id": house_id, "start": start, "count": {"$lte": self.max_readings - len(chunk)}},
+                {
+                    "$push": {name: {"$each": values} for name, values in columns.items()},
+                    "$inc": {"count": len(chunk)},
+                    "$min": {"min_id": min(columns["ids"])},
+                    "$max": maximums,
+                },
+                upsert=True
+            ))
+        return operations
+
+    @staticmethod
+    def _max_version(columns):
+        # load_aggregate snapshot'tan sonraki okumaları max_version ile bulur
+        versions = [v for v in columns["ver"] if v is not None]
+        return {"max_version": max(versions)} if versions else {}
+
+    def build_documents(self, docs):
+        """
+        Sinyal dokümanlarından hazır bucket dokümanları üretir (migration için).
+        Bucket _id'si içindeki en küçük okuma _id'sidir; aynı okumalarla tekrar üretilen bucket
+        duplicate key verir, böylece yarıda kalan migration tekrar çalıştırılabilir.
+        """
+        buckets = []
+        for house_id, start, chunk in self._chunks(docs):
+            columns = bucket_columns(chunk)
+            buckets.append({
+                "_id": min(columns["ids"]),
+                "house_id": house_id,
+                "start": start,
+                "end": max(columns["ts"]),
+                "count": len(chunk),
+                "min_id": min(columns["ids"]),
+                "max_id": max(columns["ids"]),
+                **self._max_version(columns),
+                **columns,
+            })
+        return buckets
+
+    def claim(self, docs):
+        """
+        Idempotent event_id'li okumaları ingest_dedup koleksiyonuna kaydeder ve daha önce kaydedilmiş
+        (tekrar gönderilen) olanların event_id'lerini döner. Bucket dizilerindeki okumalar için unique index
+        olmadığından tekilleştirme bu koleksiyonla yapılır. Kayıt bucket yazımından önce yapılır; arada
+        process ölürse o okumanın tekrarı da atlanır.
+        """
+        event_ids = [doc['event_id'] for doc in docs if is_idempotent_event_id(doc.get('event_id'))]
+        if not event_ids:
+            return set()
+        expires_at = datetime.utcnow() + self.dedup_ttl
+        try:
+            self.dedup.insert_many(
+                [{"_id": event_id, "expires_at": expires_at} for event_id in event_ids], ordered=False
+            )
+        except BulkWriteError as exc:
+            errors = exc.details.get('writeErrors', [])
+            if any(error.get('code') != 11000 for error in errors):
+                raise
+            return {event_ids[error['index']] for error in errors}
+        return set()
+
+    def write(self, docs):
+        """
+        Sinyal dokümanlarını bucket'lara yazar. _id'si olmayan dokümanlara yeni ObjectId atanır.
+        """
+        for doc in docs:
+            doc.setdefault('_id', ObjectId())
+        operations = self.build_operations(docs)
+        if operations:
+            self.collection.bulk_write(operations, ordered=False)
+
+    def _recent_buckets_cursor(self, house_id=None, cursor_id=None):
+        query = {}
+        if house_id:
+            query["house_id"] = house_id
+        if cursor_id is not None:
+            query["min_id"] = {"$lt": cursor_id}
+        return routed(self.collection, 'get_recent_signals').find(query).sort("max_id", -1)
+
+    def _buckets_after_cursor(self, after_id=None, before_id=None):
+        query = {}
+        if before_id is not None:
+            query["min_id"] = {"$lt": before_id}
+        if after_id is not None:
+            # Bir bucket'taki okumalar tek bir pencereye düşer; after_id'den sonra okuma içeren
+            # bucket'ların min_id'si en fazla bir pencere (+ pay) geridedir. Bu alt sınır
+            # min_id index taramasını sınırlar.
+            lower = after_id.generation_time.replace(tzinfo=None) - self.span - timedelta(hours=1)
+            query.setdefault("min_id", {})["$gt"] = ObjectId.from_datetime(lower)
+            query["max_id"] = {"$gt": after_id}
+        return self.collection.find(query).sort("min_id", 1)
+
+    def _scan(self, buckets, limit, descending, accept, fields=None):
+        """
+        Bucket cursor'ındaki okumalardan accept(doc) olanların _id sırasına göre ilk limit tanesini döner.
+        Bucket'lar sıralama kenarına göre (azalan: max_id, artan: min_id) okunur; sıradaki bucket eldeki
+        limit'inci okumanın ötesinde başlıyorsa daha uygun okuma kalmamıştır ve tarama durur.
+        """
+        limit = int(limit)
+        collected = []
+        for bucket in buckets:
+            if len(collected) >= limit:
+                edge = collected[limit - 1]['_id']
+                if (bucket['max_id'] < edge) if descending else (bucket['min_id'] > edge):
+                    break
+            collected.extend(doc for doc in unpack_bucket(bucket, fields) if accept(doc))
+            collected.sort(key=lambda d: d['_id'], reverse=descending)
+            del collected[limit:]
+        return collected
+
+    def recent(self, limit=50, house_id=None, cursor=None):
+        """
+        En yeni okumaları _id'ye göre azalan sırada döner (MongoEventStore.get_recent_signals ile aynı şekil).
+        """
+        cursor_id = None
+        if cursor:
+            try:
+                cursor_id = ObjectId(cursor)
+            except Exception:
+                pass
+
+        collected = self._scan(
+            self._recent_buckets_cursor(house_id, cursor_id), limit, True,
+            lambda doc: cursor_id is None or doc['_id'] < cursor_id
+        )
+        for doc in collected:
+            doc['_id'] = str(doc['_id'])
+        return collected
+
+    def after(self, after_id=None, limit=10000, fields=None, before_id=None):
+        """
+        _id'si after_id'den büyük (before_id verilirse ondan küçük) okumaları artan _id sırasıyla döner
+        (analiz checkpoint'leri için).
+        """
+        return self._scan(
+            self._buckets_after_cursor(after_id, before_id), limit, False,
+            lambda doc: (after_id is None or doc['_id'] > after_id) and (before_id is None or doc['_id'] < before_id),
+            fields
+        )
+
+    def _query_buckets_cursor(self, house_id=None, id_range=None, descending=True):
+        query = {}
+        if house_id:
+            query["house_id"] = house_id
+        id_range = id_range or {}
+        # Aralıkla kesişen bucket'lar: max_id alt sınırın, min_id üst sınırın ötesinde olmamalı
+        lower = {op: value for op, value in id_range.items() if op in ('$gt', '$gte')}
+        upper = {op: value for op, value in id_range.items() if op in ('$lt', '$lte')}
+        if lower:
+            query["max_id"] = lower
+        if upper:
+            query["min_id"] = upper
+        reader = routed(self.collection, 'find_signals')
+        if descending:
+            return reader.find(query).sort("max_id", -1)
+        return reader.find(query).sort("min_id", 1)
+
+    @staticmethod
+    def _accept(id_range, match):
+        checks = {
+            '$gt': lambda a, b: a > b, '$gte': lambda a, b: a >= b,
+            '$lt': lambda a, b: a < b, '$lte': lambda a, b: a <= b,
+        }
+
+        def accept(doc):
+            payload = doc['payload']
+            return all(checks[op](doc['_id'], value) for op, value in id_range.items()) and \
+                all(payload.get(name) == value for name, value in match.items())
+        return accept
+
+    def query(self, house_id=None, id_range=None, match=None, descending=True, limit=50):
+        """
+        Filtreli sinyal listesi (MongoEventStore.find_signals): id_range Mongo karşılaştırma operatörleriyle
+        ({"$gte": ..., "$lt": ...}) _id aralığı, match payload alanı -> değer eşitlikleridir.
+        """
+        id_range = id_range or {}
+        accept = self._accept(id_range, match or {})
+        return self._scan(self._query_buckets_cursor(house_id, id_range, descending), limit, descending, accept)
+
+    def iter_query(self, house_id=None, id_range=None, match=None, descending=True, batch_size=100):
+        """
+        query() ile aynı filtrelerle tüm okumaları bucket bucket döner (export). Okumalar bucket içinde
+        sıralıdır; aynı pencereye düşen bucket'lar üst üste binebildiği için genel sıra yaklaşıktır.
+        """
+        id_range = id_range or {}
+        accept = self._accept(id_range, match or {})
+        for bucket in self._query_buckets_cursor(house_id, id_range, descending).batch_size(batch_size):
+            docs = [doc for doc in unpack_bucket(bucket) if accept(doc)]
+            docs.sort(key=lambda d: d['_id'], reverse=descending)
+            yield from docs
+
+    def iter_aggregate(self, house_id, after_version=None, batch_size=1000):
+        """
+        Bir evin okumalarını döner; after_version verilirse sadece versiyonu ondan büyük olanlar
+        (load_aggregate'in snapshot sonrası replay'i). Sıra bucket sırasıdır.
+        """
+        query = {"house_id": house_id}
+        if after_version is not None:
+            query["max_version"] = {"$gt": after_version}
+        for bucket in self.collection.find(query).batch_size(max(1, batch_size // 100)):
+            for doc in unpack_bucket(bucket):
+                if after_version is None or doc.get('version', 0) > after_version:
+                    yield doc
+
+    def iter_batches(self, batch_size=1000, before_id=None):
+        """
+        Tüm okumaları bucket sırasıyla batch'ler halinde döner (projeksiyon rebuild, migration).
+        before_id verilirse sadece _id'si ondan küçük okumalar döner.
+        """
+        batch = []
+        query = {"_id": {"$lt": before_id}} if before_id is not None else {}
+        for bucket in self.collection.find(query).sort("_id", 1).batch_size(max(1, batch_size // 100)):
+            readings = unpack_bucket(bucket)
+            if before_id is not None:
+                # Bucket'a sınırdan sonra eklenen okumalar
+                readings = [doc for doc in readings if doc['_id'] < before_id]
+            batch.extend(readings)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def query_shapes(self):
+        return {
+            "signal_buckets.recent": self._recent_buckets_cursor(),
+            "signal_buckets.recent(house_id)": self._recent_buckets_cursor("__explain__", ObjectId()),
+            "signal_buckets.after": self._buckets_after_cursor(ObjectId()),
+            "signal_buckets.query(house_id, asc)": self._query_buckets_cursor(
+                "__explain__", {"$gte": ObjectId()}, descending=False
+            ),
+            "signal_buckets.iter_aggregate(house_id, after_version)": self.collection.find(
+                {"house_id": "__explain__", "max_version": {"$gt": 0}}
+            ),
+        }
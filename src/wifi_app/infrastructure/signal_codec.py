@@ -0,0 +1,180 @@
+import uuid
+from datetime import datetime
+from bson import Binary
+
+SIGNAL_EVENT_TYPE = 'WifiSignalCaptured'
+# compact formatta yazılmış dokümanların işareti (migration sorguları için)
+COMPACT_ENCODING = 1
+
+# Bucket'larda paralel dizi olarak tutulan payload alanları (house_id bucket seviyesindedir)
+SIGNAL_FIELDS = (
+    'room', 'rssi', 'device_id', 'band', 'channel', 'ssid',
+    'link_speed_mbps', 'latency_ms', 'packet_loss_rate', 'bssid',
+)
+
+
+def encode_event_id(event_id):
+    if isinstance(event_id, Binary):
+        return event_id
+    try:
+        return Binary.from_uuid(uuid.UUID(event_id))
+    except (TypeError, ValueError, AttributeError):
+        return event_id
+
+
+def decode_event_id(event_id):
+    if isinstance(event_id, Binary):
+        return str(event_id.as_uuid())
+    return event_id
+
+
+def encode_timestamp(timestamp):
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp)
+    return timestamp
+
+
+def decode_timestamp(timestamp):
+    if isinstance(timestamp, datetime):
+        return timestamp.isoformat()
+    return timestamp
+
+
+def encode_compact(doc):
+    """
+    Sinyal event dokümanını compact formata çevirir: binary UUID, BSON datetime ve
+    payload içinde tekrar edilmeyen house_id (aggregate_id'den geri üretilir).
+    """
+    payload = {k: v for k, v in doc.get('payload', {}).items() if k != 'house_id'}
+    encoded = {
+        "event_id": encode_event_id(doc.get('event_id')),
+        "event_type": doc.get('event_type'),
+        "aggregate_id": doc.get('aggregate_id'),
+        "timestamp": encode_timestamp(doc.get('timestamp')),
+        "payload": payload,
+        "enc": COMPACT_ENCODING,
+    }
+    if 'version' in doc:
+        encoded['version'] = doc['version']
+    if '_id' in doc:
+        encoded['_id'] = doc['_id']
+    return encoded
+
+
+def decode_signal(doc):
+    """
+    compact formattaki (veya projeksiyonla kısmi okunmuş) sinyal dokümanını eski doküman şekline çevirir.
+    Eski formattaki dokümanlar olduğu gibi döner.
+    """
+    if doc.get('enc') != COMPACT_ENCODING:
+        return doc
+    decoded = {k: v for k, v in doc.items() if k != 'enc'}
+    if 'event_id' in decoded:
+        decoded['event_id'] = decode_event_id(decoded['event_id'])
+    if 'timestamp' in decoded:
+        decoded['timestamp'] = decode_timestamp(decoded['timestamp'])
+    if 'payload' in decoded:
+        decoded['payload'] = {"house_id": doc.get('aggregate_id'), **decoded['payload']}
+    return decoded
+
+
+def bucket_columns(docs):
+    """
+    Aynı ev/pencereye ait sinyal dokümanlarını bucket'a eklenecek paralel dizilere çevirir.
+    Dokümanların _id'si olmalıdır.
+    """
+    columns = {"ids": [], "eid": [], "ts": [], "ver": []}
+    columns.update({field: [] for field in SIGNAL_FIELDS})
+    for doc in docs:
+        payload = doc.get('payload', {})
+        columns["ids"].append(doc['_id'])
+        columns["eid"].append(encode_event_id(doc.get('event_id')))
+        columns["ts"].append(encode_timestamp(doc.get('timestamp')))
+        columns["ver"].append(doc.get('version'))
+        for field in SIGNAL_FIELDS:
+            columns[field].append(payload.get(field))
+    return columns
+
+
+def unpack_bucket(bucket, fields=None):
+    """
+    Bucket dokümanındaki okumaları eski sinyal dokümanı şeklinde döner.
+    fields verilirse payload sadece bu alanlarla doldurulur.
+    """
+    house_id = bucket.get('house_id')
+    payload_fields = [f for f in SIGNAL_FIELDS if fields is None or f in fields]
+    ids = bucket.get('ids', [])
+    eids = bucket.get('eid', [])
+    timestamps = bucket.get('ts', [])
+    versions = bucket.get('ver', [])
+    columns = [(field, bucket.get(field, [])) for field in payload_fields]
+    docs = []
+    for i, _id in enumerate(ids):
+        payload = {"house_id": house_id}
+        for field, values in columns:
+            payload[field] = values[i] if i < len(values) else None
+        doc = {
+            "_id": _id,
+            "event_id": decode_event_id(eids[i]) if i < len(eids) else None,
+            "event_type": SIGNAL_EVENT_TYPE,
+            "aggregate_id": house_id,
+            "timestamp": decode_timestamp(timestamps[i]) if i < len(timestamps) else None,
+            "payload": payload,
+        }
+        # Aggregate versiyonlaması öncesi yazılmış bucket'larda ver dizisi yoktur
+        if i < len(versions) and versions[i] is not None:
+            doc["version"] = versions[i]
+        docs.append(doc)
+    return docs
+
+
+# /api/signals/ listesinin düz kayıt şekli: alan -> (event dokümanındaki yol, eksikse varsayılan)
+SIGNAL_LIST_FIELDS = {
+    "mongo_id": ("_id", None),
+    "event_id": ("event_id", None),
+    "timestamp": ("timestamp", None),
+    "house_id": ("payload.house_id", None),
+    "room": ("payload.room", None),
+    "rssi": ("payload.rssi", None),
+    "ssid": ("payload.ssid", None),
+    "band": ("payload.band", None),
+    "device_id": ("payload.device_id", None),
+    "link_speed_mbps": ("payload.link_speed_mbps", 0),
+    "latency_ms": ("payload.latency_ms", 0),
+    "packet_loss_rate": ("payload.packet_loss_rate", 0),
+    "bssid": ("payload.bssid", ""),
+}
+
+
+def flatten_signal(doc, fields=None):
+    """
+    WifiSignalCaptured event dokümanını API'nin döndüğü düz sinyal formatına çevirir.
+    fields verilirse sadece bu alanlar (SIGNAL_LIST_FIELDS sırasıyla) döner.
+    """
+    payload = doc.get('payload', {})
+    item = {}
+    for name, (path, default) in SIGNAL_LIST_FIELDS.items():
+        if fields is not None and name not in fields:
+            continue
+        if path.startswith('payload.'):
+            item[name] = payload.get(path[8:], default)
+        elif name in ('mongo_id', 'event_id'):
+            item[name] = str(doc.get(path))
+        else:
+            item[name] = doc.get(path, default)
+    return item
+
+
+def flatten_signal_projection(fields=None):
+    """
+    flatten_signal'ın aggregation $project karşılığı; düzleştirme Mongo tarafında yapılır.
+    """
+    projection = {"_id": 0}
+    for name, (path, default) in SIGNAL_LIST_FIELDS.items():
+        if fields is not None and name not in fields:
+            continue
+        if name == 'mongo_id':
+            projection[name] = {"$toString": "$_id"}
+        else:
+            projection[name] = {"$ifNull": [f"${path}", default]}
+    return projection
@@ -0,0 +1,68 @@
+from datetime import timedelta
+from django.conf import settings
+from pymongo.errors import DuplicateKeyError
+from ..domain.aggregates import HouseAggregate
+
+
+class AggregateSnapshotStore:
+    """
+    Ev başına HouseAggregate snapshot'ları (_id = house_id). Snapshot dokümanı durumu ve kapsadığı son
+    aggregate versiyonunu tutar; load_aggregate sadece bu versiyondan sonraki eventleri oynatır.
+
+    Versiyonlar yazılmadan önce ayrılır; ayrılmış ama henüz yazılmamış bir versiyon snapshot'ın altında
+    kalırsa bir daha oynatılmaz. Bu yüzden snapshot iki adımda alınır: önce o an görülen son versiyon
+    pending_version olarak işaretlenir, AGGREGATE_SNAPSHOT_SETTLE_SECONDS geçtikten sonraki yüklemede
+    durum bu versiyona kadar olan eventlerle snapshot'a yazılır.
+    """
+    collection_name = 'aggregate_snapshots'
+
+    def __init__(self, db):
+        self.collection = db[self.collection_name]
+        self.settle = timedelta(seconds=settings.AGGREGATE_SNAPSHOT_SETTLE_SECONDS)
+
+    def get(self, house_id):
+        return self.collection.find_one({"_id": house_id})
+
+    @staticmethod
+    def has_state(snapshot):
+        return snapshot is not None and 'version' in snapshot
+
+    def restore(self, house_id, snapshot):
+        if not self.has_state(snapshot):
+            return HouseAggregate(house_id)
+        return HouseAggregate.from_state(house_id, snapshot['version'], snapshot.get('state', {}))
+
+    def settled_version(self, snapshot, now):
+        """
+        Snapshot'a yazılabilecek versiyon: settle süresini doldurmuş pending_version, yoksa None.
+        """
+        if snapshot is None or snapshot.get('pending_at') is None:
+            return None
+        if snapshot['pending_at'] > now - self.settle:
+            return None
+        return snapshot['pending_version']
+
+    def save(self, house_id, aggregate, settled_version, pending_version, now):
+        """
+        aggregate verilirse settled_version'a kadar olan durumu snapshot olarak yazar; her durumda bir sonraki
+        snapshot için pending_version'ı işaretler. Daha yeni bir snapshot varsa (eşzamanlı yükleme) yazılmaz.
+        """
+        if aggregate is not None:
+            query = {"_id": house_id, "$or": [{"version": {"$exists": False}}, {"version": {"$lt": settled_version}}]}
+            update = {
+                "version": settled_version,
+                "state": aggregate.to_state(),
+                "taken_at": now,
+                "pending_version": pending_version,
+                "pending_at": now,
+            }
+        else:
+            query = {"_id": house_id, "pending_at": None}
+            update = {"pending_version": pending_version, "pending_at": now}
+        try:
+            self.collection.update_one(query, {"$set": update}, upsert=True)
+        except DuplicateKeyError:
+            pass
+
+    def reset(self):
+        self.collection.delete_many({})
@@ -0,0 +1,28 @@
+import time
+from django.core.management.base import BaseCommand
+from wifi_app.infrastructure.event_store import MongoEventStore
+from wifi_app.infrastructure.analysis_runner import SignalAnalysisRunner
+
+
+class Command(BaseCommand):
+    help = "Son çalıştırmadan sonra gelen sinyalleri analiz eder ve oda skorları ile önerileri üretir."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100000)
+        parser.add_argument(
+            '--full', action='store_true',
+            help="Oda state'ini ve checkpoint'i sıfırlayıp tüm sinyalleri baştan analiz et."
+        )
+
+    def handle(self, *args, **options):
+        runner = SignalAnalysisRunner(MongoEventStore(), batch_size=options['batch_size'])
+        if options['full']:
+            runner.reset()
+
+        started = time.monotonic()
+        stats = runner.run()
+        duration = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats['signals']} sinyal, {stats['houses']} ev, {stats['events']} event "
+            f"{duration:.2f} saniyede işlendi."
+        ))
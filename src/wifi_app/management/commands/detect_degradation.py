@@ -0,0 +1,41 @@
+import time
+from django.core.management.base import BaseCommand
+from wifi_app.infrastructure.event_store import MongoEventStore
+from wifi_app.infrastructure.degradation_monitor import DegradationMonitor
+
+
+class Command(BaseCommand):
+    help = (
+        "Yeni sinyalleri degradation detector'den geçirir ve SignalDegradationDetected eventleri üretir. "
+        "--follow ile sürekli çalışan tüketici olarak kullanılır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000)
+        parser.add_argument('--follow', action='store_true', help="Yeni sinyaller için beklemeye devam et.")
+        parser.add_argument(
+            '--interval', type=float, default=1.0,
+            help="--follow modunda yeni sinyal yokken bekleme süresi (saniye)."
+        )
+        parser.add_argument(
+            '--full', action='store_true',
+            help="Dedektör durumunu ve checkpoint'i sıfırlayıp tüm sinyalleri baştan işle."
+        )
+
+    def handle(self, *args, **options):
+        monitor = DegradationMonitor(MongoEventStore(), batch_size=options['batch_size'])
+        if options['full']:
+            monitor.reset()
+
+        while True:
+            started = time.monotonic()
+            stats = monitor.run()
+            duration = time.monotonic() - started
+            if stats['signals'] or not options['follow']:
+                self.stdout.write(self.style.SUCCESS(
+                    f"{stats['signals']} sinyal, {stats['events']} bozulma eventi {duration:.2f} saniyede işlendi."
+                ))
+            if not options['follow']:
+                return
+            if not stats['signals']:
+                time.sleep(options['interval'])
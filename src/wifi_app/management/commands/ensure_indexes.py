@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from wifi_app.infrastructure.event_store import MongoEventStore
+from wifi_app.infrastructure.indexes import ensure_indexes
+
+
+class Command(BaseCommand):
+    help = "event_store indexlerini oluşturur, --check ile sorgu planlarında COLLSCAN olup olmadığını denetler."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check', action='store_true',
+            help="Index oluşturduktan sonra tüm store sorgularını explain() ile kontrol et."
+        )
+
+    def handle(self, *args, **options):
+        store = MongoEventStore()
+        names = ensure_indexes(store.db)
+        self.stdout.write(f"Indexler hazır: {', '.join(names)}")
+
+        if not options['check']:
+            return
+
+        scans = store.collection_scans()
+        if scans:
+            for name, paths in scans.items():
+                self.stderr.write(f"COLLSCAN: {name} -> {', '.join(paths)}")
+            raise CommandError(f"{len(scans)} sorgu COLLSCAN kullanıyor.")
+        self.stdout.write(self.style.SUCCESS("Tüm sorgular index kullanıyor."))
@@ -0,0 +1,112 @@
+import time
+from django.core.management.base import BaseCommand
+from pymongo.errors import BulkWriteError
+from pymongo import DeleteOne, ReplaceOne
+from wifi_app.infrastructure.event_store import MongoEventStore
+from wifi_app.infrastructure.indexes import ensure_indexes
+from wifi_app.infrastructure.projections.base import DUPLICATE_KEY_ERROR
+from wifi_app.infrastructure.signal_buckets import BucketedSignalStore
+from wifi_app.infrastructure.signal_codec import (
+    SIGNAL_EVENT_TYPE, COMPACT_ENCODING, encode_compact, decode_signal, unpack_bucket
+)
+
+FORMATS = ('document', 'compact', 'bucketed')
+
+
+def insert_ignoring_duplicates(collection, docs):
+    """
+    Dokümanları unordered ekler; daha önce eklenmiş (_id çakışan) dokümanları atlar.
+    """
+    if not docs:
+        return
+    try:
+        collection.insert_many(docs, ordered=False)
+    except BulkWriteError as exc:
+        errors = [e for e in exc.details.get('writeErrors', []) if e.get('code') != DUPLICATE_KEY_ERROR]
+        if errors:
+            raise
+
+
+class Command(BaseCommand):
+    help = (
+        "WifiSignalCaptured eventlerini document / compact / bucketed saklama formatları arasında taşır. "
+        "Okuma _id'leri korunur; yarıda kalan migration tekrar çalıştırılabilir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--to', required=True, choices=FORMATS, dest='target')
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        store = MongoEventStore()
+        ensure_indexes(store.db)
+        target = options['target']
+        batch_size = options['batch_size']
+        buckets = BucketedSignalStore(store.db)
+
+        started = time.monotonic()
+        if target == 'bucketed':
+            total = self.documents_to_buckets(store, buckets, batch_size)
+        else:
+            total = self.rewrite_documents(store, target, batch_size)
+            total += self.buckets_to_documents(store, buckets, target, batch_size)
+
+        duration = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{total} sinyal {duration:.2f} saniyede '{target}' formatına taşındı. "
+            f"SIGNAL_STORAGE_FORMAT={target} ayarını kullanmayı unutmayın."
+        ))
+
+    def rewrite_documents(self, store, target, batch_size):
+        """
+        event_store'daki sinyalleri yerinde (aynı _id ile) hedef formata çevirir.
+        Sorgu sadece henüz çevrilmemiş dokümanları seçtiği için ilerleme kendiliğinden kaydedilir.
+        """
+        if target == 'compact':
+            query = {"event_type": SIGNAL_EVENT_TYPE, "enc": {"$exists": False}}
+            convert = encode_compact
+        else:
+            query = {"event_type": SIGNAL_EVENT_TYPE, "enc": COMPACT_ENCODING}
+            convert = decode_signal
+
+        total = 0
+        while True:
+            docs = list(store.collection.find(query).sort("_id", 1).limit(batch_size))
+            if not docs:
+                return total
+            store.collection.bulk_write(
+                [ReplaceOne({"_id": doc['_id']}, convert(doc)) for doc in docs], ordered=False
+            )
+            total += len(docs)
+
+    def buckets_to_documents(self, store, buckets, target, batch_size):
+        """
+        Bucket'lardaki okumaları event_store'a tekil dokümanlar olarak yazar ve bucket'ı siler.
+        """
+        total = 0
+        bucket_batch = max(1, batch_size // max(1, buckets.max_readings))
+        while True:
+            bucket_docs = list(buckets.collection.find().sort("_id", 1).limit(bucket_batch))
+            if not bucket_docs:
+                return total
+            docs = [doc for bucket in bucket_docs for doc in unpack_bucket(bucket)]
+            if target == 'compact':
+                docs = [encode_compact(doc) for doc in docs]
+            insert_ignoring_duplicates(store.collection, docs)
+            buckets.collection.bulk_write([DeleteOne({"_id": b['_id']}) for b in bucket_docs])
+            total += len(docs)
+
+    def documents_to_buckets(self, store, buckets, batch_size):
+        """
+        event_store'daki sinyalleri _id sırasıyla bucket'lara yazar ve event_store'dan siler.
+        Aynı batch tekrar işlenirse bucket'lar aynı _id ile üretildiği için tekrar yazılmaz.
+        """
+        total = 0
+        query = {"event_type": SIGNAL_EVENT_TYPE}
+        while True:
+            docs = [decode_signal(doc) for doc in store.collection.find(query).sort("_id", 1).limit(batch_size)]
+            if not docs:
+                return total
+            insert_ignoring_duplicates(buckets.collection, buckets.build_documents(docs))
+            store.collection.delete_many({"_id": {"$in": [doc['_id'] for doc in docs]}})
+            total += len(docs)
@@ -0,0 +1,80 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from django.core.management.base import BaseCommand, CommandError
+from wifi_app.infrastructure.event_store import MongoEventStore
+from wifi_app.infrastructure.projections import get_projections
+from wifi_app.infrastructure.replay import ReplayRun, init_worker, replay_partition
+
+
+class Command(BaseCommand):
+    help = (
+        "Okuma modellerini event_store'dan paralel olarak yeniden kurar. Store aggregate_id hash'ine veya "
+        "_id aralıklarına göre partition'lara bölünür ve partition'lar worker process'lerde oynatılır. "
+        "Yarıda kalan replay aynı komutla kaldığı yerden devam eder. Sadece projeksiyonları kurar: analiz "
+        "state'i (analysis_room_windows) yeniden hesaplanmaz ve RoomPerformanceCalculated yeniden üretilmez; "
+        "bunun için ardından analyze_signals --full çalıştırın."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--only', nargs='+', metavar='NAME',
+            help="Sadece verilen projeksiyonları yeniden kur (ör. rollups room_metrics)."
+        )
+        parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+        parser.add_argument(
+            '--partitions', type=int,
+            help="Partition sayısı (varsayılan: worker sayısının 4 katı; iş yükü worker'lara dengeli dağılır)."
+        )
+        parser.add_argument('--partition-by', choices=['hash', 'id'], default='hash', dest='mode')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument(
+            '--restart', action='store_true',
+            help="Yarıda kalan replay'e devam etmek yerine okuma modellerini temizleyip baştan başla."
+        )
+
+    def handle(self, *args, **options):
+        store = MongoEventStore()
+        replay_run = ReplayRun(store.db)
+        run = replay_run.load()
+
+        if run is not None and run.get('finished_at') is None and not options['restart']:
+            if run['signal_format'] != store.signal_format:
+                raise CommandError(
+                    f"Yarıda kalan replay {run['signal_format']} formatında başlatılmış; "
+                    f"SIGNAL_STORAGE_FORMAT={store.signal_format}. --restart ile baştan başlatın."
+                )
+            self.stdout.write(f"Yarıda kalan replay devam ediyor ({run['started_at']:%Y-%m-%d %H:%M:%S} başlangıçlı).")
+        else:
+            try:
+                names = [p.name for p in get_projections(options['only'])]
+            except KeyError as exc:
+                raise CommandError(str(exc))
+            partitions = options['partitions'] or options['workers'] * 4
+            run = replay_run.start(store, names, options['mode'], partitions, store.signal_format)
+
+        workers = max(1, options['workers'])
+        partitions = run['partitions']
+        self.stdout.write(
+            f"{', '.join(run['projections'])}: {len(partitions)} partition ({run['mode']}), {workers} worker"
+        )
+
+        started = time.monotonic()
+        total = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            futures = [executor.submit(replay_partition, spec['index'], options['batch_size']) for spec in partitions]
+            for done, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                total += result['events']
+                elapsed = time.monotonic() - started
+                rate = result['events'] / result['seconds'] if result['seconds'] else 0
+                self.stdout.write(
+                    f"[{done}/{len(partitions)}] partition {result['index']}: {result['events']} event "
+                    f"({rate:.0f} event/s) | toplam {total} event, {total / elapsed if elapsed else 0:.0f} event/s"
+                )
+
+        replay_run.finish()
+        duration = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"{total} event {duration:.2f} saniyede yeniden oynatıldı ({total / duration if duration else 0:.0f} event/s)."
+        ))
@@ -0,0 +1,31 @@
+import time
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from wifi_app.infrastructure.event_store import MongoEventStore
+
+
+class Command(BaseCommand):
+    help = (
+        "Evlerin aggregate snapshot'larını ilerletir. Snapshot iki adımda alınır (pending versiyon, "
+        "AGGREGATE_SNAPSHOT_SETTLE_SECONDS sonra snapshot); periyodik (ör. cron) çalıştırılmalıdır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--house', nargs='+', metavar='HOUSE_ID', help="Sadece verilen evler.")
+        parser.add_argument(
+            '--min-events', type=int, default=0,
+            help="Snapshot'tan sonra en az bu kadar event birikmiş evlerin snapshot'ını ilerlet."
+        )
+
+    def handle(self, *args, **options):
+        if not settings.AGGREGATE_VERSIONING:
+            raise CommandError("Snapshots require AGGREGATE_VERSIONING=True.")
+        store = MongoEventStore()
+        house_ids = options['house'] or [h.get('house_id') for h in store.get_registered_houses()]
+
+        started = time.monotonic()
+        for house_id in house_ids:
+            aggregate = store.load_aggregate(house_id, snapshot_every=options['min_events'])
+            self.stdout.write(f"{house_id}: version {aggregate.version}, {aggregate.event_count} event")
+        duration = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f"{len(house_ids)} ev {duration:.2f} saniyede işlendi."))
@@ -0,0 +1,148 @@
+import inspect
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+
+import django  # noqa: E402
+
+django.setup()
+
+import mongomock  # noqa: E402
+from mongomock import collection as mongomock_collection  # noqa: E402
+
+
+def _create_indexes(self, indexes, session=None, **kwargs):
+    # mongomock IndexModel'deki partialFilterExpression'ı yok sayıyor; index'ler tek tek kurulur ve
+    # partial unique index mevcut dokümanlara uygulanmaz
+    names = []
+    for model in indexes:
+        options = dict(model.document)
+        keys = list(options.pop('key').items())
+        if options.get('name') in self.index_information():
+            names.append(options['name'])
+            continue
+        if 'partialFilterExpression' in options and self.count_documents({}):
+            options.pop('unique', None)
+        names.append(self.create_index(keys, **options))
+    return names
+
+
+def _bulk_option_shim(method):
+    # pymongo'nun bulk operasyonlarına eklediği, mongomock'un tanımadığı argümanlar (ör. sort) atılır
+    known = set(inspect.signature(method).parameters)
+
+    def wrapper(self, *args, **kwargs):
+        return method(self, *args, **{name: value for name, value in kwargs.items() if name in known})
+    return wrapper
+
+
+mongomock_collection.Collection.create_indexes = _create_indexes
+mongomock_collection.BulkOperationBuilder.add_update = _bulk_option_shim(
+    mongomock_collection.BulkOperationBuilder.add_update
+)
+mongomock_collection.BulkOperationBuilder.add_replace = _bulk_option_shim(
+    mongomock_collection.BulkOperationBuilder.add_replace
+)
+
+
+class AsyncCursor:
+    """
+    mongomock cursor'ını pymongo'nun async cursor API'si (to_list, async for) ile sarar.
+    """
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+    def __getattr__(self, name):
+        attr = getattr(self.cursor, name)
+        if name in ('sort', 'limit', 'skip', 'batch_size', 'hint'):
+            def chained(*args, **kwargs):
+                attr(*args, **kwargs)
+                return self
+            return chained
+        return attr
+
+    async def to_list(self, length=None):
+        docs = list(self.cursor)
+        return docs if length is None else docs[:length]
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.cursor:
+            yield doc
+
+
+class AsyncCollection:
+    """
+    mongomock koleksiyonunun AsyncMongoEventStore'un kullandığı async API'si.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getattr__(self, name):
+        attr = getattr(self.collection, name)
+        if name in ('find_one', 'find_one_and_update', 'insert_one', 'insert_many', 'update_one',
+                    'count_documents'):
+            async def call(*args, **kwargs):
+                return attr(*args, **kwargs)
+            return call
+        return attr
+
+    def find(self, *args, **kwargs):
+        return AsyncCursor(self.collection.find(*args, **kwargs))
+
+    async def aggregate(self, pipeline, **kwargs):
+        return AsyncCursor(self.collection.aggregate(pipeline, **kwargs))
+
+    def with_options(self, **kwargs):
+        return self
+
+
+class AsyncDatabase:
+    def __init__(self, client, db):
+        self.client = client
+        self.db = db
+
+    def __getitem__(self, name):
+        return AsyncCollection(self.db[name])
+
+
+class AsyncClient:
+    def __init__(self, client):
+        self.client = client
+
+    def __getitem__(self, name):
+        return AsyncDatabase(self, self.client[name])
+
+
+@pytest.fixture
+def mongo():
+    """
+    Sync ve async Mongo istemcilerini yeni bir mongomock veritabanına bağlayan fonksiyon döner; her çağrı boş
+    bir veritabanı (ve boş tekilleştirme önbelleği) ile başlar. Test sonunda istemciler geri alınır.
+    """
+    from django.conf import settings
+    from wifi_app.infrastructure import dedup
+    from wifi_app.infrastructure.async_mongo_client import AsyncMongoDBClient
+    from wifi_app.infrastructure.event_store import MongoEventStore
+    from wifi_app.infrastructure.mongo_client import MongoDBClient
+
+    def connect():
+        client = mongomock.MongoClient()
+        MongoDBClient._client = client
+        AsyncMongoDBClient._client = AsyncClient(client)
+        MongoEventStore._indexes_ensured = False
+        dedup._recent = None
+        return client[settings.MONGO_DB_NAME]
+
+    saved = MongoDBClient._client, AsyncMongoDBClient._client, dedup._recent
+    yield connect
+    MongoDBClient._client, AsyncMongoDBClient._client, dedup._recent = saved
+    MongoEventStore._indexes_ensured = False
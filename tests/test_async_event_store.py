@@ -0,0 +1,123 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from django.conf import settings
+
+from wifi_app.domain.events import (
+    HouseRegistered, PerformanceRecommendationGenerated, RoomPerformanceCalculated, WifiSignalCaptured,
+    reading_event_id
+)
+from wifi_app.infrastructure.async_event_store import AsyncMongoEventStore
+from wifi_app.infrastructure.event_store import MongoEventStore
+
+HOUSE_ID = 'house_parity'
+
+
+def signal(i, **overrides):
+    values = dict(
+        house_id=HOUSE_ID, room=('Salon', 'Mutfak', 'Yatak Odası')[i % 3], rssi=-40 - i % 45,
+        device_id=f"device-{i % 2}", band=('2.4GHz', '5GHz')[i % 2], channel=(6, 36)[i % 2], ssid='Wifi_Test',
+        link_speed_mbps=100 + i * 7 % 400, latency_ms=5 + i % 60, packet_loss_rate=i % 4 / 100, bssid='00:AA:BB:CC:DD:EE',
+    )
+    values.update(overrides)
+    event = WifiSignalCaptured(**values)
+    # Okuma id'sinden üretilen event_id ile tekrar gönderim, ingest view'ındaki gibi tekilleştirme yolundan geçer
+    event.event_id = reading_event_id(HOUSE_ID, f"reading-{i}")
+    return event
+
+
+def house_events():
+    return [
+        HouseRegistered(house_id=HOUSE_ID, house_type='Daire', owner_name='Test', area_sqm=90),
+        RoomPerformanceCalculated(
+            house_id=HOUSE_ID, room_name='Salon', gaming_score=80, streaming_score=75, video_call_score=90,
+            overall_rating=82, avg_signal_dbm=-52, avg_speed_mbps=300, avg_latency_ms=18, packet_loss_avg=0.01,
+        ),
+        PerformanceRecommendationGenerated(
+            house_id=HOUSE_ID, room_recommendations={'Salon': 'İyi'}, global_recommendation_text='Sorun yok',
+            global_severity='OK',
+        ),
+    ]
+
+
+def strip_ids(value):
+    # _id'ler her yazımda yeniden üretildiği için karşılaştırmadan çıkarılır
+    if isinstance(value, dict):
+        return {k: strip_ids(v) for k, v in value.items() if k not in ('_id', 'mongo_id')}
+    if isinstance(value, list):
+        return [strip_ids(v) for v in value]
+    return value
+
+
+def scenario_events():
+    # Her iki store'a aynı nesneler yazılır; event_id ve timestamp'ler birebir aynı olur
+    return house_events(), signal(99, room='Balkon'), [signal(i) for i in range(40)]
+
+
+def exercise(events, append, append_many, find_signals, get_house_dashboard):
+    """
+    Eventleri yazıp sorgulayan senaryo; store'un metodları (sync ya da await edilmiş async) ile çalışır.
+    """
+    house, single, signals = events
+    results = {
+        'append': [append(event) for event in house],
+        'append_signal': append(single),
+        'append_duplicate': append(single),
+        'append_many': [doc['event_id'] for doc in append_many(signals)],
+        'append_many_duplicates': append_many(signals[:5]),
+        'append_many_empty': append_many([]),
+    }
+    since = datetime.utcnow() - timedelta(hours=1)
+    queries = {
+        'default': {},
+        'house': {'house_id': HOUSE_ID, 'limit': 500},
+        'room': {'house_id': HOUSE_ID, 'room': 'Mutfak', 'order': 'asc'},
+        'band_device': {'house_id': HOUSE_ID, 'band': '5GHz', 'device_id': 'device-1', 'limit': 7},
+        'since': {'house_id': HOUSE_ID, 'since': since, 'order': 'asc', 'limit': 3},
+        'fields': {'house_id': HOUSE_ID, 'fields': ['room', 'rssi'], 'limit': 10},
+        'unknown_house': {'house_id': 'missing'},
+    }
+    results['find_signals'] = {name: strip_ids(find_signals(**query)) for name, query in queries.items()}
+    results['dashboard'] = strip_ids(get_house_dashboard(HOUSE_ID))
+    results['dashboard_missing'] = strip_ids(get_house_dashboard('missing'))
+    return results
+
+
+def run_sync(events):
+    store = MongoEventStore()
+    return exercise(events, store.append, store.append_many, store.find_signals, store.get_house_dashboard)
+
+
+def run_async(events):
+    async def scenario():
+        store = AsyncMongoEventStore()
+        loop = asyncio.get_running_loop()
+
+        def blocking(method):
+            # exercise sync bir fonksiyon ve worker thread'de çalışır; async metodlar bu event loop'a gönderilip beklenir
+            return lambda *args, **kwargs: asyncio.run_coroutine_threadsafe(method(*args, **kwargs), loop).result()
+
+        return await asyncio.to_thread(
+            exercise, events, blocking(store.append), blocking(store.append_many), blocking(store.find_signals),
+            blocking(store.get_house_dashboard),
+        )
+
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize('signal_format', ['document', 'compact', 'bucketed'])
+def test_async_store_matches_sync_store(mongo, monkeypatch, signal_format):
+    monkeypatch.setattr(settings, 'SIGNAL_STORAGE_FORMAT', signal_format)
+    events = scenario_events()
+    mongo()
+    expected = run_sync(events)
+    mongo()
+    actual = run_async(events)
+
+    assert expected['append'] == [True, True, True]
+    assert expected['append_duplicate'] is False
+    assert len(expected['append_many']) == 40
+    assert expected['append_many_duplicates'] == []
+    assert expected['dashboard']['signals']['count'] == 41
+    assert actual == expected
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+
+from wifi_app.domain.events import WifiSignalCaptured
+from wifi_app.infrastructure import degradation_monitor
+from wifi_app.infrastructure.degradation_monitor import DegradationMonitor
+from wifi_app.infrastructure.event_store import MongoEventStore
+
+
+def signal(rssi):
+    return WifiSignalCaptured(
+        house_id='house_degradation', room='Salon', rssi=rssi, device_id='d1', band='5GHz', channel=36,
+        ssid='Wifi_Test', link_speed_mbps=300, latency_ms=10, packet_loss_rate=0, bssid='b1',
+    )
+
+
+def degradation_ids(store):
+    return sorted(doc['event_id'] for doc in store.collection.find({"event_type": "SignalDegradationDetected"}))
+
+
+def test_replay_after_lost_checkpoint_writes_no_duplicate_events(mongo, monkeypatch):
+    mongo()
+    # Az önce yazılan sinyaller de okunsun
+    high_water = ObjectId.from_datetime(datetime.utcnow() + timedelta(minutes=1))
+    monkeypatch.setattr(degradation_monitor, 'signal_high_water', lambda: high_water)
+    store = MongoEventStore()
+    store.append_many([signal(-45) for _ in range(40)] + [signal(-85) for _ in range(10)])
+
+    assert DegradationMonitor(store).run()["events"] == 1
+    first = degradation_ids(store)
+
+    # append_many ile save arasında çöken tüketici: eventler yazıldı, durum ve checkpoint yazılmadı
+    DegradationMonitor(store).reset()
+    DegradationMonitor(store).run()
+    assert degradation_ids(store) == first
@@ -0,0 +1,94 @@
+import json
+import random
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework.exceptions import ValidationError
+
+from wifi_app.api.fast_validation import CompiledValidator
+from wifi_app.api.fast_views import signal_validator
+from wifi_app.api.serializers import WifiSignalSerializer
+
+FIELDS = [
+    "house_id", "room", "rssi", "device_id", "band", "channel", "ssid",
+    "link_speed_mbps", "latency_ms", "packet_loss_rate", "bssid",
+]
+
+# Alan değerlerini bozmak için kullanılan girdiler (DRF'nin dönüşüm kenar durumları)
+ODD_VALUES = [
+    None, True, False, 0, -1, 3.0, 3.5, -0.0, 1e20, 10 ** 30, "", " ", "\t\n", " 12 ", "12.000", "12.5",
+    "1e3", "1_000", "٣", "-7", "abc", "x" * 100, "x" * 101, " " + "x" * 100 + " ", "a\x00b", "a\ud800b",
+    "5GHz", "5ghz", " 5GHz", "2.4GHz", [], [1], {}, {"a": 1}, "0" * 1001, "null", "True",
+]
+
+
+def valid_signal(rng):
+    return {
+        "house_id": f"house_{rng.randint(1, 50):03d}",
+        "room": rng.choice(["Salon", "Mutfak", "Yatak Odası"]),
+        "rssi": rng.randint(-90, -35),
+        "device_id": "test-device",
+        "band": rng.choice(["2.4GHz", "5GHz"]),
+        "channel": rng.choice([1, 6, 11, 36, 44]),
+        "ssid": "Wifi_Test",
+        "link_speed_mbps": rng.randint(50, 866),
+        "latency_ms": rng.randint(5, 120),
+        "packet_loss_rate": rng.randint(0, 5),
+        "bssid": "00:AA:BB:00:10:FF",
+    }
+
+
+def random_case(rng):
+    roll = rng.random()
+    if roll < 0.03:
+        return rng.choice([None, [], "x", 5, [valid_signal(rng)]])
+    item = valid_signal(rng)
+    for _ in range(rng.choice([0, 1, 1, 2, 3])):
+        name = rng.choice(FIELDS + ["extra"])
+        if rng.random() < 0.25:
+            item.pop(name, None)
+        else:
+            item[name] = rng.choice(ODD_VALUES)
+    return item
+
+
+def drf_result(item):
+    try:
+        return "ok", dict(WifiSignalSerializer().run_validation(item))
+    except ValidationError as exc:
+        # ErrorDetail -> str (API yanıtındaki JSON ile aynı)
+        return "error", json.loads(json.dumps(exc.detail))
+
+
+def fast_result(item):
+    validated, errors = signal_validator.validate(item)
+    if errors is not None:
+        return "error", errors
+    return "ok", validated
+
+
+@pytest.mark.parametrize('name', FIELDS + ["extra"])
+def test_each_odd_value_matches_drf(name):
+    rng = random.Random(name)
+    for value in ODD_VALUES:
+        item = valid_signal(rng)
+        item[name] = value
+        assert fast_result(item) == drf_result(item), item
+        del item[name]
+        assert fast_result(item) == drf_result(item), item
+
+
+def test_random_records_match_drf():
+    rng = random.Random(7)
+    for _ in range(5000):
+        item = random_case(rng)
+        assert fast_result(item) == drf_result(item), item
+
+
+def test_object_level_validation_is_rejected():
+    class CheckedSignalSerializer(WifiSignalSerializer):
+        def validate(self, attrs):
+            return attrs
+
+    with pytest.raises(ImproperlyConfigured):
+        CompiledValidator(CheckedSignalSerializer)
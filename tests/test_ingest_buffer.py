@@ -0,0 +1,41 @@
+import threading
+import time
+
+from wifi_app.infrastructure.ingest_buffer import IngestBuffer
+
+
+class BlockingStore:
+    """
+    İlk append_many çağrısında release edilene kadar bekleyen store; yazılan eventleri toplar.
+    """
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.written = []
+
+    def append_many(self, events):
+        self.release.wait()
+        self.written.extend(events)
+        return events
+
+
+def test_close_honours_timeout_when_queue_is_full():
+    store = BlockingStore()
+    buffer = IngestBuffer(lambda: store, max_size=2, flush_events=1, flush_interval_ms=10)
+    buffer.submit('e0')
+    # Yazıcı ilk event'i aldı ve store'da bekliyor; kuyruk dolar
+    deadline = time.monotonic() + 1
+    while not buffer._queue.empty() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    buffer.submit('e1')
+    buffer.submit('e2')
+
+    started = time.monotonic()
+    buffer.close(timeout=0.2)
+    assert time.monotonic() - started < 1
+
+    # Durdurma işareti kuyruğa girmediği halde yazıcı kalanları yazıp durur
+    store.release.set()
+    buffer._thread.join(1)
+    assert not buffer._thread.is_alive()
+    assert store.written == ['e0', 'e1', 'e2']
@@ -0,0 +1,48 @@
+from wifi_app.domain.events import HouseRegistered, WifiSignalCaptured
+from wifi_app.infrastructure.event_store import MongoEventStore
+from wifi_app.infrastructure.projections import dispatch, get_projections
+from wifi_app.infrastructure.replay import PartitionReader, ReplayRun, house_partition, replay_partition
+
+PARTITIONS = 3
+
+
+def signal(i):
+    return WifiSignalCaptured(
+        house_id=f"house-{i % 7}", room=('Salon', 'Mutfak')[i % 2], rssi=-40 - i % 40, device_id='d1', band='5GHz',
+        channel=36, ssid='Wifi_Test', link_speed_mbps=300, latency_ms=10 + i % 30, packet_loss_rate=0, bssid='b1',
+    )
+
+
+def read_models(db):
+    return {
+        name: sorted((repr({k: v for k, v in doc.items() if k not in ('_id', '_replay')}) for doc in db[name].find()))
+        for name in ('signal_rollups', 'houses')
+    }
+
+
+def test_hash_replay_keeps_house_lists_out_of_the_plan(mongo):
+    mongo()
+    store = MongoEventStore()
+    store.append_many([HouseRegistered(house_id=f"house-{h}", house_type='Daire', owner_name='o', area_sqm=80) for h in range(7)])
+    store.append_many([signal(i) for i in range(300)])
+    live = read_models(store.db)
+
+    replay_run = ReplayRun(store.db)
+    run = replay_run.start(store, None, 'hash', PARTITIONS, store.signal_format)
+    assert all('houses' not in spec for spec in run['partitions'])
+    for index in range(PARTITIONS):
+        houses = list(replay_run.partition_houses(index))
+        assert houses == sorted(houses)
+        assert all(house_partition(h, PARTITIONS) == index for h in houses)
+
+    # Partition 0 ilk batch'ini uygulayıp checkpoint'ini yazdıktan sonra yarıda kalır
+    projections = get_projections(run['projections'])
+    event_types = {t for p in projections for t in p.event_types}
+    reader = PartitionReader(store, run, run['partitions'][0], event_types, 20)
+    docs, position = next(iter(reader.batches()))
+    dispatch(store.db, docs, projections, guard=('_replay.p0', 1))
+    replay_run.save_checkpoint(0, position, 1, len(docs))
+
+    replayed = [replay_partition(index, 20)['events'] for index in range(PARTITIONS)]
+    assert sum(replayed) + len(docs) == 307
+    assert read_models(store.db) == live
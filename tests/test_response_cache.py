@@ -0,0 +1,64 @@
+import threading
+import time
+
+from wifi_app.infrastructure.cache import ResponseCache, approximate_size
+
+
+def test_waiters_recompute_after_invalidation_during_compute():
+    cache = ResponseCache(1 << 20, ttl=60, stale_ttl=0)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+            return 'old'
+        return 'new'
+
+    results = {}
+    leader = threading.Thread(target=lambda: results.setdefault('leader', cache.get_or_compute('k', compute)))
+    leader.start()
+    started.wait(5)
+    waiter = threading.Thread(target=lambda: results.setdefault('waiter', cache.get_or_compute('k', compute)))
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while cache.metrics()['coalesced'] == 0 and time.monotonic() < deadline:
+        time.sleep(0.001)
+    cache.invalidate('k')
+    release.set()
+    leader.join(5)
+    waiter.join(5)
+
+    assert results == {'leader': 'old', 'waiter': 'new'}
+    assert cache.get_or_compute('k', compute) == 'new'
+    assert len(calls) == 2
+
+
+def test_marked_values_expire_after_their_epoch(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('wifi_app.infrastructure.cache.time.time', lambda: now[0])
+    cache = ResponseCache(1 << 20, ttl=60, stale_ttl=0, mark_interval=5)
+    values = iter(range(10))
+
+    def compute():
+        return next(values)
+
+    assert cache.get_or_compute('k', compute, tag='t') == 0
+    cache.mark('t')
+    assert cache.get_or_compute('k', compute, tag='t') == 0
+    now[0] += 5
+    assert cache.get_or_compute('k', compute, tag='t') == 1
+    now[0] += 5
+    assert cache.get_or_compute('k', compute, tag='t') == 1
+
+
+def test_size_limit_uses_estimated_size():
+    cache = ResponseCache(3000, ttl=60, stale_ttl=0)
+    for i in range(10):
+        cache.get_or_compute(f"k{i}", lambda: {"rows": ["x" * 900]})
+    metrics = cache.metrics()
+    assert metrics['bytes'] <= 3000
+    assert metrics['evictions'] == 10 - metrics['entries']
+    assert approximate_size({"a": [1, "bc"]}) > 0